@@ -0,0 +1,59 @@
+"""Add keyset pagination indexes
+
+Revision ID: a8e5c1d93f40
+Revises: f7c3a9d2b614
+Create Date: 2026-10-18 17:21:36.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e5c1d93f40'
+down_revision: Union[str, Sequence[str], None] = 'f7c3a9d2b614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VISIBLE_INDEXES = {
+    'ix_jobs_visible_id': ['id'],
+    'ix_jobs_visible_platform_id': ['source_platform', 'id'],
+    'ix_jobs_visible_remote_id': ['is_remote', 'id'],
+}
+
+
+def _has_user_jobs() -> bool:
+    # user_jobs is created by the app at startup (create_all), not by an earlier revision
+    return sa.inspect(op.get_bind()).has_table('user_jobs')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in VISIBLE_INDEXES.items():
+        op.create_index(
+            name, 'jobs', columns, unique=False,
+            postgresql_where=sa.text('is_active AND canonical_job_id IS NULL'),
+            sqlite_where=sa.text('is_active = 1 AND canonical_job_id IS NULL'),
+        )
+    if _has_user_jobs():
+        # job_id joins the key so keyset pages seek within equal scores
+        op.drop_index('ix_user_jobs_user_score', table_name='user_jobs', if_exists=True)
+        op.create_index(
+            'ix_user_jobs_user_score', 'user_jobs',
+            ['user_id', sa.text('compatibility_score DESC'), sa.text('job_id DESC')], unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_user_jobs():
+        op.drop_index('ix_user_jobs_user_score', table_name='user_jobs', if_exists=True)
+        op.create_index(
+            'ix_user_jobs_user_score', 'user_jobs',
+            ['user_id', sa.text('compatibility_score DESC')], unique=False,
+        )
+    for name in VISIBLE_INDEXES:
+        op.drop_index(name, table_name='jobs', if_exists=True)
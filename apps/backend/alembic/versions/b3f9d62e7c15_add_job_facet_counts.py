@@ -0,0 +1,41 @@
+"""Add job facet counters
+
+Revision ID: b3f9d62e7c15
+Revises: a8e5c1d93f40
+Create Date: 2026-10-18 18:40:12.771930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.job_facet_count import FACET_DDL, FACET_DROP_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f9d62e7c15'
+down_revision: Union[str, Sequence[str], None] = 'a8e5c1d93f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'job_facet_counts',
+        sa.Column('source_platform', sa.String(length=50), nullable=False),
+        sa.Column('is_remote', sa.Boolean(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('source_platform', 'is_remote'),
+    )
+    # Triggers on jobs, then the initial count of the rows already there
+    for statement in FACET_DDL.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in FACET_DROP_DDL.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+    op.drop_table('job_facet_counts')
@@ -0,0 +1,57 @@
+"""Add job fingerprint
+
+Revision ID: b81f0c3d5a27
+Revises: e4b7c2a91f3d
+Create Date: 2026-10-18 11:02:17.530941
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.fingerprint import job_fingerprint
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f0c3d5a27'
+down_revision: Union[str, Sequence[str], None] = 'e4b7c2a91f3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('fingerprint', sa.BigInteger(), nullable=True))
+
+    # Backfill existing rows (the hash is computed in Python, not SQL)
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', sa.Integer), sa.column('fingerprint', sa.BigInteger),
+        sa.column('source_url', sa.Text), sa.column('title', sa.String),
+        sa.column('company', sa.String), sa.column('location', sa.String),
+    )
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(jobs.c.id, jobs.c.source_url, jobs.c.title, jobs.c.company, jobs.c.location)
+            .where(jobs.c.id > last_id).order_by(jobs.c.id).limit(BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('job_id')).values(fingerprint=sa.bindparam('fp')),
+            [{'job_id': r.id, 'fp': job_fingerprint(r.source_url, r.title, r.company, r.location)} for r in rows],
+        )
+        last_id = rows[-1].id
+
+    op.create_index(op.f('ix_jobs_fingerprint'), 'jobs', ['fingerprint'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_fingerprint'), table_name='jobs')
+    op.drop_column('jobs', 'fingerprint')
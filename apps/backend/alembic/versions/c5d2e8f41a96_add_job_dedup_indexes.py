@@ -0,0 +1,58 @@
+"""Add job dedup indexes
+
+Revision ID: c5d2e8f41a96
+Revises: b81f0c3d5a27
+Create Date: 2026-10-18 12:24:09.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.fingerprint import url_hash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d2e8f41a96'
+down_revision: Union[str, Sequence[str], None] = 'b81f0c3d5a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('source_url_hash', sa.BigInteger(), nullable=True))
+
+    # Backfill existing rows (the hash is computed in Python, not SQL)
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', sa.Integer), sa.column('source_url', sa.Text),
+        sa.column('source_url_hash', sa.BigInteger),
+    )
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(jobs.c.id, jobs.c.source_url)
+            .where(jobs.c.id > last_id).order_by(jobs.c.id).limit(BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('job_id')).values(source_url_hash=sa.bindparam('url_hash')),
+            [{'job_id': r.id, 'url_hash': url_hash(r.source_url)} for r in rows],
+        )
+        last_id = rows[-1].id
+
+    op.create_index(op.f('ix_jobs_source_url_hash'), 'jobs', ['source_url_hash'], unique=False)
+    op.create_index('ix_jobs_title_company', 'jobs', ['title', 'company'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_title_company', table_name='jobs')
+    op.drop_index(op.f('ix_jobs_source_url_hash'), table_name='jobs')
+    op.drop_column('jobs', 'source_url_hash')
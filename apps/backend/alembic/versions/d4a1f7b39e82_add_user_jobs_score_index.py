@@ -0,0 +1,40 @@
+"""Add user_jobs score index
+
+Revision ID: d4a1f7b39e82
+Revises: c5d2e8f41a96
+Create Date: 2026-10-18 13:05:41.287305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a1f7b39e82'
+down_revision: Union[str, Sequence[str], None] = 'c5d2e8f41a96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_user_jobs() -> bool:
+    # user_jobs is created by the app at startup (create_all), not by an earlier revision
+    return sa.inspect(op.get_bind()).has_table('user_jobs')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _has_user_jobs():
+        return
+    op.create_index(
+        'ix_user_jobs_user_score', 'user_jobs',
+        ['user_id', sa.text('compatibility_score DESC')], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _has_user_jobs():
+        return
+    op.drop_index('ix_user_jobs_user_score', table_name='user_jobs', if_exists=True)
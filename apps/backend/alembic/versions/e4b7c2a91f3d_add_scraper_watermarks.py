@@ -0,0 +1,41 @@
+"""Add scraper watermarks
+
+Revision ID: e4b7c2a91f3d
+Revises: d6e3a935734e
+Create Date: 2026-10-18 09:12:41.204113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c2a91f3d'
+down_revision: Union[str, Sequence[str], None] = 'd6e3a935734e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'scraper_watermarks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source', sa.String(length=100), nullable=False),
+        sa.Column('query', sa.String(length=255), nullable=False),
+        sa.Column('last_external_id', sa.String(length=255), nullable=True),
+        sa.Column('last_posted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('recent_ids', sa.Text(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('source', 'query', name='uq_scraper_watermark'),
+    )
+    op.create_index(op.f('ix_scraper_watermarks_id'), 'scraper_watermarks', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_scraper_watermarks_id'), table_name='scraper_watermarks')
+    op.drop_table('scraper_watermarks')
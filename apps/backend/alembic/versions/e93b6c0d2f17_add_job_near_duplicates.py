@@ -0,0 +1,55 @@
+"""Add job near-duplicate clustering
+
+Revision ID: e93b6c0d2f17
+Revises: d4a1f7b39e82
+Create Date: 2026-10-18 13:48:52.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e93b6c0d2f17'
+down_revision: Union[str, Sequence[str], None] = 'd4a1f7b39e82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are signed and clustered by scripts/backfill_near_duplicates.py
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('canonical_job_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('minhash', sa.LargeBinary(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_jobs_canonical_job_id', 'jobs', ['canonical_job_id'], ['id'], ondelete='SET NULL'
+        )
+        batch_op.create_index(batch_op.f('ix_jobs_canonical_job_id'), ['canonical_job_id'], unique=False)
+
+    op.create_table(
+        'job_lsh_buckets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('band', sa.SmallInteger(), nullable=False),
+        sa.Column('bucket', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_job_lsh_buckets_job_id'), 'job_lsh_buckets', ['job_id'], unique=False)
+    op.create_index('ix_job_lsh_buckets_band_bucket', 'job_lsh_buckets', ['band', 'bucket'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_lsh_buckets_band_bucket', table_name='job_lsh_buckets')
+    op.drop_index(op.f('ix_job_lsh_buckets_job_id'), table_name='job_lsh_buckets')
+    op.drop_table('job_lsh_buckets')
+
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_jobs_canonical_job_id'))
+        batch_op.drop_constraint('fk_jobs_canonical_job_id', type_='foreignkey')
+        batch_op.drop_column('minhash')
+        batch_op.drop_column('canonical_job_id')
@@ -0,0 +1,76 @@
+"""Add full-text search index for jobs
+
+Revision ID: f7c3a9d2b614
+Revises: e93b6c0d2f17
+Create Date: 2026-10-18 16:02:11.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3a9d2b614'
+down_revision: Union[str, Sequence[str], None] = 'e93b6c0d2f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FTS_COLUMNS = "title, company, description, location"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Generated column: filled for existing rows by the ALTER, maintained by PostgreSQL afterwards
+        op.execute("""
+            ALTER TABLE jobs ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('portuguese'::regconfig, coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('portuguese'::regconfig, coalesce(company, '')), 'B') ||
+                setweight(to_tsvector('portuguese'::regconfig, coalesce(description, '')), 'C') ||
+                setweight(to_tsvector('portuguese'::regconfig, coalesce(location, '')), 'D')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX ix_jobs_search_vector ON jobs USING GIN (search_vector)")
+    elif dialect == 'sqlite':
+        op.execute(f"""
+            CREATE VIRTUAL TABLE jobs_fts USING fts5(
+                {FTS_COLUMNS}, content='jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts (rowid, {FTS_COLUMNS})
+                VALUES (new.id, new.title, new.company, new.description, new.location);
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, {FTS_COLUMNS})
+                VALUES ('delete', old.id, old.title, old.company, old.description, old.location);
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER jobs_fts_au AFTER UPDATE OF {FTS_COLUMNS} ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, {FTS_COLUMNS})
+                VALUES ('delete', old.id, old.title, old.company, old.description, old.location);
+                INSERT INTO jobs_fts (rowid, {FTS_COLUMNS})
+                VALUES (new.id, new.title, new.company, new.description, new.location);
+            END
+        """)
+        # Index the rows already in jobs
+        op.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_jobs_search_vector")
+        op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        for trigger in ('jobs_fts_au', 'jobs_fts_ad', 'jobs_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS jobs_fts")
@@ -34,9 +34,13 @@ async def analyze_jobs_batch(
     from app.services.job_service import JobService
     from app.services.job_ai_analyzer import JobAIAnalyzer
 
-    # 1. Buscar vagas com os scrapers
+    from app.core.config import settings
+
+    # 1. Buscar vagas com os scrapers (dentro do prazo: scrapers lentos devolvem o que já coletaram)
     job_service = JobService(db)
-    saved_jobs = await job_service.search_and_save_jobs(query=query, limit=max_vagas * 2)
+    saved_jobs = await job_service.search_and_save_jobs(
+        query=query, limit=max_vagas * 2, deadline_seconds=settings.SEARCH_DEADLINE_SECONDS
+    )
 
     if not saved_jobs:
         return {"total": 0, "analyzed": 0, "vagas": []}
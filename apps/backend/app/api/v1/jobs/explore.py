@@ -1,20 +1,29 @@
 """
 Jobs Explore Endpoint - Browse all raw jobs in the database.
-Provides full-text search, platform filtering, remote filtering, and pagination.
+Provides hybrid (text + semantic) search, platform filtering, remote filtering, and pagination.
 No authentication required for the explore view (public job board).
 """
+import hashlib
+import json
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, or_, case, Integer, cast
+from sqlalchemy import select
 
 from app import schemas
 from app.api import deps
+from app.core.cursor import decode_cursor, encode_cursor
+from app.crud import job_facet as crud_job_facet
 from app.models.job import Job as JobModel
+from app.services.hybrid_search import hybrid_search, visibility_filters
 
 router = APIRouter()
 
 
+def _search_digest(q: str, platform: Optional[str], remote_only: bool) -> str:
+    return hashlib.sha1(json.dumps([q, platform, remote_only]).encode()).hexdigest()[:12]
+
+
 @router.get("/explore")
 async def explore_jobs(
     db: AsyncSession = Depends(deps.get_db),
@@ -23,79 +32,70 @@ async def explore_jobs(
     remote_only: bool = Query(False, description="Only show remote jobs"),
     limit: int = Query(30, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (replaces offset)"),
 ) -> Any:
     """
     Explore all raw jobs in the database with search and filters.
-    Returns jobs sorted by relevance (if search query) or newest first.
+    With a search query, jobs are ranked by hybrid lexical + semantic relevance
+    (app/services/hybrid_search.py); otherwise newest first.
     Also returns aggregated stats (total count, platform breakdown).
+    `next_cursor` continues after the last job returned (keyset pagination).
     """
-    # Base query
-    base_q = select(JobModel).where(JobModel.is_active == True)
-
-    # Platform filter
-    if platform and platform.strip():
-        base_q = base_q.where(JobModel.source_platform == platform.strip())
-
-    # Remote filter
-    if remote_only:
-        base_q = base_q.where(JobModel.is_remote == True)
+    platform = platform.strip() if platform and platform.strip() else None
+    searching = bool(q and q.strip())
+    after = semantic = None
+    if cursor:
+        try:
+            if searching:
+                # Fused scores move between requests, so a search cursor holds a rank position
+                # plus how page one was ranked, and only replays on the same query and filters
+                served, digest, semantic = decode_cursor(cursor, "explore_search", 3)
+                if digest != _search_digest(q.strip(), platform, remote_only):
+                    raise ValueError("Cursor belongs to another search")
+                offset, semantic = int(served), bool(semantic)
+            else:
+                (after,) = decode_cursor(cursor, "explore", 1)
+                after, offset = int(after), 0
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    # Text search with relevance scoring
-    if q and q.strip():
-        search_term = f"%{q.strip()}%"
-        base_q = base_q.where(
-            or_(
-                JobModel.title.ilike(search_term),
-                JobModel.company.ilike(search_term),
-                JobModel.description.ilike(search_term),
-                JobModel.location.ilike(search_term),
-            )
+    next_cursor = None
+    if searching:
+        # Lexical and vector retrieval fused by rank; only the page's rows are loaded
+        page = await hybrid_search.search(
+            db, q.strip(),
+            platform=platform,
+            remote_only=remote_only,
+            limit=limit,
+            offset=offset,
+            semantic=semantic,
         )
-        # Order by title match first (more relevant), then by id desc
-        relevance = case(
-            (JobModel.title.ilike(search_term), 3),
-            (JobModel.company.ilike(search_term), 2),
-            else_=1
-        ).label("relevance")
-        # Add relevance column to query for ordering
-        jobs_q = base_q.add_columns(relevance).order_by(desc(relevance), JobModel.id.desc())
+        jobs = page.jobs
+        total_count = page.total
+        if page.has_more:
+            next_cursor = encode_cursor(
+                "explore_search", offset + limit, _search_digest(q.strip(), platform, remote_only), page.semantic_used,
+            )
     else:
-        jobs_q = base_q.order_by(JobModel.id.desc())
-
-    # Get total count (before pagination)
-    count_q = select(func.count()).select_from(base_q.subquery())
-    total_result = await db.execute(count_q)
-    total_count = total_result.scalar() or 0
-
-    # Apply pagination
-    jobs_q = jobs_q.offset(offset).limit(limit)
-    result = await db.execute(jobs_q)
+        # One card per vacancy (cross-posts point at a canonical job), platform / remote filters
+        base_q = select(JobModel).where(*visibility_filters(platform, remote_only))
 
-    # Extract Job objects (handling both plain scalars and tuples from add_columns)
-    if q and q.strip():
-        jobs = [row[0] for row in result]
-    else:
+        # Newest first: seek past the cursor's id (or skip `offset` rows), one extra row tells if more follow
+        page_q = base_q.order_by(JobModel.id.desc())
+        page_q = page_q.where(JobModel.id < after) if after is not None else page_q.offset(offset)
+        result = await db.execute(page_q.limit(limit + 1))
         jobs = result.scalars().all()
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor("explore", jobs[-1].id)
 
-    # Get platform breakdown (for filter badges)
-    platform_q = (
-        select(
-            JobModel.source_platform,
-            func.count(JobModel.id).label("count")
-        )
-        .where(JobModel.is_active == True)
-        .group_by(JobModel.source_platform)
-        .order_by(desc("count"))
-    )
-    platform_result = await db.execute(platform_q)
-    platforms = [{"name": row[0], "count": row[1]} for row in platform_result]
-
-    # Get remote count
-    remote_q = select(func.count(JobModel.id)).where(
-        JobModel.is_active == True, JobModel.is_remote == True
-    )
-    remote_result = await db.execute(remote_q)
-    remote_count = remote_result.scalar() or 0
+    # Platform breakdown (for filter badges), remote count and the browse total,
+    # from the trigger-maintained counters instead of counting jobs
+    facets = await crud_job_facet.get(db, platform=platform, remote_only=remote_only)
+    if not searching:
+        total_count = facets.total
+    platforms = facets.platforms
+    remote_count = facets.remote_count
 
     # Serialize jobs using the schema
     serialized_jobs = []
@@ -131,7 +131,8 @@ async def explore_jobs(
         "total": total_count,
         "offset": offset,
         "limit": limit,
-        "has_more": offset + limit < total_count,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
         "platforms": platforms,
         "remote_count": remote_count,
     }
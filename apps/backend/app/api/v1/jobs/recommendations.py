@@ -1,26 +1,68 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
 from app.api import deps
+from app.core.cursor import decode_cursor, encode_cursor
 
 router = APIRouter()
 
+
+def _seek(cursor: Optional[str]):
+    """(kind, score, id) after which the page starts, or None for the first page."""
+    if not cursor:
+        return None
+    for kind in ("recommended", "match"):
+        try:
+            score, last_id = decode_cursor(cursor, kind, 2)
+            return kind, (None if score is None else float(score)), int(last_id)
+        except (TypeError, ValueError):
+            continue
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _card_keys(row) -> set:
+    """Vacancy (canonical job) and title+company of a (Job, score) row."""
+    j = row[0]
+    return {j.canonical_job_id or j.id, f"{str(j.title or '').lower()}|{str(j.company or '').lower()}"}
+
+
+def _dedup_page(rows, keys_of, limit: int, fetched_all: bool):
+    """
+    First `limit` rows with no key seen before, and the row to continue after
+    (None at the end). Duplicates up to the next fresh row are consumed too.
+    """
+    page, seen, last = [], set(), None
+    for row in rows:
+        keys = keys_of(row)
+        if not keys & seen:
+            if len(page) == limit:
+                return page, last
+            seen |= keys
+            page.append(row)
+        last = row
+    return page, (None if fetched_all else last)
+
+
 @router.get("/recommended", response_model=List[schemas.JobResponse])
 async def get_recommended_jobs(
     db: AsyncSession = Depends(deps.get_db),
     query: str = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    response: Response = None,
     current_user = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Get top recommended jobs for the current user.
     Queries the user_jobs table for pre-computed per-user scores.
     Falls back to in-memory scoring if no scored entries exist yet.
+    Pass the previous page's X-Next-Cursor header as `cursor` to continue.
     """
-    from sqlalchemy import select, desc
+    from sqlalchemy import select, desc, or_, tuple_
+    from app.crud import job_search
     from app.models.user_job import UserJob
     from app.models.job import Job as JobModel
 
@@ -31,47 +73,53 @@ async def get_recommended_jobs(
     query_builder = select(JobModel).join(UserJob, UserJob.job_id == JobModel.id).where(UserJob.user_id == current_user.id)
     
     if query and query.strip():
-        search_term = f"%{query.strip()}%"
-        # We use ilike to make it case-insensitive
-        query_builder = query_builder.where(
-            (JobModel.title.ilike(search_term)) | 
-            (JobModel.description.ilike(search_term)) |
-            (JobModel.company.ilike(search_term))
-        )
+        # Full-text index (tsvector on PostgreSQL, FTS5 on SQLite)
+        query_builder, _ = job_search.match(query_builder, job_search.dialect_of(db), query.strip())
         
+    # Keyset seek along ix_user_jobs_user_score: (score DESC NULLS LAST, job_id DESC)
+    after = _seek(cursor)
+    if after is not None and after[0] == "recommended":
+        _, after_score, after_id = after
+        if after_score is None:
+            query_builder = query_builder.where(UserJob.compatibility_score.is_(None), UserJob.job_id < after_id)
+        else:
+            query_builder = query_builder.where(or_(
+                tuple_(UserJob.compatibility_score, UserJob.job_id) < tuple_(after_score, after_id),
+                UserJob.compatibility_score.is_(None),
+            ))
+    elif after is None:
+        query_builder = query_builder.offset(offset)
+
     stmt = (
         query_builder
-        .order_by(UserJob.compatibility_score.desc().nullslast(), JobModel.id.desc())
-        .offset(offset)
+        .add_columns(UserJob.compatibility_score)
+        .order_by(UserJob.compatibility_score.desc().nullslast(), UserJob.job_id.desc())
         # Fetch a bit more than limit in case we need to dedup same title/company combos downstream
         .limit(limit * 3)
     )
-    result = await db.execute(stmt)
-    db_scored_jobs = result.scalars().all()
+    # A "match" cursor continues the fallback listing below
+    db_scored_rows = [] if after is not None and after[0] == "match" else (await db.execute(stmt)).all()
 
-    if db_scored_jobs:
+    if db_scored_rows or (after is not None and after[0] == "recommended"):
         # Attach the per-user score to the job object for the response
-        score_map_stmt = select(UserJob).where(UserJob.user_id == current_user.id)
-        score_map_result = await db.execute(score_map_stmt)
-        score_map = {uj.job_id: uj.compatibility_score for uj in score_map_result.scalars().all()}
+        for j, score in db_scored_rows:
+            j.compatibility_score = score
 
-        for j in db_scored_jobs:
-            j.compatibility_score = score_map.get(j.id)
-
-        # Dedup by title+company
-        unique_jobs = []
-        seen = set()
-        for j in db_scored_jobs:
-            key = f"{str(j.title or '').lower()}|{str(j.company or '').lower()}"
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(j)
+        # Dedup by vacancy (canonical job) and by title+company
+        unique_rows, last = _dedup_page(
+            db_scored_rows,
+            _card_keys,
+            limit,
+            fetched_all=len(db_scored_rows) < limit * 3,
+        )
+        if last is not None and response is not None:
+            response.headers["X-Next-Cursor"] = encode_cursor("recommended", last[1], last[0].id)
 
-        return unique_jobs[:limit]
+        return [j for j, _ in unique_rows]
 
     # --- Fallback: Advanced SQL Match ---
     # We will build a dynamic scoring query based on user preferences.
-    from sqlalchemy import case, cast, Integer
+    from sqlalchemy import cast, Integer
     import json
     
     # 1. Obter perfil do usuário
@@ -95,49 +143,33 @@ async def get_recommended_jobs(
         
     search_terms = [t.lower() for t in titles + techs if t and t.strip()]
     
-    dialect = db.bind.dialect.name if db.bind else "postgresql"
-    
-    if dialect == "postgresql" and search_terms:
-        # PostgreSQL Advanced tsvector Match
-        from sqlalchemy import func, text
-        
-        # Monta a tsquery: 'python | react | node'
-        query_string = " | ".join([t.replace(" ", " & ") for t in search_terms])
-        
-        # tsvector column or cast
-        ts_vector = func.to_tsvector('portuguese', func.coalesce(JobModel.title, '') + ' ' + func.coalesce(JobModel.description, ''))
-        ts_query = func.to_tsquery('portuguese', query_string)
-        
-        rank = func.ts_rank(ts_vector, ts_query).label('match_score')
-        
-        fallback_query = select(JobModel, rank).where(
-            ts_vector.op('@@')(ts_query)
-        ).order_by(desc('match_score')).limit(limit)
-        
+    if search_terms:
+        # Any of the profile's terms, ranked by the full-text index
+        fallback_query, match_score = job_search.match(select(JobModel), job_search.dialect_of(db), search_terms)
+        fallback_query = (
+            fallback_query.add_columns(match_score.label('match_score'))
+            .order_by(desc('match_score'), JobModel.id.desc())
+        )
     else:
-        # SQLite / Generic Fallback: Match heuristic using multiple ilike score cases
-        score_cases = []
-        for term in search_terms:
-            like_term = f"%{term}%"
-            # 3 points for title match, 1 point for description match
-            score_cases.append(
-                case((JobModel.title.ilike(like_term), 3), else_=0) +
-                case((JobModel.description.ilike(like_term), 1), else_=0)
-            )
-            
-        if score_cases:
-            combined_score = sum(score_cases).label('match_score')
-            fallback_query = select(JobModel, combined_score).where(
-                combined_score > 0
-            ).order_by(desc('match_score')).limit(limit)
-        else:
-            fallback_query = select(JobModel, cast(0, Integer).label('match_score')).order_by(JobModel.id.desc()).limit(limit)
+        match_score = cast(0, Integer)
+        fallback_query = select(JobModel, match_score.label('match_score')).order_by(JobModel.id.desc())
+
+    # Canonical jobs only: cross-posts of the same vacancy would repeat the card
+    fallback_query = fallback_query.where(JobModel.canonical_job_id.is_(None))
+    if after is not None:
+        _, after_score, after_id = after
+        fallback_query = fallback_query.where(tuple_(match_score, JobModel.id) < tuple_(after_score or 0, after_id))
+    # One extra row tells if another page follows
+    result = await db.execute(fallback_query.limit(limit + 1))
+    rows = result.all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if response is not None:
+            response.headers["X-Next-Cursor"] = encode_cursor("match", float(rows[-1][1] or 0), rows[-1][0].id)
 
-    result = await db.execute(fallback_query)
-    
     unique_jobs = []
     seen = set()
-    for row in result:
+    for row in rows:
         # Result may contain (Job, match_score) tuple from our custom selects
         try:
             # SQLAlchemy Rows are tuple-like. We selected (JobModel, score)
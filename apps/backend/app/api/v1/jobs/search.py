@@ -1,9 +1,10 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
 from app.api import deps
+from app.core.cursor import decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -13,28 +14,38 @@ async def search_jobs(
     db: AsyncSession = Depends(deps.get_db),
     query: str = "",
     limit: int = 100,
+    cursor: Optional[str] = None,
+    response: Response,
     current_user = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Search jobs directly from the PostgreSQL database (Serving Layer).
     No background scraping is triggered here anymore.
+    Pass the previous page's X-Next-Cursor header as `cursor` to continue.
     """
     from sqlalchemy import select
+    from app.crud import job_search
     from app.models.job import Job as JobModel
     
-    stmt = select(JobModel)
+    stmt = select(JobModel).where(JobModel.canonical_job_id.is_(None))
     
     if query and query.strip():
-        search_term = f"%{query.strip()}%"
-        stmt = stmt.where(
-            (JobModel.title.ilike(search_term)) | 
-            (JobModel.description.ilike(search_term)) |
-            (JobModel.company.ilike(search_term))
-        )
+        # Full-text index (tsvector on PostgreSQL, FTS5 on SQLite)
+        stmt, _ = job_search.match(stmt, job_search.dialect_of(db), query.strip())
         
-    # Order by newest first
-    stmt = stmt.order_by(JobModel.id.desc()).limit(limit)
+    if cursor:
+        try:
+            (last_id,) = decode_cursor(cursor, "search", 1)
+            stmt = stmt.where(JobModel.id < int(last_id))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Order by newest first; one extra row tells if another page follows
+    stmt = stmt.order_by(JobModel.id.desc()).limit(limit + 1)
     result = await db.execute(stmt)
     jobs = result.scalars().all()
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor("search", jobs[-1].id)
     
     return jobs
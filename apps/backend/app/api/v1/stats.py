@@ -8,6 +8,8 @@ from app.models.user import User
 from app.models.job import Job
 from app.models.resume import Resume
 from app.models.application import Application
+from app.services.jobsearch.health import scraper_health
+from app.services.jobsearch.pipeline import ingestion_stats
 
 router = APIRouter()
 
@@ -56,3 +58,48 @@ async def get_stats(
         "my_resumes_analyzed": resumes_analyzed,
         "my_applications": total_applications
     }
+
+
+@router.get("/scrapers", response_model=Dict[str, Any])
+async def get_scraper_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    Circuit breaker state and latency (p50/p95) for each scraper that has run
+    in this process.
+    """
+    return {"scrapers": scraper_health.snapshot()}
+
+
+@router.get("/pipeline", response_model=Dict[str, Any])
+async def get_pipeline_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    Per-stage throughput, errors and queue depth of the last run of each
+    ingestion pipeline in this process.
+    """
+    return {"pipelines": ingestion_stats.snapshot()}
+
+
+@router.get("/embeddings", response_model=Dict[str, Any])
+async def get_embedding_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    Batching and cache hit-rate counters of the shared embedding engine.
+    """
+    from app.services.embedding_service import embedding_engine
+    return {"embeddings": embedding_engine.stats()}
+
+
+@router.get("/vectors", response_model=Dict[str, Any])
+async def get_vector_writer_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    Queue depth, flush latency (p50/p95) and retry/drop counters of the
+    write-behind vector writer.
+    """
+    from app.services.vector_writer import vector_writer
+    return {"vectors": vector_writer.stats()}
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any
 from functools import lru_cache
 
 
@@ -61,6 +61,13 @@ class Settings(BaseSettings):
     # Scrapers
     SCRAPER_PROXY_URL: Optional[str] = None
     ENABLE_JOBSPY: bool = True
+
+    # Scraper HTTP connection pool (shared, per host)
+    SCRAPER_HTTP2: bool = True
+    SCRAPER_MAX_CONNECTIONS_PER_HOST: int = 10
+    SCRAPER_MAX_KEEPALIVE_PER_HOST: int = 5
+    SCRAPER_KEEPALIVE_EXPIRY: float = 30.0
+    SCRAPER_HOST_POOL_SIZES: Dict[str, int] = {}  # e.g. {"www.catho.com.br": 2}
     
     # AI Search AI Scrapers (Tavily, Firecrawl, Exa)
     TAVILY_API_KEY: Optional[str] = None
@@ -83,14 +90,67 @@ class Settings(BaseSettings):
     
     # Job Scraping
     MAX_JOBS_PER_SEARCH: int = 50
-    SCRAPER_RATE_LIMIT_DELAY: int = 2
-    CACHE_TTL_HOURS: int = 24
+    SCRAPER_RATE_LIMIT_DELAY: int = 2  # default seconds between requests to a host without a budget
+    SCRAPER_RATE_LIMITS: Dict[str, float] = {  # per-host budgets in requests/second
+        "portal.api.gupy.io": 5.0,
+        "remoteok.com": 1.0,
+        "api.adzuna.com": 5.0,
+        "weworkremotely.com": 2.0,
+        "api-vagas.catho.com.br": 0.5,
+        "www.catho.com.br": 0.5,
+        "www.vagas.com.br": 0.5,
+    }
+    SCRAPER_RATE_LIMIT_BURST: int = 2
+    SCRAPER_RATE_LIMIT_RECOVERY_SUCCESSES: int = 10
+    CACHE_TTL_HOURS: int = 24  # max retention of cached scraper responses (validators kept for revalidation)
+    SCRAPER_CACHE_ENABLED: bool = True
+    SCRAPER_CACHE_DIR: str = "./data/http_cache"
+    SCRAPER_CACHE_PURGE_INTERVAL_SECONDS: float = 3600.0  # how often writes trigger a sweep of expired entries
+    SCRAPER_WATERMARK_MAX_IDS: int = 500  # recent external_ids remembered per (scraper, query)
+    SEARCH_DEADLINE_SECONDS: float = 20.0  # overall budget for interactive scraper fan-outs (analyze-batch)
+    SCRAPER_PARSE_WORKERS: int = 2  # processes parsing scraper HTML (0 = parse in a thread instead)
+    SCRAPER_PARSE_INLINE_BYTES: int = 20_000  # smaller pages are parsed inline on the event loop
+    # Per-scraper circuit breaker
+    SCRAPER_BREAKER_WINDOW: int = 20            # recent calls considered
+    SCRAPER_BREAKER_FAILURE_RATE: float = 0.5   # open when failures/timeouts reach this share
+    SCRAPER_BREAKER_MIN_CALLS: int = 4
+    SCRAPER_BREAKER_OPEN_SECONDS: float = 60.0  # doubled after each failed probe
+    SCRAPER_BREAKER_MAX_OPEN_SECONDS: float = 900.0
+    # Gemini embeddings (app/services/embedding_service.py)
+    EMBEDDING_BATCH_SIZE: int = 100        # texts per embed_content request (Gemini's batch limit)
+    EMBEDDING_BATCH_WAIT_MS: float = 50.0  # how long the first queued text waits for company
+    EMBEDDING_MAX_CONCURRENCY: int = 4     # batched requests in flight
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "./data/embedding_cache.sqlite3"
+    EMBEDDING_CACHE_MAX_ITEMS: int = 200_000   # vectors kept on disk (least recently used evicted)
+    EMBEDDING_CACHE_MEMORY_ITEMS: int = 2048   # vectors kept in memory (hot queries)
+    # Staged ingestion pipeline (app/services/jobsearch/pipeline.py)
+    INGEST_QUEUE_SIZE: int = 8      # micro-batches buffered between two stages
+    INGEST_EMBED_WORKERS: int = 4   # concurrent embedding batches
+    # Coalescing of identical concurrent scraper searches
+    SEARCH_COALESCE_BACKEND: str = "memory"  # "memory" (per process) or "redis" (shared via REDIS_URL)
+    SEARCH_COALESCE_MEMO_SECONDS: float = 60.0
+    SEARCH_COALESCE_LOCK_SECONDS: float = 30.0
     
     # Pinecone Vector DB
     PINECONE_API_KEY: Optional[str] = None
     PINECONE_KEY: Optional[str] = None
     PINECONE_INDEX_NAME: str = "job-hunter-ai"
     PINECONE_ENV: str = "us-east-1"  # Optional, depending on Pinecone version
+    # Vector store (app/services/vector_store.py)
+    VECTOR_BACKEND: str = "auto"  # "pinecone", "local" (NumPy index on disk) or "auto" (Pinecone if a key is set)
+    VECTOR_LOCAL_DIR: str = "./data/vectors"
+    VECTOR_IVF_THRESHOLD: int = 50_000  # below this many vectors the local index searches exhaustively
+    VECTOR_IVF_NPROBE: int = 8          # IVF lists scanned per query
+    # Write-behind vector upserts (app/services/vector_writer.py)
+    VECTOR_WRITE_BATCH_SIZE: int = 100       # vectors per upsert request
+    VECTOR_WRITE_FLUSH_SECONDS: float = 1.0  # a partial batch waits at most this long
+    VECTOR_WRITE_MAX_RETRIES: int = 5        # attempts before a vector is dropped
+    VECTOR_WRITE_MAX_QUEUE: int = 50_000     # queued vectors kept (oldest dropped beyond)
+    # Hybrid lexical + semantic ranking for /jobs/explore (app/services/hybrid_search.py)
+    HYBRID_CANDIDATES: int = 200                   # ids taken from each retriever before fusion
+    HYBRID_RRF_K: int = 60                         # reciprocal-rank fusion constant
+    HYBRID_SEMANTIC_TIMEOUT_SECONDS: float = 0.25  # extra wait for the vector side after the lexical one
     
     # Agent Settings
     AGENT_MAX_ITERATIONS: int = 100
@@ -0,0 +1,35 @@
+"""
+Opaque keyset-pagination cursors.
+
+A cursor carries the sort key of the last row a client received, e.g.
+("explore", job_id) or ("recommended", score, job_id), so the next page is a seek
+(`WHERE (score, id) < (:s, :id)`) instead of an OFFSET whose cost grows with
+the page number. The kind tag keeps a cursor from being replayed against a
+different ordering. Rankings recomputed per request (hybrid search) carry a
+rank position instead, see app/api/v1/jobs/explore.py. Tokens are URL-safe base64 of compact JSON; they are not
+signed, a tampered token only moves the client's own position.
+"""
+import base64
+import json
+from typing import Any, List
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(kind: str, *values: Any) -> str:
+    raw = json.dumps([kind, *values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, kind: str, arity: int) -> List[Any]:
+    """The `arity` sort values of a cursor made by encode_cursor(kind, ...)."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Malformed cursor") from e
+    if not isinstance(payload, list) or len(payload) != arity + 1 or payload[0] != kind:
+        raise InvalidCursor("Cursor does not belong to this listing")
+    return payload[1:]
@@ -0,0 +1,89 @@
+"""
+Stable, content-addressed job fingerprints.
+
+Python's builtin hash() is salted per process, so ids built from it change on
+every restart (and differ between worker processes). Everything here uses
+blake2b instead and depends only on the stdlib, so the Scrapy project and the
+ETL worker can import it without the app's dependencies.
+
+  - canonical_url():   lower-cased host without "www.", no fragment, tracking
+                       params dropped, remaining params sorted, no trailing "/".
+  - job_fingerprint(): signed 64-bit int (fits a BIGINT column) of the canonical
+                       URL, title, company and location.
+  - url_hash():        the same kind of int for the canonical URL alone.
+  - stable_hash():     16-hex-char digest for building external ids.
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query params that identify the visit, not the job
+_TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "ref", "refid", "src", "trk", "trackingid", "position", "pagenum",
+}
+_SEPARATOR = "\x1f"
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def canonical_url(url: Optional[str]) -> str:
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parts = urlsplit(url if "://" in url else f"https://{url}")
+    except ValueError:
+        return url.lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=False)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lower-cased, accent-free words separated by single spaces."""
+    if not value:
+        return ""
+    value = unicodedata.normalize("NFKD", str(value))
+    value = "".join(ch for ch in value if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", value.lower()).strip()
+
+
+def _digest(*parts: str) -> bytes:
+    return hashlib.blake2b(_SEPARATOR.join(parts).encode("utf-8"), digest_size=8).digest()
+
+
+def job_fingerprint(
+    url: Optional[str] = None,
+    title: Optional[str] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+) -> int:
+    return stable_int64(canonical_url(url), normalize_text(title), normalize_text(company), normalize_text(location))
+
+
+def url_hash(url: Optional[str]) -> Optional[int]:
+    """Signed 64-bit hash of the canonical URL (None without a URL)."""
+    canonical = canonical_url(url)
+    if not canonical:
+        return None
+    return stable_int64(canonical)
+
+
+def stable_hash(*parts: Optional[str]) -> str:
+    """Deterministic short id for `parts` (URLs are canonicalised first)."""
+    normalized = [canonical_url(p) if p and "://" in p else (p or "") for p in parts]
+    return _digest(*normalized).hex()
+
+
+def stable_int64(*parts: str) -> int:
+    """Signed 64-bit hash of `parts` as given (no normalisation); fits a BIGINT column."""
+    return int.from_bytes(_digest(*parts), "big", signed=True)
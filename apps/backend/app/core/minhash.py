@@ -0,0 +1,78 @@
+"""
+MinHash signatures and LSH band buckets for near-duplicate job detection.
+
+The same vacancy posted on several boards differs in title wording, company
+string ("Acme" / "ACME Ltda.") and description boilerplate, so exact keys miss
+it. Instead each job gets a NUM_PERM-value MinHash signature of its normalised
+title + company + description character shingles:
+
+  - signature():    uint32 array; the fraction of equal positions between two
+                    signatures estimates the Jaccard similarity of the texts.
+  - band_buckets(): one signed 64-bit bucket per band of ROWS_PER_BAND values.
+                    Jobs sharing any bucket are candidates; with 16 bands of 4
+                    rows a pair at 0.8 similarity collides ~99.9% of the time,
+                    a pair at 0.3 only ~12%.
+  - similarity():   estimated Jaccard similarity of two signatures.
+
+Hashes are seeded constants (crc32 + multiply-shift), so signatures stored in
+the DB stay comparable across processes and restarts.
+"""
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.fingerprint import normalize_text, stable_int64
+
+NUM_PERM = 64
+ROWS_PER_BAND = 4
+BANDS = NUM_PERM // ROWS_PER_BAND
+SHINGLE_SIZE = 5
+MAX_TEXT_CHARS = 3000  # descriptions past this point are mostly boilerplate
+
+_rng = np.random.default_rng(0x6A0B5)
+_MUL = _rng.integers(1, 2**63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)  # odd multipliers
+_ADD = _rng.integers(0, 2**63, size=NUM_PERM, dtype=np.uint64)
+
+
+def job_text(title: Optional[str], company: Optional[str], description: Optional[str]) -> str:
+    return normalize_text(f"{title or ''} {company or ''} {(description or '')[:MAX_TEXT_CHARS]}")
+
+
+def shingles(text: str) -> np.ndarray:
+    """crc32 of every SHINGLE_SIZE-char window of `text` (already normalised)."""
+    if len(text) <= SHINGLE_SIZE:
+        windows = {text}
+    else:
+        windows = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(w.encode("utf-8")) for w in windows), dtype=np.uint64, count=len(windows))
+
+
+def signature(text: str) -> np.ndarray:
+    """MinHash signature (NUM_PERM uint32 values) of a normalised text."""
+    values = shingles(text)
+    # (a * x + b) mod 2^64, keep the high 32 bits: one hash function per column
+    with np.errstate(over="ignore"):
+        hashed = (values[:, None] * _MUL[None, :] + _ADD[None, :]) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def band_buckets(sig: np.ndarray) -> List[int]:
+    """One signed 64-bit bucket per band (the band index is part of the hash)."""
+    bands = sig.reshape(BANDS, ROWS_PER_BAND)
+    return [
+        stable_int64(str(band), bands[band].tobytes().hex())
+        for band in range(BANDS)
+    ]
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+def to_bytes(sig: np.ndarray) -> bytes:
+    return sig.astype("<u4").tobytes()
+
+
+def from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<u4")
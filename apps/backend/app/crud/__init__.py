@@ -2,3 +2,5 @@ from app.crud.user import user
 from app.crud.job import job
 from app.crud.resume import resume
 from app.crud.user_job import user_job
+from app.crud.scraper_watermark import scraper_watermark
+from app.crud.job_facet import job_facet
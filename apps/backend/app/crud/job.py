@@ -1,12 +1,30 @@
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.models.job import Job
 from app.schemas.job import JobCreate, JobUpdate
 
+# Scraped fields refreshed when a job is seen again; AI analysis and user flags are kept
+UPSERT_UPDATE_COLUMNS = (
+    "title", "company", "description", "location", "is_remote",
+    "salary_min", "salary_max", "salary_currency", "source_url", "source_url_hash", "fingerprint",
+)
+
+
+class UpsertedJob(NamedTuple):
+    id: int
+    external_id: str
+    inserted: bool
+
+
 class CRUDJob:
+    UPSERT_CHUNK_SIZE = 500  # rows per statement (SQLite caps bound parameters)
+    LOOKUP_CHUNK_SIZE = 500  # keys per IN (...) list
+
     async def get(self, db: AsyncSession, id: int) -> Optional[Job]:
         result = await db.execute(select(Job).filter(Job.id == id))
         return result.scalars().first()
@@ -15,6 +33,49 @@ class CRUDJob:
         result = await db.execute(select(Job).filter(Job.external_id == external_id))
         return result.scalars().first()
 
+    async def find_existing(self, db: AsyncSession, rows: List[dict]) -> List[Optional[Job]]:
+        """
+        For each candidate row, the stored Job it duplicates: same external_id,
+        else same fingerprint, else same source_url_hash, else same (title, company);
+        None when new. One query per key type, whatever the batch size (up to
+        LOOKUP_CHUNK_SIZE keys).
+        """
+        external_ids = {r["external_id"] for r in rows if r.get("external_id")}
+        fingerprints = {r["fingerprint"] for r in rows if r.get("fingerprint") is not None}
+        url_hashes = {r["source_url_hash"] for r in rows if r.get("source_url_hash") is not None}
+        names = {(r["title"], r["company"]) for r in rows if r.get("title") and r.get("company")}
+
+        by_external_id = {
+            j.external_id: j for j in await self._find_in(db, Job.external_id, external_ids)
+        }
+        by_fingerprint: Dict[int, Job] = {}
+        for j in await self._find_in(db, Job.fingerprint, fingerprints):
+            by_fingerprint.setdefault(j.fingerprint, j)
+        by_url_hash: Dict[int, Job] = {}
+        for j in await self._find_in(db, Job.source_url_hash, url_hashes):
+            by_url_hash.setdefault(j.source_url_hash, j)
+        by_name: Dict[tuple, Job] = {}
+        for j in await self._find_in(db, tuple_(Job.title, Job.company), names):
+            by_name.setdefault((j.title, j.company), j)
+
+        return [
+            by_external_id.get(r.get("external_id"))
+            or by_fingerprint.get(r.get("fingerprint"))
+            or by_url_hash.get(r.get("source_url_hash"))
+            or by_name.get((r.get("title"), r.get("company")))
+            for r in rows
+        ]
+
+    async def _find_in(self, db: AsyncSession, column, keys: set) -> List[Job]:
+        keys = list(keys)
+        found: List[Job] = []
+        for start in range(0, len(keys), self.LOOKUP_CHUNK_SIZE):
+            result = await db.execute(
+                select(Job).filter(column.in_(keys[start:start + self.LOOKUP_CHUNK_SIZE])).order_by(Job.id)
+            )
+            found.extend(result.scalars().all())
+        return found
+
     async def get_multi(
         self, db: AsyncSession, skip: int = 0, limit: int = 100
     ) -> List[Job]:
@@ -39,6 +100,48 @@ class CRUDJob:
         await db.refresh(db_obj)
         return db_obj
 
+    async def bulk_upsert(self, db: AsyncSession, rows: List[dict]) -> List[UpsertedJob]:
+        """
+        Insert or refresh a batch of jobs keyed by external_id with
+        INSERT ... ON CONFLICT (external_id) DO UPDATE, one statement per chunk
+        and a single commit. Returns one UpsertedJob per distinct external_id,
+        in input order (a later duplicate in `rows` wins).
+        """
+        if not rows:
+            return []
+        by_external_id = {}
+        for row in rows:
+            by_external_id[row["external_id"]] = row
+        unique_rows = list(by_external_id.values())
+
+        insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        columns = [c for c in UPSERT_UPDATE_COLUMNS if c in unique_rows[0]]
+        upserted = {}
+        for start in range(0, len(unique_rows), self.UPSERT_CHUNK_SIZE):
+            stmt = insert(Job).values(unique_rows[start:start + self.UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Job.external_id],
+                set_={
+                    **{c: stmt.excluded[c] for c in columns},
+                    "posted_date": func.coalesce(stmt.excluded.posted_date, Job.posted_date),
+                    "is_active": True,
+                    "updated_at": func.now(),
+                },
+            ).returning(Job.id, Job.external_id, Job.updated_at)
+            # Only the conflict branch sets updated_at, so NULL means the row was inserted
+            for job_id, external_id, updated_at in (await db.execute(stmt)).all():
+                upserted[external_id] = UpsertedJob(job_id, external_id, updated_at is None)
+        await db.commit()
+        return [upserted[external_id] for external_id in by_external_id if external_id in upserted]
+
+    async def get_many(self, db: AsyncSession, ids: List[int]) -> List[Job]:
+        """Jobs for `ids`, in the same order."""
+        if not ids:
+            return []
+        result = await db.execute(select(Job).filter(Job.id.in_(ids)))
+        jobs = {j.id: j for j in result.scalars().all()}
+        return [jobs[i] for i in ids if i in jobs]
+
     async def update(
         self, db: AsyncSession, *, db_obj: Job, obj_in: JobUpdate
     ) -> Job:
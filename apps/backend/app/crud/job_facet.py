@@ -0,0 +1,61 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, text
+
+from app.models.job_facet_count import RECOUNT_SQL, JobFacetCount
+
+
+class Facets(NamedTuple):
+    platforms: List[dict]  # [{"name", "count"}], largest first
+    remote_count: int
+    total: int  # visible jobs matching the requested platform / remote filters
+
+
+class CRUDJobFacet:
+    async def get(self, db: AsyncSession, *, platform: Optional[str] = None, remote_only: bool = False) -> Facets:
+        """
+        Explore's facet badges and filtered total from the counters: one read
+        of at most (platforms x 2) rows, whatever the size of jobs.
+        """
+        result = await db.execute(
+            select(JobFacetCount.source_platform, JobFacetCount.is_remote, JobFacetCount.count)
+            .where(JobFacetCount.count > 0)
+        )
+        by_platform, remote_count, total = {}, 0, 0
+        for name, is_remote, count in result.all():
+            by_platform[name] = by_platform.get(name, 0) + count
+            if is_remote:
+                remote_count += count
+            if (platform is None or name == platform) and (is_remote or not remote_only):
+                total += count
+        platforms = [
+            {"name": name, "count": count}
+            for name, count in sorted(by_platform.items(), key=lambda item: (-item[1], item[0]))
+        ]
+        return Facets(platforms, remote_count, total)
+
+    async def reconcile(self, db: AsyncSession) -> Dict[Tuple[str, bool], Tuple[int, int]]:
+        """
+        Recount the counters from jobs (one scan). Returns the drift found,
+        {(platform, is_remote): (counted before, actual)}; empty when in sync.
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            # Waits for ingestion transactions holding counter rows, blocks new ones until commit
+            await db.execute(text("LOCK TABLE job_facet_counts IN SHARE ROW EXCLUSIVE MODE"))
+        before = await self._counts(db)
+        await db.execute(delete(JobFacetCount))
+        await db.execute(text(RECOUNT_SQL[dialect]))
+        after = await self._counts(db)
+        await db.commit()
+        return {
+            key: (before.get(key, 0), after.get(key, 0))
+            for key in before.keys() | after.keys() if before.get(key, 0) != after.get(key, 0)
+        }
+
+    async def _counts(self, db: AsyncSession) -> Dict[Tuple[str, bool], int]:
+        result = await db.execute(select(JobFacetCount.source_platform, JobFacetCount.is_remote, JobFacetCount.count))
+        return {(name, bool(is_remote)): count for name, is_remote, count in result.all()}
+
+
+job_facet = CRUDJobFacet()
@@ -0,0 +1,86 @@
+"""
+Full-text job search over the index created with the jobs table (see
+SEARCH_DDL in app/models/job.py).
+
+    stmt, relevance = match(select(Job), dialect_of(db), "python remoto")
+    stmt = stmt.order_by(relevance.desc(), Job.id.desc())
+
+`terms` as one string means every word must match (a search box); as a list,
+any of the terms may match (a profile's skills). Relevance is higher for
+better matches, with title > company > description > location:
+
+  - PostgreSQL: `search_vector @@ websearch_to_tsquery('portuguese', ...)`,
+    ranked with ts_rank_cd; stemming and the GIN index do the rest.
+  - SQLite:     a join on the FTS5 table (prefix match on each word, accents
+    folded), ranked with bm25.
+  - Others:     ILIKE over the four columns, as before the index existed.
+"""
+import re
+from typing import List, Sequence, Tuple, Union
+
+from sqlalchemy import Float, case, false, func, literal, literal_column, or_, select, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.models.job import Job
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+_search_vector = literal_column("jobs.search_vector", type_=TSVECTOR)
+_jobs_fts = table("jobs_fts")
+
+
+def dialect_of(db: AsyncSession) -> str:
+    return db.bind.dialect.name if db.bind else "postgresql"
+
+
+def _words(term: str) -> List[str]:
+    return _WORD.findall(term.lower())
+
+
+def _terms(terms: Union[str, Sequence[str]]) -> Tuple[List[List[str]], bool]:
+    any_term = not isinstance(terms, str)
+    groups = [_words(t) for t in (terms if any_term else [terms])]
+    return [g for g in groups if g], any_term
+
+
+def match(stmt: Select, dialect: str, terms: Union[str, Sequence[str]]) -> Tuple[Select, ColumnElement]:
+    """Restrict `stmt` (a select over jobs) to full-text matches of `terms`; returns it and a relevance expression."""
+    groups, any_term = _terms(terms)
+    if not groups:
+        return stmt.where(false()), literal(0.0, Float)
+
+    if dialect == "postgresql":
+        # websearch syntax with every word or phrase quoted, so "or" / "-" in user text stay plain words
+        if any_term:
+            text = " or ".join(f'"{" ".join(words)}"' for words in groups)
+        else:
+            text = " ".join(f'"{w}"' for w in groups[0])
+        query = func.websearch_to_tsquery("portuguese", text)
+        return stmt.where(_search_vector.op("@@")(query)), func.ts_rank_cd(_search_vector, query)
+
+    if dialect == "sqlite":
+        clauses = [" ".join(f'"{w}"*' for w in words) for words in groups]
+        expression = " OR ".join(f"({c})" for c in clauses) if any_term else " ".join(clauses)
+        hits = (
+            select(
+                literal_column("rowid").label("job_id"),
+                # bm25 is lower-is-better; column weights: title, company, description, location
+                (-func.bm25(literal_column("jobs_fts"), 10.0, 5.0, 1.0, 2.0)).label("relevance"),
+            )
+            .select_from(_jobs_fts)
+            .where(literal_column("jobs_fts").op("MATCH")(expression))
+            .subquery()
+        )
+        return stmt.join(hits, hits.c.job_id == Job.id), hits.c.relevance
+
+    patterns = [f"%{' '.join(words)}%" for words in groups]
+    conditions = [
+        or_(Job.title.ilike(p), Job.company.ilike(p), Job.description.ilike(p), Job.location.ilike(p))
+        for p in patterns
+    ]
+    relevance = sum(
+        case((Job.title.ilike(p), 3), (Job.company.ilike(p), 2), else_=1) for p in patterns
+    )
+    return stmt.where(or_(*conditions)), relevance
@@ -0,0 +1,45 @@
+from typing import Iterable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.models.scraper_watermark import ScraperWatermark
+
+
+class CRUDScraperWatermark:
+    async def get_for_query(self, db: AsyncSession, *, query: str, sources: Iterable[str]) -> List[ScraperWatermark]:
+        """All watermarks for a (normalized) query across the given scrapers, in one query."""
+        result = await db.execute(
+            select(ScraperWatermark).where(
+                ScraperWatermark.query == query,
+                ScraperWatermark.source.in_(list(sources)),
+            )
+        )
+        return result.scalars().all()
+
+    async def upsert_many(self, db: AsyncSession, values: List[dict]) -> None:
+        """
+        Create or update watermarks keyed by (source, query), with one commit.
+        Each dict carries source, query, last_external_id, last_posted_at, recent_ids.
+        """
+        if not values:
+            return
+        queries = {v["query"] for v in values}
+        result = await db.execute(
+            select(ScraperWatermark).where(
+                ScraperWatermark.query.in_(queries),
+                ScraperWatermark.source.in_({v["source"] for v in values}),
+            )
+        )
+        existing = {(w.source, w.query): w for w in result.scalars().all()}
+        for v in values:
+            row = existing.get((v["source"], v["query"]))
+            if row is None:
+                row = ScraperWatermark(source=v["source"], query=v["query"])
+            row.last_external_id = v["last_external_id"]
+            row.last_posted_at = v["last_posted_at"]
+            row.recent_ids = v["recent_ids"]
+            db.add(row)
+        await db.commit()
+
+
+scraper_watermark = CRUDScraperWatermark()
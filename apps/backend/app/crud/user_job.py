@@ -1,12 +1,16 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.models.user_job import UserJob
 from app.schemas.user_job import UserJobCreate, UserJobUpdate
 
 
 class CRUDUserJob:
+    UPSERT_CHUNK_SIZE = 500  # rows per statement (SQLite caps bound parameters)
+
     async def get(self, db: AsyncSession, id: int) -> Optional[UserJob]:
         result = await db.execute(select(UserJob).where(UserJob.id == id))
         return result.scalars().first()
@@ -46,6 +50,29 @@ class CRUDUserJob:
         await db.refresh(new_record)
         return new_record
 
+    async def bulk_upsert_scores(self, db: AsyncSession, user_id: int, scores: Dict[int, float]) -> int:
+        """
+        Write a user's scores for many jobs with INSERT ... ON CONFLICT
+        (uq_user_job) DO UPDATE, one statement per chunk and a single commit.
+        Status is left untouched on existing rows. Returns the number of rows written.
+        """
+        if not scores:
+            return 0
+        rows = [
+            {"user_id": user_id, "job_id": job_id, "compatibility_score": score, "status": "new"}
+            for job_id, score in scores.items()
+        ]
+        insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        for start in range(0, len(rows), self.UPSERT_CHUNK_SIZE):
+            stmt = insert(UserJob).values(rows[start:start + self.UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UserJob.user_id, UserJob.job_id],
+                set_={"compatibility_score": stmt.excluded.compatibility_score, "updated_at": func.now()},
+            )
+            await db.execute(stmt)
+        await db.commit()
+        return len(rows)
+
     async def update_status(self, db: AsyncSession, *, user_id: int, job_id: int, status: str) -> Optional[UserJob]:
         """Update the status field (e.g., 'applied', 'rejected', 'saved') of a UserJob entry."""
         record = await self.get_by_user_and_job(db, user_id=user_id, job_id=job_id)
@@ -0,0 +1,179 @@
+"""
+Persistent content-hash cache of embedding vectors.
+
+Keys are a blake2b digest of (model, task_type, normalised text), so an
+unchanged job re-ingested, the same description posted on several boards and
+a popular search term are each embedded once.
+
+  - Memory: an LRU of the most recently used vectors (`memory_items`), which
+    answers repeated query embeddings without touching disk.
+  - Disk:   one SQLite table (vectors as float32 blobs) with a last-used
+    timestamp; past `max_items` the least recently used rows are evicted.
+
+Disk I/O runs in a worker thread. Hits, misses and the hit rate are kept for
+the stats endpoint.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    def __init__(self, path: str, max_items: int = 200_000, memory_items: int = 2048, enabled: bool = True):
+        self.path = path
+        self.max_items = max_items
+        self.memory_items = memory_items
+        self.enabled = enabled
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._size = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @staticmethod
+    def make_key(model: str, task_type: str, text: str) -> str:
+        normalized = " ".join(text.split())
+        if task_type == "retrieval_query":
+            normalized = normalized.lower()
+        raw = "\x1f".join((model, task_type, normalized))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        """Cached vector for each key (None on a miss)."""
+        if not self.enabled:
+            return [None] * len(keys)
+        found: Dict[str, List[float]] = {}
+        for key in keys:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                found[key] = vector
+        self.memory_hits += sum(1 for k in keys if k in found)
+        missing = [k for k in dict.fromkeys(keys) if k not in found]
+        if missing:
+            try:
+                from_disk = await asyncio.to_thread(self._read, missing)
+            except Exception as e:
+                logger.warning(f"EmbeddingCache: read failed ({e})")
+                from_disk = {}
+            self.disk_hits += sum(1 for k in keys if k in from_disk)
+            for key, vector in from_disk.items():
+                self._remember(key, vector)
+            found.update(from_disk)
+        self.misses += sum(1 for k in keys if k not in found)
+        return [found.get(k) for k in keys]
+
+    async def put_many(self, keys: List[str], vectors: List[List[float]]):
+        if not self.enabled or not keys:
+            return
+        for key, vector in zip(keys, vectors):
+            self._remember(key, vector)
+        try:
+            await asyncio.to_thread(self._write, keys, vectors)
+        except Exception as e:
+            logger.warning(f"EmbeddingCache: write failed ({e})")
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "disk_items": self._size,
+            "evicted": self.evicted,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, vector: List[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    # --- disk (worker thread) --------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_embeddings_last_used ON embeddings (last_used)")
+            self._size = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def _read(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", chunk).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype="<f4").tolist()
+                if rows:
+                    conn.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE key IN ({','.join('?' * len(rows))})",
+                        [time.time(), *(key for key, _ in rows)],
+                    )
+            conn.commit()
+        return found
+
+    def _write(self, keys: List[str], vectors: List[List[float]]):
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                [(k, np.asarray(v, dtype="<f4").tobytes(), now) for k, v in zip(keys, vectors)],
+            )
+            self._size += max(cursor.rowcount, 0)
+            if self._size > self.max_items:
+                # Evict down to 90% so eviction runs once per many writes
+                excess = self._size - int(self.max_items * 0.9)
+                cursor = conn.execute(
+                    "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+                self._size -= cursor.rowcount
+                self.evicted += cursor.rowcount
+            conn.commit()
+
+
+def _build_default_cache() -> EmbeddingCache:
+    from app.core.config import settings
+
+    return EmbeddingCache(
+        path=settings.EMBEDDING_CACHE_PATH,
+        max_items=settings.EMBEDDING_CACHE_MAX_ITEMS,
+        memory_items=settings.EMBEDDING_CACHE_MEMORY_ITEMS,
+        enabled=settings.EMBEDDING_CACHE_ENABLED,
+    )
+
+
+# Singleton instance for the app
+embedding_cache = _build_default_cache()
@@ -0,0 +1,103 @@
+"""
+Process-wide pool of long-lived httpx clients, one per (host, proxy).
+
+Every scraper used to open a fresh `httpx.AsyncClient` per request, paying for
+TCP + TLS setup on every call. The pool keeps one client per host alive for the
+whole process so keep-alive connections (and HTTP/2 multiplexing, when the
+`h2` package is installed and the site supports it) are reused across scrapers
+and queries.
+"""
+import asyncio
+import importlib.util
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientPool:
+    """
+    Lazily creates and caches one `httpx.AsyncClient` per host.
+    Clients are bound to the event loop that created them; if the pool is
+    used from a new loop (e.g. successive `asyncio.run()` calls in scripts),
+    the stale clients are closed in the background and rebuilt.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, Optional[str]], httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def _build_client(self, host: str, proxy: Optional[str]) -> httpx.AsyncClient:
+        from app.core.config import settings
+
+        max_connections = settings.SCRAPER_HOST_POOL_SIZES.get(
+            urlsplit(host).hostname or "", settings.SCRAPER_MAX_CONNECTIONS_PER_HOST
+        )
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, settings.SCRAPER_MAX_KEEPALIVE_PER_HOST),
+            keepalive_expiry=settings.SCRAPER_KEEPALIVE_EXPIRY,
+        )
+        http2 = settings.SCRAPER_HTTP2 and HTTP2_AVAILABLE
+        logger.info(f"HTTPClientPool: opening client for {host} (max={max_connections}, http2={http2})")
+        return httpx.AsyncClient(
+            proxy=proxy,
+            limits=limits,
+            http2=http2,
+            follow_redirects=True,
+        )
+
+    def get_client(self, url: str, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """Return the shared client for the host of `url`, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._clients:
+                logger.debug("HTTPClientPool: event loop changed, closing stale clients")
+                task = loop.create_task(self._close_all(list(self._clients.values())))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            self._clients = {}
+            self._loop = loop
+
+        key = (self._host_key(url), proxy)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._build_client(key[0], proxy)
+            self._clients[key] = client
+        return client
+
+    @property
+    def size(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    async def _close_all(clients: List[httpx.AsyncClient]):
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                # Connections opened on a loop that is gone may not close cleanly; the sockets still go
+                logger.warning(f"HTTPClientPool: error closing client: {e}")
+
+    async def aclose(self):
+        """Close every pooled client (and any still closing after a loop change). Safe to call more than once."""
+        clients, self._clients = self._clients, {}
+        await self._close_all(list(clients.values()))
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        self._loop = None
+
+
+# Singleton instance for the app
+http_client_pool = HTTPClientPool()
@@ -0,0 +1,142 @@
+"""
+Per-host adaptive token-bucket rate limiter for scrapers.
+
+Each host gets its own bucket, sized from `settings.SCRAPER_RATE_LIMITS`
+(requests/second) or, when the host has no explicit budget, from
+`settings.SCRAPER_RATE_LIMIT_DELAY` (one request every N seconds).
+
+The rate adapts AIMD-style:
+  - 429 / 403 responses halve the rate (down to a floor) and honour Retry-After
+  - a run of consecutive successes raises it again, up to the configured budget
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS_CODES = (403, 429)
+
+
+class TokenBucket:
+    """
+    A token bucket whose refill rate can be lowered and raised at runtime.
+    Tokens may go negative: each caller reserves its slot synchronously and
+    then sleeps, so no lock is needed inside a single event loop.
+    """
+
+    MIN_RATE = 0.05  # never slower than one request every 20s
+    BACKOFF_FACTOR = 0.5
+    RECOVERY_FACTOR = 1.25
+
+    def __init__(self, rate: float, burst: int = 1, recovery_successes: int = 10):
+        self.max_rate = max(rate, self.MIN_RATE)
+        self.rate = self.max_rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.recovery_successes = recovery_successes
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._success_streak = 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+        return max(wait, self._blocked_until - now)
+
+    async def acquire(self):
+        """Wait for a token; raise DeadlineExceeded rather than sleep past the search deadline."""
+        from app.services.jobsearch import deadline as search_deadline
+
+        wait = self.reserve()
+        if wait <= 0:
+            return
+        left = search_deadline.remaining()
+        if left is not None and wait >= left:
+            self.tokens += 1  # no request will be made, so hand the slot back
+            raise search_deadline.DeadlineExceeded(f"rate limit wait of {wait:.1f}s overruns the search deadline")
+        await asyncio.sleep(wait)
+
+    def on_success(self):
+        self._success_streak += 1
+        if self._success_streak >= self.recovery_successes and self.rate < self.max_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate * self.RECOVERY_FACTOR)
+            self._success_streak = 0
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        now = time.monotonic()
+        self._refill(now)
+        self._success_streak = 0
+        self.rate = max(self.MIN_RATE, self.rate * self.BACKOFF_FACTOR)
+        # Drain the bucket so the next request waits for a full interval
+        self.tokens = min(self.tokens, 0.0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+
+class HostRateLimiter:
+    """Registry of token buckets keyed by hostname."""
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            from app.core.config import settings
+
+            rate = settings.SCRAPER_RATE_LIMITS.get(host)
+            if rate is None:
+                rate = 1.0 / max(settings.SCRAPER_RATE_LIMIT_DELAY, 0.001)
+            bucket = TokenBucket(
+                rate,
+                burst=settings.SCRAPER_RATE_LIMIT_BURST,
+                recovery_successes=settings.SCRAPER_RATE_LIMIT_RECOVERY_SUCCESSES,
+            )
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str):
+        await self.bucket(self.host_of(url)).acquire()
+
+    def record_success(self, url: str):
+        self.bucket(self.host_of(url)).on_success()
+
+    def record_throttle(self, url: str, retry_after: Optional[float] = None):
+        host = self.host_of(url)
+        bucket = self.bucket(host)
+        bucket.on_throttle(retry_after)
+        logger.warning(f"HostRateLimiter: {host} throttled us, slowing down to {bucket.rate:.2f} req/s")
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current rate (req/s) per host, for diagnostics."""
+        return {host: round(b.rate, 3) for host, b in self._buckets.items()}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP-date values are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+# Singleton instance for the app
+rate_limiter = HostRateLimiter()
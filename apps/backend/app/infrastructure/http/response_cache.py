@@ -0,0 +1,255 @@
+"""
+On-disk HTTP response cache for scrapers, with conditional revalidation.
+
+Entries are keyed by method + URL + sorted query params and stored as one file
+per key: a JSON metadata line followed by the zlib-compressed body.
+
+  - Within a scraper's freshness TTL the cached body is served without a request.
+  - After that, the request is revalidated with If-None-Match / If-Modified-Since;
+    a 304 refreshes the entry and serves the stored body.
+  - Entries older than settings.CACHE_TTL_HOURS are discarded entirely: when
+    read, and by a sweep of the directory that `store` starts at most every
+    `purge_interval_seconds`, so entries never read again don't pile up.
+
+The cache counts its own hits (fresh entries served), revalidations (304s)
+and misses (bodies fetched and stored), see stats().
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Headers that no longer describe the stored (already decoded) body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request("GET", self.url),
+        )
+
+
+class ResponseCache:
+    """File-backed response cache. All disk I/O runs in a worker thread."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_age_seconds: float,
+        enabled: bool = True,
+        purge_interval_seconds: Optional[float] = None,
+    ):
+        self.directory = directory
+        self.max_age_seconds = max_age_seconds
+        self.enabled = enabled
+        self.purge_interval_seconds = purge_interval_seconds  # None: only purge_expired() sweeps
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._last_purge = float("-inf")
+        self._purge_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[dict] = None) -> str:
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        raw = f"{method.upper()} {url}?{query}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.bin")
+
+    @staticmethod
+    def is_cacheable(response: httpx.Response) -> bool:
+        if response.status_code != 200:
+            return False
+        cache_control = response.headers.get("cache-control", "").lower()
+        return "no-store" not in cache_control
+
+    # -- sync helpers (run in a thread) ------------------------------------
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            meta_line, compressed = raw.split(b"\n", 1)
+            meta = json.loads(meta_line)
+            entry = CacheEntry(
+                url=meta["url"],
+                status_code=meta["status_code"],
+                headers=meta["headers"],
+                body=zlib.decompress(compressed),
+                stored_at=meta["stored_at"],
+            )
+        except Exception as e:
+            logger.warning(f"ResponseCache: dropping corrupt entry {key}: {e}")
+            self._remove(path)
+            return None
+        if entry.age > self.max_age_seconds:
+            self._remove(path)
+            return None
+        return entry
+
+    def _write(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(meta).encode())
+            f.write(b"\n")
+            f.write(zlib.compress(entry.body))
+        os.replace(tmp_path, path)  # atomic, so readers never see half-written files
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _purge(self) -> int:
+        removed = 0
+        if not os.path.isdir(self.directory):
+            return 0
+        cutoff = time.time() - self.max_age_seconds
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    # -- async API ------------------------------------------------------------
+
+    async def get(self, key: str, fresh_for: Optional[float] = None) -> Optional[CacheEntry]:
+        """The stored entry, if any; counted as a hit when younger than `fresh_for` seconds."""
+        if not self.enabled:
+            return None
+        entry = await asyncio.to_thread(self._read, key)
+        if entry is not None and fresh_for is not None and entry.age < fresh_for:
+            self.hits += 1
+        return entry
+
+    async def store(self, key: str, response: httpx.Response) -> Optional[CacheEntry]:
+        """Store a 200 response body (decoded) with its validators. Counts a miss."""
+        if not self.enabled:
+            return None
+        self.misses += 1
+        self._schedule_purge()
+        if not self.is_cacheable(response):
+            return None
+        headers = {
+            k.lower(): v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS
+        }
+        entry = CacheEntry(
+            url=str(response.request.url) if response.request else "",
+            status_code=response.status_code,
+            headers=headers,
+            body=response.content,
+        )
+        try:
+            await asyncio.to_thread(self._write, key, entry)
+        except Exception as e:
+            logger.warning(f"ResponseCache: could not store {entry.url}: {e}")
+        return entry
+
+    async def refresh(self, key: str, entry: CacheEntry, not_modified: httpx.Response) -> CacheEntry:
+        """Handle a 304: keep the stored body, take new validators, restart freshness."""
+        self.revalidated += 1
+        for name in ("etag", "last-modified", "cache-control", "expires"):
+            if name in not_modified.headers:
+                entry.headers[name] = not_modified.headers[name]
+        entry.stored_at = time.time()
+        try:
+            await asyncio.to_thread(self._write, key, entry)
+        except Exception as e:
+            logger.warning(f"ResponseCache: could not refresh {entry.url}: {e}")
+        return entry
+
+    async def purge_expired(self) -> int:
+        """Delete entries older than max_age_seconds. Returns the number removed."""
+        removed = await asyncio.to_thread(self._purge)
+        if removed:
+            logger.info(f"ResponseCache: purged {removed} expired entries")
+        return removed
+
+    def _schedule_purge(self):
+        """Sweep the directory in the background if the last sweep is older than the interval."""
+        if self.purge_interval_seconds is None or (self._purge_task and not self._purge_task.done()):
+            return
+        now = time.monotonic()
+        if now - self._last_purge >= self.purge_interval_seconds:
+            self._last_purge = now
+            self._purge_task = asyncio.create_task(self.purge_expired())
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+
+def _build_default_cache() -> ResponseCache:
+    from app.core.config import settings
+
+    return ResponseCache(
+        directory=settings.SCRAPER_CACHE_DIR,
+        max_age_seconds=settings.CACHE_TTL_HOURS * 3600,
+        enabled=settings.SCRAPER_CACHE_ENABLED,
+        purge_interval_seconds=settings.SCRAPER_CACHE_PURGE_INTERVAL_SECONDS,
+    )
+
+
+# Singleton instance for the app
+response_cache = _build_default_cache()
@@ -0,0 +1,116 @@
+"""
+HTML parsing off the event loop.
+
+Scrapers split their HTML handling into a pure, module-level function
+`parse_x(html, limit, ...) -> List[ScrapedJob]` and run it through
+`parse_executor`, which:
+
+  - parses small documents inline (the pool round-trip would cost more),
+  - sends larger ones to a process pool, so building the tree neither blocks
+    the event loop nor holds the GIL of the API process,
+  - falls back to a worker thread when the pool is disabled or breaks.
+
+`make_soup` picks the fastest BeautifulSoup tree builder installed (lxml),
+falling back to the stdlib html.parser.
+"""
+import asyncio
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+
+def _detect_parser() -> str:
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+HTML_PARSER = _detect_parser()
+
+
+def make_soup(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """BeautifulSoup with the fastest available tree builder."""
+    return BeautifulSoup(html, parser or HTML_PARSER)
+
+
+class ParseExecutor:
+    def __init__(self, max_workers: int = 2, inline_bytes: int = 20_000):
+        self.max_workers = max_workers
+        self.inline_bytes = inline_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.inline = 0
+        self.pooled = 0
+        self.threaded = 0
+        self.fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that runs an event loop and open sockets is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"HTML parse pool started ({self.max_workers} workers, parser={HTML_PARSER})")
+        return self._pool
+
+    async def run(self, fn: Callable[..., Any], html: str, *args) -> Any:
+        """Run `fn(html, *args)`; `fn` must be a picklable module-level function."""
+        if len(html) < self.inline_bytes:
+            self.inline += 1
+            return fn(html, *args)
+        if not self.enabled:
+            self.threaded += 1
+            return await asyncio.to_thread(fn, html, *args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._get_pool(), partial(fn, html, *args))
+            self.pooled += 1
+            return result
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            logger.warning(f"HTML parse pool unavailable ({e!r}); parsing in a thread")
+            self.fallbacks += 1
+            self._discard_pool()
+            return await asyncio.to_thread(fn, html, *args)
+
+    def _discard_pool(self):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "inline": self.inline, "pooled": self.pooled,
+            "threaded": self.threaded, "fallbacks": self.fallbacks,
+        }
+
+
+def _build_default_executor() -> ParseExecutor:
+    from app.core.config import settings
+
+    return ParseExecutor(
+        max_workers=settings.SCRAPER_PARSE_WORKERS,
+        inline_bytes=settings.SCRAPER_PARSE_INLINE_BYTES,
+    )
+
+
+# Singleton instance for the app
+parse_executor = _build_default_executor()
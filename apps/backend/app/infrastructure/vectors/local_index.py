@@ -0,0 +1,449 @@
+"""
+In-process vector index on NumPy, with memory-mapped persistence.
+
+Vectors are L2-normalised float32, so the inner product is the cosine score.
+Each namespace ("jobs", "resumes") keeps its files in `directory`:
+
+    <ns>.json         header: dim, row count, IVF parameters
+    <ns>.f32          vectors, raw float32 memmap of shape (capacity, dim)
+    <ns>.ids          int64 memmap of external ids, one per row
+    <ns>.assign       int32 memmap of each row's IVF list (-1 before training)
+    <ns>.centroids    float32 IVF centroids (.npy)
+    <ns>.meta.jsonl   append-only log of [row, metadata]; the last entry wins
+
+Search is exact (one matmul over all rows) below `ivf_threshold` rows. Above
+it the rows are clustered into ~sqrt(n) lists with spherical k-means and a
+query scans only the `nprobe` lists nearest to it (IVF). Training rewrites
+the files grouped by list, so a probe reads contiguous slices; rows added
+later join their nearest list and are gathered by row number. The lists are
+retrained when the collection has doubled since the last training.
+
+Training holds the index lock only to copy a sample and, at the end, to swap
+in the new lists; k-means and assigning every row run outside it, so searches
+and writes go on meanwhile. Rows written during training are assigned again
+at the swap.
+
+`is_remote`, `location` and `source_platform` are kept as coded columns so metadata filters on
+them are vectorised; other fields are checked per candidate row. Filters use
+the Pinecone subset {field: value} / {"$eq", "$ne", "$in", "$nin"}, ANDed.
+"""
+import json
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FILTER_COLUMNS = ("is_remote", "location", "source_platform")
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+def _value_key(value: Any) -> Any:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+class _TrainingSnapshot(NamedTuple):
+    count: int              # rows [0, count) are assigned to the new lists
+    nlist: int
+    sample: np.ndarray      # copied rows to run k-means on
+    vectors: np.memmap      # rows are read from it outside the lock
+    rng: np.random.Generator
+
+
+class _Namespace:
+    def __init__(self, directory: str, name: str):
+        self.name = name
+        self.base = os.path.join(directory, name)
+        self.dim: Optional[int] = None
+        self.count = 0
+        self.capacity = 0
+        self.vectors: Optional[np.memmap] = None
+        self.ids: Optional[np.memmap] = None
+        self.assign: Optional[np.memmap] = None
+        self.row_of: Dict[int, int] = {}
+        self.metadata: List[dict] = []
+        self.columns = {f: np.full(0, -1, dtype=np.int32) for f in FILTER_COLUMNS}
+        self.codes: Dict[str, Dict[Any, int]] = {f: {} for f in FILTER_COLUMNS}
+        self.centroids: Optional[np.ndarray] = None
+        self.bounds = np.zeros(1, dtype=np.int64)
+        self.tail: List[List[int]] = []
+        self.trained_count = 0
+        self._touched: Optional[Set[int]] = None  # rows written while training, None when not training
+        self._meta_log = None
+
+    # --- files ---------------------------------------------------------------
+
+    def _open_memmaps(self):
+        shape_rows = max(self.capacity, 1)
+        self.vectors = np.memmap(f"{self.base}.f32", dtype=np.float32, mode="r+", shape=(shape_rows, self.dim))
+        self.ids = np.memmap(f"{self.base}.ids", dtype=np.int64, mode="r+", shape=(shape_rows,))
+        self.assign = np.memmap(f"{self.base}.assign", dtype=np.int32, mode="r+", shape=(shape_rows,))
+
+    def _resize(self, capacity: int):
+        if self.vectors is not None:
+            self.flush()
+            self.vectors = self.ids = self.assign = None
+        for suffix, itemsize, fill in ((".f32", 4 * self.dim, None), (".ids", 8, None), (".assign", 4, -1)):
+            path = f"{self.base}{suffix}"
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(path, "ab") as f:
+                f.truncate(capacity * itemsize)
+            if fill is not None and capacity * itemsize > old_size:
+                with open(path, "r+b") as f:
+                    f.seek(old_size)
+                    f.write(np.full((capacity * itemsize - old_size) // itemsize, fill, dtype=np.int32).tobytes())
+        for field, column in self.columns.items():
+            grown = np.full(capacity, -1, dtype=np.int32)
+            grown[:len(column)] = column
+            self.columns[field] = grown
+        self.capacity = capacity
+        self._open_memmaps()
+
+    def load(self):
+        header_path = f"{self.base}.json"
+        if not os.path.exists(header_path):
+            return
+        with open(header_path) as f:
+            header = json.load(f)
+        self.dim, self.count, self.capacity = header["dim"], header["count"], header["capacity"]
+        self.trained_count = header.get("trained_count", 0)
+        self.columns = {f: np.full(self.capacity, -1, dtype=np.int32) for f in FILTER_COLUMNS}
+        self._open_memmaps()
+        self.row_of = {int(i): row for row, i in enumerate(self.ids[:self.count])}
+        self.metadata = [{} for _ in range(self.count)]
+        if os.path.exists(f"{self.base}.meta.jsonl"):
+            with open(f"{self.base}.meta.jsonl") as f:
+                for line in f:
+                    try:
+                        row, metadata = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line after a crash
+                    if row < self.count:
+                        self._set_metadata(row, metadata)
+        if self.trained_count and os.path.exists(f"{self.base}.centroids.npy"):
+            self.centroids = np.load(f"{self.base}.centroids.npy")
+            self._rebuild_lists()
+
+    def save_header(self):
+        header = {
+            "dim": self.dim, "count": self.count, "capacity": self.capacity, "trained_count": self.trained_count,
+        }
+        tmp = f"{self.base}.json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(header, f)
+        os.replace(tmp, f"{self.base}.json")
+
+    def flush(self):
+        for mm in (self.vectors, self.ids, self.assign):
+            if mm is not None:
+                mm.flush()
+        if self._meta_log is not None:
+            self._meta_log.flush()
+
+    def close(self):
+        self.flush()
+        if self._meta_log is not None:
+            self._meta_log.close()
+            self._meta_log = None
+
+    # --- writes --------------------------------------------------------------
+
+    def _set_metadata(self, row: int, metadata: dict):
+        self.metadata[row] = metadata
+        for field in FILTER_COLUMNS:
+            value = metadata.get(field)
+            if value is None:
+                self.columns[field][row] = -1
+                continue
+            codes = self.codes[field]
+            self.columns[field][row] = codes.setdefault(_value_key(value), len(codes))
+
+    def upsert(self, items: Sequence[Tuple[int, Sequence[float], dict]]):
+        vectors = _normalize(np.asarray([v for _, v, _ in items], dtype=np.float32))
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"{self.name}: expected {self.dim}-dim vectors, got {vectors.shape[1]}")
+        new = sum(1 for item_id, _, _ in items if int(item_id) not in self.row_of)
+        if self.count + new > self.capacity:
+            self._resize(max(1024, 2 * self.capacity, self.count + new))
+        if self._meta_log is None:
+            self._meta_log = open(f"{self.base}.meta.jsonl", "a")
+
+        nearest = None
+        if self.centroids is not None:
+            nearest = np.argmax(vectors @ self.centroids.T, axis=1)
+        for i, (item_id, _, metadata) in enumerate(items):
+            item_id = int(item_id)
+            row = self.row_of.get(item_id)
+            if row is None:
+                row = self.count
+                self.count += 1
+                self.row_of[item_id] = row
+                self.ids[row] = item_id
+                self.metadata.append({})
+            elif nearest is not None and row >= self.trained_count:
+                self.tail[self.assign[row]].remove(row)
+            if self._touched is not None:
+                self._touched.add(row)
+            self.vectors[row] = vectors[i]
+            # Packed rows keep their list until the next training; newer rows join the nearest one
+            if nearest is not None and row >= self.trained_count:
+                self.assign[row] = nearest[i]
+                self.tail[nearest[i]].append(row)
+            metadata = metadata or {}
+            self._set_metadata(row, metadata)
+            self._meta_log.write(json.dumps([row, metadata]) + "\n")
+
+    # --- IVF -----------------------------------------------------------------
+
+    @property
+    def training(self) -> bool:
+        return self._touched is not None
+
+    def begin_training(self, max_sample: int = 100_000, seed: int = 0) -> _TrainingSnapshot:
+        """Under the index lock: copy a sample and start tracking the rows written until the swap."""
+        n = self.count
+        nlist = max(16, int(math.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        sample_rows = np.sort(rng.choice(n, size=min(n, max(nlist * 64, 10_000), max_sample), replace=False))
+        self._touched = set()
+        return _TrainingSnapshot(n, nlist, np.asarray(self.vectors[sample_rows]), self.vectors, rng)
+
+    @staticmethod
+    def fit(snapshot: _TrainingSnapshot, iterations: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Without the lock: spherical k-means over the sample, then every row of
+        the snapshot is assigned to its nearest centroid.
+        """
+        data = snapshot.sample
+        centroids = data[snapshot.rng.choice(len(data), size=snapshot.nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            present, starts = np.unique(labels[order], return_index=True)
+            sums = np.add.reduceat(data[order], starts, axis=0)
+            centroids[present] = _normalize(sums)
+
+        n = snapshot.count
+        assign = np.empty(n, dtype=np.int32)
+        for start in range(0, n, 65_536):
+            chunk = np.asarray(snapshot.vectors[start:min(n, start + 65_536)])
+            assign[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+        return centroids, assign
+
+    def finish_training(self, centroids: np.ndarray, assign: np.ndarray):
+        """
+        Under the index lock: swap in the new lists. The storage is rewritten
+        grouped by list, so a probe reads each list as one contiguous slice.
+        """
+        n = len(assign)
+        touched = sorted(row for row in self._touched if row < n)
+        self._touched = None
+        if touched:
+            rows = np.asarray(touched, dtype=np.int64)
+            assign[rows] = np.argmax(np.asarray(self.vectors[rows]) @ centroids.T, axis=1)
+        self.assign[:n] = assign
+        if self.count > n:  # added while training: kept after the packed rows, in their nearest list
+            self.assign[n:self.count] = np.argmax(np.asarray(self.vectors[n:self.count]) @ centroids.T, axis=1)
+        self._reorder(np.concatenate([np.argsort(assign, kind="stable"), np.arange(n, self.count)]))
+        self.centroids = centroids
+        self.trained_count = n
+        np.save(f"{self.base}.centroids.npy", centroids)
+        self._rebuild_lists()
+
+    def abort_training(self):
+        self._touched = None
+
+    def _reorder(self, order: np.ndarray):
+        """Permute rows so row i becomes old row order[i] (files, columns, metadata log)."""
+        n = self.count
+        self.flush()
+        for suffix, mm, fill in ((".f32", self.vectors, 0), (".ids", self.ids, 0), (".assign", self.assign, -1)):
+            out = np.memmap(f"{self.base}{suffix}.tmp", dtype=mm.dtype, mode="w+", shape=mm.shape)
+            for start in range(0, n, 65_536):
+                chunk = order[start:start + 65_536]
+                out[start:start + len(chunk)] = mm[chunk]
+            out[n:] = fill
+            out.flush()
+            del out
+        self.vectors = self.ids = self.assign = None
+        for suffix in (".f32", ".ids", ".assign"):
+            os.replace(f"{self.base}{suffix}.tmp", f"{self.base}{suffix}")
+        self._open_memmaps()
+
+        for field, column in self.columns.items():
+            column[:n] = column[order]
+        self.metadata = [self.metadata[row] for row in order]
+        self.row_of = {int(i): row for row, i in enumerate(self.ids[:n])}
+        if self._meta_log is not None:
+            self._meta_log.close()
+            self._meta_log = None
+        with open(f"{self.base}.meta.jsonl.tmp", "w") as f:
+            for row, metadata in enumerate(self.metadata):
+                f.write(json.dumps([row, metadata]) + "\n")
+        os.replace(f"{self.base}.meta.jsonl.tmp", f"{self.base}.meta.jsonl")
+
+    def _rebuild_lists(self):
+        nlist = len(self.centroids)
+        # Rows [0, trained_count) are grouped by list; later rows are kept per list in `tail`
+        self.bounds = np.searchsorted(np.asarray(self.assign[:self.trained_count]), np.arange(nlist + 1))
+        self.tail = [[] for _ in range(nlist)]
+        for row in range(self.trained_count, self.count):
+            self.tail[self.assign[row]].append(row)
+
+    def scan(self, query: np.ndarray, nprobe: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows of the `nprobe` lists nearest to `query`, with their scores."""
+        scores = self.centroids @ query
+        nearest = np.argpartition(-scores, nprobe - 1)[:nprobe] if nprobe < len(scores) else np.arange(len(scores))
+        rows, row_scores = [], []
+        for c in nearest:
+            lo, hi = self.bounds[c], self.bounds[c + 1]
+            if hi > lo:
+                rows.append(np.arange(lo, hi))
+                row_scores.append(np.asarray(self.vectors[lo:hi]) @ query)
+            if self.tail[c]:
+                tail = np.asarray(self.tail[c], dtype=np.int64)
+                rows.append(tail)
+                row_scores.append(np.asarray(self.vectors[tail]) @ query)
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return np.concatenate(rows), np.concatenate(row_scores)
+
+    # --- filters -------------------------------------------------------------
+
+    def mask(self, rows: np.ndarray, filter: Optional[dict]) -> np.ndarray:
+        keep = np.ones(len(rows), dtype=bool)
+        for field, condition in (filter or {}).items():
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            for op, value in condition.items():
+                if field in self.columns:
+                    keep &= self._column_mask(field, rows, op, value)
+                else:
+                    keep &= np.fromiter(
+                        (_matches(self.metadata[r].get(field), op, value) for r in rows), dtype=bool, count=len(rows)
+                    )
+        return keep
+
+    def _column_mask(self, field: str, rows: np.ndarray, op: str, value: Any) -> np.ndarray:
+        values = self.columns[field][rows]
+        codes = self.codes[field]
+        if op in ("$eq", "$ne"):
+            hit = values == codes.get(_value_key(value), -2)
+        elif op in ("$in", "$nin"):
+            hit = np.isin(values, [codes[k] for k in map(_value_key, value) if k in codes])
+        else:
+            raise ValueError(f"Unsupported filter operator {op}")
+        return ~hit if op in ("$ne", "$nin") else hit
+
+
+def _matches(actual: Any, op: str, value: Any) -> bool:
+    if op == "$eq":
+        return actual == value
+    if op == "$ne":
+        return actual != value
+    if op == "$in":
+        return actual in value
+    if op == "$nin":
+        return actual not in value
+    raise ValueError(f"Unsupported filter operator {op}")
+
+
+class LocalVectorIndex:
+    """Thread-safe collection of namespaces stored under `directory`."""
+
+    def __init__(self, directory: str, ivf_threshold: int = 50_000, nprobe: int = 8):
+        self.directory = directory
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.RLock()
+
+    def _namespace(self, name: str) -> _Namespace:
+        ns = self._namespaces.get(name)
+        if ns is None:
+            os.makedirs(self.directory, exist_ok=True)
+            ns = _Namespace(self.directory, name)
+            ns.load()
+            self._namespaces[name] = ns
+        return ns
+
+    def upsert(self, namespace: str, items: Sequence[Tuple[int, Sequence[float], dict]]):
+        if not items:
+            return
+        with self._lock:
+            ns = self._namespace(namespace)
+            ns.upsert(items)
+            ns.save_header()
+            if ns.training or ns.count < self.ivf_threshold or ns.count < 2 * ns.trained_count:
+                return
+            logger.info(f"LocalVectorIndex: training IVF lists for '{namespace}' ({ns.count} vectors)")
+            snapshot = ns.begin_training()
+        # The writer that crossed the threshold trains; searches and other writes go on meanwhile
+        try:
+            centroids, assign = ns.fit(snapshot)
+        except BaseException:
+            with self._lock:
+                ns.abort_training()
+            raise
+        with self._lock:
+            ns.finish_training(centroids, assign)
+            ns.save_header()
+
+    def fetch(self, namespace: str, item_id: int) -> Optional[List[float]]:
+        with self._lock:
+            ns = self._namespace(namespace)
+            row = ns.row_of.get(int(item_id))
+            return None if row is None else np.asarray(ns.vectors[row]).tolist()
+
+    def search(
+        self, namespace: str, query: Sequence[float], top_k: int = 10, filter: Optional[dict] = None
+    ) -> List[Tuple[int, float, dict]]:
+        """(id, cosine score, metadata) of the `top_k` best matches, best first."""
+        with self._lock:
+            ns = self._namespace(namespace)
+            if ns.count == 0 or top_k <= 0:
+                return []
+            q = _normalize(np.asarray(query, dtype=np.float32))
+            if ns.centroids is not None:
+                nprobe = self.nprobe
+                while True:
+                    rows, scores = ns.scan(q, nprobe)
+                    if filter:
+                        keep = ns.mask(rows, filter)
+                        rows, scores = rows[keep], scores[keep]
+                    # A selective filter can leave too few rows in the nearest lists: widen
+                    if len(rows) >= top_k or nprobe >= len(ns.centroids):
+                        break
+                    nprobe *= 4
+            else:
+                rows = np.arange(ns.count)
+                scores = np.asarray(ns.vectors[:ns.count]) @ q
+                if filter:
+                    keep = ns.mask(rows, filter)
+                    rows, scores = rows[keep], scores[keep]
+            if len(rows) > top_k:
+                best = np.argpartition(-scores, top_k - 1)[:top_k]
+            else:
+                best = np.arange(len(rows))
+            best = best[np.argsort(-scores[best])]
+            return [(int(ns.ids[rows[i]]), float(scores[i]), ns.metadata[rows[i]]) for i in best]
+
+    def count(self, namespace: str) -> int:
+        with self._lock:
+            return self._namespace(namespace).count
+
+    def close(self):
+        with self._lock:
+            for ns in self._namespaces.values():
+                ns.close()
@@ -28,6 +28,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -38,12 +39,26 @@ async def startup_event():
     logger.info(f"Environment: {settings.ENV}")
     await init_db()
     logger.info("Database initialized")
+    from app.services.vector_writer import vector_writer
+    vector_writer.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down Job Hunter AI...")
+    from app.infrastructure.http.client_pool import http_client_pool
+    await http_client_pool.aclose()
+    logger.info("Scraper HTTP clients closed")
+    from app.infrastructure.parsing.html_parser import parse_executor
+    parse_executor.shutdown()
+    from app.infrastructure.cache.embedding_cache import embedding_cache
+    embedding_cache.close()
+    from app.services.vector_writer import vector_writer
+    await vector_writer.stop()  # sends the vectors still queued
+    from app.services.vector_store import vector_store
+    if hasattr(vector_store, "close"):
+        vector_store.close()  # flushes the local index's memory maps
 
 
 # Include routers
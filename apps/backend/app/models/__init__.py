@@ -3,3 +3,6 @@ from app.models.job import Job
 from app.models.resume import Resume
 from app.models.application import Application
 from app.models.user_job import UserJob
+from app.models.scraper_watermark import ScraperWatermark
+from app.models.job_lsh_bucket import JobLshBucket
+from app.models.job_facet_count import JobFacetCount
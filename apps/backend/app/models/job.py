@@ -1,15 +1,40 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, ForeignKey
+from typing import Optional
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Float, Text, Boolean, ForeignKey, Index, LargeBinary, DDL, event, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from app.core.fingerprint import job_fingerprint, url_hash
 from app.database import Base
 
 
+def _default_fingerprint(context) -> int:
+    params = context.get_current_parameters()
+    return job_fingerprint(params.get("source_url"), params.get("title"), params.get("company"), params.get("location"))
+
+
+def _default_source_url_hash(context) -> Optional[int]:
+    return url_hash(context.get_current_parameters().get("source_url"))
+
+
+def _visible_index(name: str, *columns: str) -> Index:
+    """Partial index over the rows listings show (active, canonical), for `ORDER BY id DESC` keyset seeks."""
+    return Index(
+        name, *columns,
+        postgresql_where=text("is_active AND canonical_job_id IS NULL"),
+        # SQLite only uses a partial index when the query repeats its terms verbatim
+        sqlite_where=text("is_active = 1 AND canonical_job_id IS NULL"),
+    )
+
+
 class Job(Base):
     """Job listing model"""
     __tablename__ = "jobs"
     
     id = Column(Integer, primary_key=True, index=True)
     external_id = Column(String(255), unique=True, index=True, nullable=False)  # Unique ID from source
+    fingerprint = Column(BigInteger, index=True, nullable=True, default=_default_fingerprint)  # see app.core.fingerprint
+    # Near-duplicates (same vacancy on another board) point at the oldest copy; NULL = canonical
+    canonical_job_id = Column(Integer, ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True)
+    minhash = Column(LargeBinary, nullable=True)  # see app.core.minhash
     
     # Job info
     title = Column(String(255), nullable=False, index=True)
@@ -29,6 +54,7 @@ class Job(Base):
     # Source
     source_platform = Column(String(50), nullable=False)  # linkedin, indeed, remoteok
     source_url = Column(Text, nullable=False)
+    source_url_hash = Column(BigInteger, index=True, nullable=True, default=_default_source_url_hash)  # Text URLs index poorly
     
     # AI Analysis
     compatibility_score = Column(Float, nullable=True)  # 0-100
@@ -60,5 +86,64 @@ class Job(Base):
     applications = relationship("Application", back_populates="job")
     user_jobs = relationship("UserJob", back_populates="job", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        Index("ix_jobs_title_company", "title", "company"),  # batched (title, company) dedup
+        _visible_index("ix_jobs_visible_id", "id"),  # /jobs/explore pages
+        _visible_index("ix_jobs_visible_platform_id", "source_platform", "id"),
+        _visible_index("ix_jobs_visible_remote_id", "is_remote", "id"),
+    )
+
     def __repr__(self):
         return f"<Job {self.title} at {self.company}>"
+
+
+# Full-text search index (queried through app.crud.job_search), created with the table.
+# PostgreSQL: a generated, weighted tsvector column with a GIN index.
+# SQLite: an external-content FTS5 table kept in sync by triggers.
+SEARCH_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('portuguese'::regconfig, coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('portuguese'::regconfig, coalesce(company, '')), 'B') ||
+            setweight(to_tsvector('portuguese'::regconfig, coalesce(description, '')), 'C') ||
+            setweight(to_tsvector('portuguese'::regconfig, coalesce(location, '')), 'D')
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)",
+    ],
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, company, description, location,
+            content='jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, description, location)
+            VALUES (new.id, new.title, new.company, new.description, new.location);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, location)
+            VALUES ('delete', old.id, old.title, old.company, old.description, old.location);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, description, location ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, location)
+            VALUES ('delete', old.id, old.title, old.company, old.description, old.location);
+            INSERT INTO jobs_fts (rowid, title, company, description, location)
+            VALUES (new.id, new.title, new.company, new.description, new.location);
+        END
+        """,
+    ],
+}
+
+for _dialect, _statements in SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Job.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+# The FTS5 table is not a child of jobs: drop it with it so stale rowids never match
+event.listen(Job.__table__, "before_drop", DDL("DROP TABLE IF EXISTS jobs_fts").execute_if(dialect="sqlite"))
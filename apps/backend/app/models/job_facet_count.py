@@ -0,0 +1,143 @@
+from sqlalchemy import Column, Integer, String, Boolean, DDL, event
+from app.database import Base
+from app.models.job import Job
+
+
+class JobFacetCount(Base):
+    """
+    Number of visible jobs (active, canonical) per (source_platform, is_remote),
+    kept current by triggers on jobs (FACET_DDL) so /jobs/explore reads its
+    facet badges and totals from a handful of rows instead of counting jobs.
+    """
+    __tablename__ = "job_facet_counts"
+
+    source_platform = Column(String(50), primary_key=True)
+    is_remote = Column(Boolean, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<JobFacetCount {self.source_platform} remote={self.is_remote} count={self.count}>"
+
+
+# Recount from scratch: the backfill when the table is created, and
+# app.crud.job_facet.reconcile() for drift
+RECOUNT_SQL = {
+    "postgresql": """
+        INSERT INTO job_facet_counts (source_platform, is_remote, count)
+        SELECT source_platform, coalesce(is_remote, false), count(*) FROM jobs
+        WHERE is_active AND canonical_job_id IS NULL
+        GROUP BY 1, 2
+    """,
+    "sqlite": """
+        INSERT INTO job_facet_counts (source_platform, is_remote, count)
+        SELECT source_platform, coalesce(is_remote, 0), count(*) FROM jobs
+        WHERE is_active = 1 AND canonical_job_id IS NULL
+        GROUP BY 1, 2
+    """,
+}
+
+# PostgreSQL: statement-level triggers with transition tables, one upsert per
+# statement whatever the batch size. Counter rows are locked in key order so
+# concurrent ingestion batches cannot deadlock on them.
+# SQLite: row-level triggers (it has no statement-level ones).
+FACET_DDL = {
+    "postgresql": [
+        """
+        CREATE OR REPLACE FUNCTION job_facet_counts_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO job_facet_counts (source_platform, is_remote, count)
+                SELECT source_platform, coalesce(is_remote, false), count(*) FROM new_rows
+                WHERE is_active AND canonical_job_id IS NULL
+                GROUP BY 1, 2 ORDER BY 1, 2
+                ON CONFLICT (source_platform, is_remote) DO UPDATE SET count = job_facet_counts.count + excluded.count;
+            ELSIF TG_OP = 'UPDATE' THEN
+                INSERT INTO job_facet_counts (source_platform, is_remote, count)
+                SELECT source_platform, remote, sum(delta) FROM (
+                    SELECT source_platform, coalesce(is_remote, false) AS remote, -1 AS delta FROM old_rows
+                    WHERE is_active AND canonical_job_id IS NULL
+                    UNION ALL
+                    SELECT source_platform, coalesce(is_remote, false), 1 FROM new_rows
+                    WHERE is_active AND canonical_job_id IS NULL
+                ) AS changes
+                GROUP BY 1, 2 HAVING sum(delta) <> 0 ORDER BY 1, 2
+                ON CONFLICT (source_platform, is_remote) DO UPDATE SET count = job_facet_counts.count + excluded.count;
+            ELSE
+                INSERT INTO job_facet_counts (source_platform, is_remote, count)
+                SELECT source_platform, coalesce(is_remote, false), -count(*) FROM old_rows
+                WHERE is_active AND canonical_job_id IS NULL
+                GROUP BY 1, 2 ORDER BY 1, 2
+                ON CONFLICT (source_platform, is_remote) DO UPDATE SET count = job_facet_counts.count + excluded.count;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER job_facet_counts_ai AFTER INSERT ON jobs
+        REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION job_facet_counts_apply()
+        """,
+        """
+        CREATE TRIGGER job_facet_counts_au AFTER UPDATE ON jobs
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION job_facet_counts_apply()
+        """,
+        """
+        CREATE TRIGGER job_facet_counts_ad AFTER DELETE ON jobs
+        REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION job_facet_counts_apply()
+        """,
+        RECOUNT_SQL["postgresql"],
+    ],
+    "sqlite": [
+        """
+        CREATE TRIGGER IF NOT EXISTS job_facet_counts_ai AFTER INSERT ON jobs
+        WHEN new.is_active = 1 AND new.canonical_job_id IS NULL BEGIN
+            INSERT INTO job_facet_counts (source_platform, is_remote, count)
+            VALUES (new.source_platform, coalesce(new.is_remote, 0), 1)
+            ON CONFLICT (source_platform, is_remote) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS job_facet_counts_ad AFTER DELETE ON jobs
+        WHEN old.is_active = 1 AND old.canonical_job_id IS NULL BEGIN
+            UPDATE job_facet_counts SET count = count - 1
+            WHERE source_platform = old.source_platform AND is_remote = coalesce(old.is_remote, 0);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS job_facet_counts_au
+        AFTER UPDATE OF is_active, canonical_job_id, source_platform, is_remote ON jobs BEGIN
+            UPDATE job_facet_counts SET count = count - 1
+            WHERE old.is_active = 1 AND old.canonical_job_id IS NULL
+              AND source_platform = old.source_platform AND is_remote = coalesce(old.is_remote, 0);
+            INSERT INTO job_facet_counts (source_platform, is_remote, count)
+            SELECT new.source_platform, coalesce(new.is_remote, 0), 1
+            WHERE new.is_active = 1 AND new.canonical_job_id IS NULL
+            ON CONFLICT (source_platform, is_remote) DO UPDATE SET count = count + 1;
+        END
+        """,
+        RECOUNT_SQL["sqlite"],
+    ],
+}
+
+FACET_DROP_DDL = {
+    "postgresql": [
+        "DROP TRIGGER IF EXISTS job_facet_counts_ai ON jobs",
+        "DROP TRIGGER IF EXISTS job_facet_counts_au ON jobs",
+        "DROP TRIGGER IF EXISTS job_facet_counts_ad ON jobs",
+        "DROP FUNCTION IF EXISTS job_facet_counts_apply()",
+    ],
+    "sqlite": [
+        "DROP TRIGGER IF EXISTS job_facet_counts_ai",
+        "DROP TRIGGER IF EXISTS job_facet_counts_au",
+        "DROP TRIGGER IF EXISTS job_facet_counts_ad",
+    ],
+}
+
+# Triggers and backfill need jobs: create this table after it (and drop it first)
+JobFacetCount.__table__.add_is_dependent_on(Job.__table__)
+for _dialect, _statements in FACET_DDL.items():
+    for _statement in _statements:
+        event.listen(JobFacetCount.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+for _dialect, _statements in FACET_DROP_DDL.items():
+    for _statement in _statements:
+        event.listen(JobFacetCount.__table__, "before_drop", DDL(_statement).execute_if(dialect=_dialect))
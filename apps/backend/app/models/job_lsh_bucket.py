@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, SmallInteger, BigInteger, ForeignKey, Index
+from app.database import Base
+
+
+class JobLshBucket(Base):
+    """
+    One LSH band bucket of a job's MinHash signature (see app.core.minhash).
+    Jobs that share a (band, bucket) pair are near-duplicate candidates.
+    """
+    __tablename__ = "job_lsh_buckets"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    band = Column(SmallInteger, nullable=False)
+    bucket = Column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        Index("ix_job_lsh_buckets_band_bucket", "band", "bucket"),
+    )
+
+    def __repr__(self):
+        return f"<JobLshBucket job={self.job_id} band={self.band} bucket={self.bucket}>"
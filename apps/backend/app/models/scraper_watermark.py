@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ScraperWatermark(Base):
+    """
+    High-water mark of what a scraper has already returned for a query.
+    Lets incremental crawls stop paging at known items and pass only new
+    jobs downstream.
+    """
+    __tablename__ = "scraper_watermarks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(100), nullable=False)   # scraper class name
+    query = Column(String(255), nullable=False)    # normalized query
+
+    # Newest item seen
+    last_external_id = Column(String(255), nullable=True)
+    last_posted_at = Column(DateTime(timezone=True), nullable=True)
+    # JSON list of the most recently seen external_ids, newest first
+    recent_ids = Column(Text, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("source", "query", name="uq_scraper_watermark"),
+    )
+
+    def __repr__(self):
+        return f"<ScraperWatermark {self.source} '{self.query}' last={self.last_external_id}>"
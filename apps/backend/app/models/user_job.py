@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -31,9 +31,11 @@ class UserJob(Base):
     user = relationship("User", back_populates="user_jobs")
     job = relationship("Job", back_populates="user_jobs")
 
-    # A user can only have one score entry per job
+    # A user can only have one score entry per job; top-k reads and their
+    # keyset pages walk (user_id, score DESC, job_id DESC)
     __table_args__ = (
         UniqueConstraint("user_id", "job_id", name="uq_user_job"),
+        Index("ix_user_jobs_user_score", user_id, compatibility_score.desc(), job_id.desc()),
     )
 
     def __repr__(self):
@@ -108,7 +108,7 @@ class ResumeAnalyzer:
         # 4. Generate & Store Embedding (Pinecone) - optional
         try:
             from app.services.embedding_service import EmbeddingService
-            from app.services.pinecone_service import PineconeService
+            from app.services.vector_writer import vector_writer
             
             embed_text = ""
             if ai_data:
@@ -121,8 +121,7 @@ class ResumeAnalyzer:
                 if embedding_service.api_key:
                     vector = await embedding_service.get_embedding(embed_text)
                     
-                    pinecone_service = PineconeService()
-                    pinecone_service.upsert_resume(
+                    vector_writer.enqueue_resume(
                         resume_id=resume.id,
                         embedding=vector,
                         metadata={
@@ -1,61 +1,217 @@
+import asyncio
 import logging
+import time
 import google.generativeai as genai
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from app.core.config import settings
+from app.infrastructure.cache.embedding_cache import EmbeddingCache, embedding_cache
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "models/text-embedding-004"
+
+
+class EmbeddingEngine:
+    """
+    Process-wide Gemini embedding client with micro-batching.
+
+    `embed()` queues a text and awaits its vector. Pending texts (per task type)
+    are sent as one batched `embed_content` request once `max_batch` are
+    waiting or `max_wait_ms` has passed since the first one. The synchronous
+    Gemini call runs in a thread, at most `max_concurrency` at a time, so the
+    event loop never blocks on the network round-trip.
+
+    With a `cache`, texts already embedded (same model, task type and
+    normalised text) are answered from it, and a text already waiting or in
+    flight shares that request instead of being sent twice.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = EMBEDDING_MODEL,
+        max_batch: int = 100,
+        max_wait_ms: float = 50.0,
+        max_concurrency: int = 4,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        self.api_key = api_key
+        self.cache = cache
+        self.model = model
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_concurrency = max(1, max_concurrency)
+        if self.api_key:
+            genai.configure(api_key=self.api_key)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, List[Tuple[str, str, asyncio.Future]]] = {}  # task_type -> (text, key, future)
+        self._waiting: Dict[str, asyncio.Future] = {}  # key -> future of a queued or in-flight text
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: set = set()
+        # Counters
+        self.texts = 0
+        self.sent = 0
+        self.requests = 0
+        self.failed_requests = 0
+        self.request_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.api_key)
+
+    async def embed(self, text: str, task_type: str = "retrieval_document") -> List[float]:
+        return (await self.embed_many([text], task_type))[0]
+
+    async def embed_many(self, texts: List[str], task_type: str = "retrieval_document") -> List[List[float]]:
+        """Vectors for `texts` in order; misses share batches with any concurrent callers."""
+        if not self.enabled:
+            raise ValueError("Gemini API Key not configured")
+        self._bind_loop()
+        texts = [t.replace("\n", " ") for t in texts]
+        keys = [EmbeddingCache.make_key(self.model, task_type, t) for t in texts]
+        self.texts += len(texts)
+        cached = await self.cache.get_many(keys) if self.cache is not None else [None] * len(texts)
+        results = [
+            vector if vector is not None else self._enqueue(text, key, task_type)
+            for text, key, vector in zip(texts, keys, cached)
+        ]
+        # Shielded: the future is shared, so one caller cancelling must not fail the rest
+        return [await asyncio.shield(r) if isinstance(r, asyncio.Future) else r for r in results]
+
+    def _enqueue(self, text: str, key: str, task_type: str) -> asyncio.Future:
+        future = self._waiting.get(key)
+        if future is not None:
+            return future
+        future = self._loop.create_future()
+        self._waiting[key] = future
+        future.add_done_callback(lambda _: self._waiting.pop(key, None))
+        pending = self._pending.setdefault(task_type, [])
+        pending.append((text, key, future))
+        if len(pending) >= self.max_batch:
+            self._flush(task_type)
+        elif task_type not in self._timers:
+            self._timers[task_type] = self._loop.call_later(self.max_wait, self._flush, task_type)
+        return future
+
+    def stats(self) -> dict:
+        return {
+            "texts": self.texts,
+            "sent": self.sent,
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "texts_per_request": round(self.sent / self.requests, 1) if self.requests else 0.0,
+            "avg_request_ms": round(1000 * self.request_seconds / self.requests, 1) if self.requests else 0.0,
+            "pending": sum(len(p) for p in self._pending.values()),
+            "inflight": len(self._inflight),
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures, timers and the semaphore belong to one loop (tests run one per case)
+            self._loop = loop
+            self._pending = {}
+            self._waiting = {}
+            self._timers = {}
+            self._inflight = set()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _flush(self, task_type: str):
+        timer = self._timers.pop(task_type, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(task_type, [])
+        for start in range(0, len(pending), self.max_batch):
+            task = self._loop.create_task(self._send(task_type, pending[start:start + self.max_batch]))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, task_type: str, items: List[Tuple[str, str, asyncio.Future]]):
+        texts = [text for text, _, _ in items]
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                vectors = await asyncio.to_thread(self._embed_batch, texts, task_type)
+                if len(vectors) != len(items):
+                    raise ValueError(f"Gemini returned {len(vectors)} embeddings for {len(items)} texts")
+            except Exception as e:
+                self.failed_requests += 1
+                logger.error(f"Error generating {len(texts)} embeddings: {e}")
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            finally:
+                self.requests += 1
+                self.sent += len(texts)
+                self.request_seconds += time.perf_counter() - started
+        if self.cache is not None:
+            # Stored before the callers resume, so a vector they got is always cached
+            try:
+                await self.cache.put_many([key for _, key, _ in items], vectors)
+            except Exception as e:
+                logger.warning(f"Could not cache {len(items)} embeddings: {e}")
+        for (_, _, future), vector in zip(items, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    def _embed_batch(self, texts: List[str], task_type: str) -> List[List[float]]:
+        """One blocking Gemini request for all `texts`."""
+        kwargs = {"title": "Embedding of text"} if task_type == "retrieval_document" else {}
+        result = genai.embed_content(model=self.model, content=texts, task_type=task_type, **kwargs)
+        return result["embedding"]
+
+
+def _build_default_engine(api_key: Optional[str] = None) -> EmbeddingEngine:
+    return EmbeddingEngine(
+        api_key=api_key or settings.GEMINI_API_KEY,
+        max_batch=settings.EMBEDDING_BATCH_SIZE,
+        max_wait_ms=settings.EMBEDDING_BATCH_WAIT_MS,
+        max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+        cache=embedding_cache,
+    )
+
+
+# Singleton instance for the app
+embedding_engine = _build_default_engine()
+
+_engines_by_key: Dict[str, EmbeddingEngine] = {}
+
+
+def get_engine(api_key: Optional[str]) -> EmbeddingEngine:
+    """The shared engine, or the one engine kept for a custom key (batching needs callers to share it)."""
+    if not api_key or api_key == embedding_engine.api_key:
+        return embedding_engine
+    engine = _engines_by_key.get(api_key)
+    if engine is None:
+        engine = _engines_by_key[api_key] = _build_default_engine(api_key)
+    return engine
+
+
 class EmbeddingService:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.GEMINI_API_KEY
         if not self.api_key:
             logger.warning("Gemini API Key not found. Embedding service will fail.")
-        else:
-            genai.configure(api_key=self.api_key)
+        # Engines batch across callers, so services with the same key share one
+        self.engine = get_engine(self.api_key)
 
     async def get_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for a single text using Gemini.
         Model: models/text-embedding-004
         """
-        if not self.api_key:
-            raise ValueError("Gemini API Key not configured")
-            
-        try:
-            # Clean text
-            text = text.replace("\n", " ")
-            
-            # Generate embedding
-            result = genai.embed_content(
-                model="models/text-embedding-004",
-                content=text,
-                task_type="retrieval_document",
-                title="Embedding of text"
-            )
-            
-            return result['embedding']
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
-            raise e
+        return await self.engine.embed(text, "retrieval_document")
+
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings for many documents, sent in as few batched requests as possible."""
+        return await self.engine.embed_many(texts, "retrieval_document")
 
     async def get_query_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for a query (search term).
         """
-        if not self.api_key:
-            raise ValueError("Gemini API Key not configured")
-
-        try:
-            # Clean text
-            text = text.replace("\n", " ")
-            
-            result = genai.embed_content(
-                model="models/text-embedding-004",
-                content=text,
-                task_type="retrieval_query"
-            )
-            
-            return result['embedding']
-        except Exception as e:
-            logger.error(f"Error generating query embedding: {e}")
-            raise e
+        return await self.engine.embed(text, "retrieval_query")
@@ -0,0 +1,192 @@
+"""
+Hybrid lexical + semantic job retrieval.
+
+    lexical  top-K job ids from the full-text index (app.crud.job_search)
+    semantic top-K job ids nearest to the query embedding (vector_store)
+          -> reciprocal-rank fusion -> visibility filters -> page -> Job rows
+
+Both retrievers return ids only; `Job` rows are loaded for the requested page
+alone. The semantic side runs concurrently with the lexical query and gets
+`semantic_timeout` seconds once the lexical ids are in; past that the page is
+served from the lexical ranking (the embedding still completes in the
+background and is cached for the next request). Without a Gemini key, or
+with an empty vector index, results are purely lexical.
+
+Each retriever returns its top max(`candidates`, offset + limit) ids, so
+`total` counts at least the first `candidates` and grows as pages go deeper.
+A page can be requested with `semantic=True/False` to rank the same way as a
+previous one (cursor pagination: positions are only stable if every page
+fuses the same rankings).
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import job_search
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HybridPage:
+    jobs: List[Job]
+    total: int     # visible fused candidates (at most `candidates`)
+    lexical: int   # ids returned by each retriever
+    semantic: int
+    semantic_used: bool = False  # the semantic ranking was fused (answered in time)
+    has_more: bool = False
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[int]], k: int = 60) -> List[int]:
+    """Ids ordered by sum(1 / (k + rank)) over the rankings; ties go to the newer id."""
+    scores: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, job_id in enumerate(ranking, start=1):
+            scores[job_id] = scores.get(job_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=lambda job_id: (-scores[job_id], -job_id))
+
+
+def visibility_filters(platform: Optional[str] = None, remote_only: bool = False) -> list:
+    """Active canonical jobs (one card per vacancy), optionally by platform / remote."""
+    filters = [Job.is_active == True, Job.canonical_job_id.is_(None)]
+    if platform:
+        filters.append(Job.source_platform == platform)
+    if remote_only:
+        filters.append(Job.is_remote == True)
+    return filters
+
+
+async def lexical_job_ids(db: AsyncSession, q: str, filters: list, k: int) -> List[int]:
+    """Top-k visible job ids for `q` from the full-text index, best match first."""
+    stmt, relevance = job_search.match(select(Job.id).where(*filters), job_search.dialect_of(db), q)
+    result = await db.execute(stmt.order_by(relevance.desc(), Job.id.desc()).limit(k))
+    return list(result.scalars().all())
+
+
+class HybridSearch:
+    def __init__(
+        self,
+        vector_store=None,
+        embedding_service=None,
+        candidates: int = 200,
+        rrf_k: int = 60,
+        semantic_timeout: float = 0.25,
+    ):
+        self._vector_store = vector_store
+        self._embedding_service = embedding_service
+        self.candidates = candidates
+        self.rrf_k = rrf_k
+        self.semantic_timeout = semantic_timeout
+        self._background: set = set()
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        *,
+        platform: Optional[str] = None,
+        remote_only: bool = False,
+        limit: int = 30,
+        offset: int = 0,
+        semantic: Optional[bool] = None,
+    ) -> HybridPage:
+        """
+        One page of fused results, `offset` into the ranking. `semantic` None
+        gives the semantic side `semantic_timeout`; True waits for it (the
+        embedding is cached by then) and False skips it, so later pages of a
+        listing rank exactly like its first one.
+        """
+        k = max(self.candidates, offset + limit)
+        filters = visibility_filters(platform, remote_only)
+
+        semantic_task = None
+        if semantic is not False:
+            semantic_task = asyncio.create_task(self._semantic_ids(q, k, platform, remote_only))
+            self._background.add(semantic_task)
+            semantic_task.add_done_callback(self._background.discard)
+        lexical = await lexical_job_ids(db, q, filters, k)
+        semantic_ids: List[int] = []
+        if semantic_task is not None:
+            try:
+                # Shielded: a late embedding is not cancelled, so it still lands in the cache
+                timeout = None if semantic else self.semantic_timeout
+                semantic_ids = await asyncio.wait_for(asyncio.shield(semantic_task), timeout)
+            except asyncio.TimeoutError:
+                logger.info(f"Hybrid search: semantic side over {self.semantic_timeout}s, serving lexical ranking")
+                semantic_task = None
+
+        # Vector hits can be inactive, cross-posts or outside the filters
+        visible = set(lexical)
+        unchecked = [job_id for job_id in semantic_ids if job_id not in visible]
+        if unchecked:
+            result = await db.execute(select(Job.id).where(Job.id.in_(unchecked), *filters))
+            visible.update(result.scalars().all())
+        ranked = [job_id for job_id in reciprocal_rank_fusion([lexical, semantic_ids], self.rrf_k) if job_id in visible]
+
+        page_ids = ranked[offset:offset + limit]
+        jobs = []
+        if page_ids:
+            result = await db.execute(select(Job).where(Job.id.in_(page_ids)))
+            by_id = {job.id: job for job in result.scalars().all()}
+            jobs = [by_id[job_id] for job_id in page_ids if job_id in by_id]
+        # A full page from a retriever that filled its k: it may hold more ids past the ones ranked
+        has_more = offset + limit < len(ranked) or (
+            len(page_ids) == limit and (len(lexical) == k or len(semantic_ids) == k)
+        )
+        return HybridPage(
+            jobs=jobs, total=len(ranked), lexical=len(lexical), semantic=len(semantic_ids),
+            semantic_used=semantic_task is not None, has_more=has_more,
+        )
+
+    async def _semantic_ids(self, q: str, k: int, platform: Optional[str], remote_only: bool) -> List[int]:
+        service = self._get_embedding_service()
+        if service is None:
+            return []
+        metadata_filter = {}
+        if remote_only:
+            metadata_filter["is_remote"] = True
+        if platform:
+            metadata_filter["source_platform"] = platform
+        try:
+            vector = await service.get_query_embedding(q)
+            matches = await asyncio.to_thread(self.vector_store.search_jobs, vector, k, metadata_filter or None)
+        except Exception as e:
+            logger.warning(f"Hybrid search: semantic side skipped: {e}")
+            return []
+        return [match["id"] for match in matches]
+
+    @property
+    def vector_store(self):
+        if self._vector_store is None:
+            from app.services.vector_store import vector_store
+            self._vector_store = vector_store
+        return self._vector_store
+
+    def _get_embedding_service(self):
+        if self._embedding_service is None:
+            try:
+                from app.services.embedding_service import EmbeddingService
+                service = EmbeddingService()
+            except Exception as e:
+                logger.warning(f"Hybrid search: embeddings unavailable: {e}")
+                service = None
+            self._embedding_service = service if service is not None and service.api_key else False
+        return self._embedding_service or None
+
+
+def _build_default_search() -> HybridSearch:
+    return HybridSearch(
+        candidates=settings.HYBRID_CANDIDATES,
+        rrf_k=settings.HYBRID_RRF_K,
+        semantic_timeout=settings.HYBRID_SEMANTIC_TIMEOUT_SECONDS,
+    )
+
+
+# Singleton instance for the app
+hybrid_search = _build_default_search()
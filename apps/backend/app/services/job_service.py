@@ -1,10 +1,19 @@
 import logging
 import asyncio
+import heapq
+import itertools
+from contextlib import aclosing
+from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 
 from app.services.jobsearch.base import BaseScraper
+from app.services.jobsearch.coalescer import search_coalescer
+from app.services.jobsearch.pipeline import JobIngestion
+from app.services.jobsearch.health import scraper_health
+from app.services.jobsearch import deadline as search_deadline
+from app.services.jobsearch.watermark import Watermark, load_watermarks, save_watermarks, watermark_scope
 from app.services.jobsearch.remoteok import RemoteOKScraper
 from app.services.jobsearch.jobspy_scraper import JobSpyScraper
 from app.services.jobsearch.adzuna import AdzunaScraper
@@ -21,11 +30,14 @@ from app.services.jobsearch.freela import FreelaScraper
 from app.services.jobsearch.cathoscraper import CathoScraper
 from app.services.jobsearch.models import ScrapedJob
 from app.models.job import Job
-from app.crud import job as crud_job
-from app.schemas.job import JobCreate
+from app.models.resume import Resume
+from app.services.scoring_service import ScoringService
 
 logger = logging.getLogger(__name__)
 
+# Sentinel a scraper stream puts on the queue when it is exhausted
+_STREAM_DONE = object()
+
 class JobService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -50,194 +62,150 @@ class JobService:
         self.scrapers.append(FreelaScraper())
         self.scrapers.append(CathoScraper())
 
-    async def search_and_save_jobs(self, query: str, limit: int = 200, user_for_scoring = None, max_saved_jobs: int = 100) -> List[Job]:
+    # Streaming ingestion tuning
+    STREAM_BATCH_SIZE = 25      # jobs per persistence micro-batch
+    STREAM_FLUSH_SECONDS = 1.0  # flush a partial batch after this much idle time
+    STREAM_QUEUE_SIZE = 500     # bounded hand-off between scrapers and persistence
+    SCRAPER_TIMEOUT = 25.0      # seconds per scraper stream
+    DEADLINE_PERSIST_RESERVE = 1.0  # of an overall deadline, seconds kept for the final flush
+    DEADLINE_GRACE = 0.5        # after the deadline, seconds scrapers get to hand back parsed jobs
+
+    async def search_and_save_jobs(self, query: str, limit: int = 200, user_for_scoring = None, max_saved_jobs: int = 100, deadline_seconds: Optional[float] = None, incremental: bool = False) -> List[Job]:
         """
         Search for jobs across ALL configured scrapers and save new ones to DB.
-        Runs scrapers concurrently (3 at a time via semaphore) for high throughput.
-        If user_for_scoring is provided, it will score the jobs in memory and only save the top `max_saved_jobs`.
+        Runs all scrapers concurrently; request pacing is enforced per host by the
+        shared rate limiter in BaseScraper.fetch, so fast APIs are not held back
+        by slow HTML sites.
+
+        Scrapers stream their results into a shared queue, and micro-batches go
+        through the staged ingestion pipeline (jobsearch/pipeline.py: dedup,
+        persist, embed, index) while slower scrapers are still running.
+        If user_for_scoring is provided, jobs are scored as they arrive and only the
+        top `max_saved_jobs` (kept in a bounded heap) are saved once all streams end.
+
+        deadline_seconds bounds the whole search. The deadline is passed down to
+        every scraper and into BaseScraper.fetch; once it passes, fetches stop
+        and the jobs already parsed are saved and returned.
+
+        incremental=True is for background crawls: each scraper's watermark for
+        this query is loaded, paginated scrapers stop at known items, and only
+        jobs not seen before are passed on (interactive searches keep it off so
+        users still see known jobs).
         """
-        all_scraped = []
-        
         # Higher limit per scraper for volume
         jobs_per_scraper = max(30, limit // max(1, len(self.scrapers)))
-        
-        # Semaphore to limit concurrent scrapers (avoid overwhelming network/IP)
-        sem = asyncio.Semaphore(3)
-        
-        async def run_with_semaphore(scraper):
-            async with sem:
-                name = type(scraper).__name__
-                try:
-                    logger.info(f"Fetching {jobs_per_scraper} jobs from {name} for '{query}'...")
-                    results = await self._run_scraper_safe(scraper, query, jobs_per_scraper)
-                    # Small delay after each scraper to avoid IP blocks
-                    await asyncio.sleep(2)
-                    return results
-                except Exception as e:
-                    logger.error(f"Error orchestrating {name}: {e}")
-                    return []
-        
-        # Run all scrapers concurrently (semaphore limits to 3 at a time)
-        tasks = [run_with_semaphore(s) for s in self.scrapers]
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results_list:
-            if isinstance(result, list):
-                all_scraped.extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Scraper task failed: {result}")
-        
-        logger.info(f"Total scraped jobs across all platforms: {len(all_scraped)}")
-        
-        if not all_scraped:
-            logger.info("No jobs found from scrapers. Adding seed jobs for testing.")
-            all_scraped = self._get_seed_jobs(query)
-            
-        # Score jobs in memory to save only the most relevant ones
-        if user_for_scoring:
-            from app.services.scoring_service import ScoringService
-            from sqlalchemy import select, desc
-            from app.models.resume import Resume
-            
-            # Get user's most recent analyzed resume completely independently
-            try:
-                stmt = select(Resume).where(
-                    Resume.user_id == user_for_scoring.id,
-                    Resume.is_analyzed == True
-                ).order_by(desc(Resume.analyzed_at)).limit(1)
-                result = await self.db.execute(stmt)
-                resume = result.scalars().first()
-            except Exception as e:
-                logger.warning(f"Could not load resume for scoring: {e}")
-                resume = None
-                
-            preferences = ScoringService.extract_skills_and_preferences(user_for_scoring, resume)
-            
-            # Score each scraped job
-            for job in all_scraped:
-                job.compatibility_score = ScoringService.calculate_score(job, preferences)
-                
-            # Sort descending by score
-            all_scraped.sort(key=lambda x: x.compatibility_score or 0, reverse=True)
-            
-            # Keep only the top `max_saved_jobs` to prevent DB bloat
-            all_scraped = all_scraped[:max_saved_jobs]
-            logger.info(f"Trimmed to top {len(all_scraped)} jobs based on user profile scoring.")
-            
-        # Save to database with deduplication
-        for scraped_job in all_scraped:
-            try:
-                # Deduplication check by external_id
-                existing_job = await crud_job.get_by_external_id(
-                    self.db, external_id=scraped_job.external_id
-                )
-                if existing_job:
-                    if user_for_scoring:
-                        try:
-                            from app.crud.user_job import user_job as crud_user_job
-                            score = getattr(scraped_job, "compatibility_score", None) or 0
-                            await crud_user_job.create_or_update(
-                                self.db,
-                                user_id=user_for_scoring.id,
-                                job_id=existing_job.id,
-                                score=score
-                            )
-                        except Exception as e:
-                            logger.warning(f"Could not update UserJob score for existing job {existing_job.id}: {e}")
-                    # Add to return list even if it already exists, so the frontend gets all results
-                    all_new_jobs.append(existing_job)
+
+        watermarks = await load_watermarks(self.db, query, self.scrapers) if incremental else {}
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        scrape_budget = None
+        if deadline_seconds is not None:
+            scrape_budget = max(0.0, deadline_seconds - self.DEADLINE_PERSIST_RESERVE)
+        # Tasks copy the context when created, so each producer inherits the deadline
+        with search_deadline.deadline_scope(scrape_budget):
+            producers = [
+                asyncio.create_task(self._stream_scraper_safe(
+                    s, query, jobs_per_scraper, queue, watermarks.get(type(s).__name__)
+                ))
+                for s in self.scrapers
+            ]
+
+        preferences = await self._load_scoring_preferences(user_for_scoring) if user_for_scoring else None
+        top_scored: List[tuple] = []  # min-heap of (score, seq, job) when scoring
+        seq = itertools.count()
+        seen_ids = set()
+
+        def admit(batch: List[ScrapedJob]) -> List[ScrapedJob]:
+            """Drop jobs already seen in this search; score them when a user is given."""
+            fresh = []
+            for job in batch:
+                if job.external_id in seen_ids:
                     continue
-                
-                # Extra deduplication by Title + Company to avoid overlapping sources
-                from sqlalchemy import select
-                existing_by_name = await self.db.execute(
-                    select(Job).where(
-                        Job.title == scraped_job.title, 
-                        Job.company == scraped_job.company
-                    )
-                )
-                existing_job_by_name = existing_by_name.scalars().first()
-                if existing_job_by_name:
-                    if user_for_scoring:
-                        try:
-                            from app.crud.user_job import user_job as crud_user_job
-                            score = getattr(scraped_job, "compatibility_score", None) or 0
-                            await crud_user_job.create_or_update(
-                                self.db,
-                                user_id=user_for_scoring.id,
-                                job_id=existing_job_by_name.id,
-                                score=score
-                            )
-                        except Exception as e:
-                            logger.warning(f"Could not update UserJob score for existing job {existing_job_by_name.id}: {e}")
-                    all_new_jobs.append(existing_job_by_name)
+                seen_ids.add(job.external_id)
+                if preferences is None:
+                    fresh.append(job)
                     continue
-                    
-                # Save new job
-                job_in = JobCreate(
-                    title=scraped_job.title,
-                    company=scraped_job.company,
-                    location=scraped_job.location,
-                    is_remote=scraped_job.is_remote,
-                    salary_min=scraped_job.salary_min,
-                    salary_max=scraped_job.salary_max,
-                    salary_currency=scraped_job.salary_currency,
-                    description=scraped_job.description,
-                    requirements=None,
-                    source_platform=scraped_job.source_platform,
-                    source_url=scraped_job.url,
-                    external_id=scraped_job.external_id,
-                    compatibility_score=getattr(scraped_job, "compatibility_score", None)
-                )
-                
-                new_job = await crud_job.create(self.db, obj_in=job_in)
+                job.compatibility_score = ScoringService.calculate_score(job, preferences)
+                entry = (job.compatibility_score or 0, next(seq), job)
+                if len(top_scored) < max_saved_jobs:
+                    heapq.heappush(top_scored, entry)
+                elif entry[0] > top_scored[0][0]:
+                    heapq.heapreplace(top_scored, entry)
+            return fresh
+
+        # fetch -> normalize (admit) -> dedup -> persist -> embed -> index -> score
+        ingestion = JobIngestion(self.db, name="search", admit=admit)
+        try:
+            saved_jobs = await ingestion.run(self._iter_batches(queue, len(producers)))
+        finally:
+            for task in producers:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+        ingestion.log_summary()
+        total_scraped = ingestion.scraped
+
+        logger.info(f"Total scraped jobs across all platforms: {total_scraped}")
+
+        if not total_scraped and not incremental:
+            logger.info("No jobs found from scrapers. Adding seed jobs for testing.")
+            saved_jobs.extend(await JobIngestion(self.db, name="search", admit=admit).run_jobs(self._get_seed_jobs(query)))
+
+        if preferences is not None:
+            ranked = [job for _, _, job in sorted(top_scored, key=lambda e: (-e[0], e[1]))]
+            logger.info(f"Trimmed to top {len(ranked)} jobs based on user profile scoring.")
+            saved_jobs = await JobIngestion(self.db, name="search_scored", user=user_for_scoring).run_jobs(ranked)
 
-                # Save user-specific score in the UserJob table
-                if user_for_scoring:
-                    try:
-                        from app.crud.user_job import user_job as crud_user_job
-                        score = getattr(scraped_job, "compatibility_score", None) or 0
-                        await crud_user_job.create_or_update(
-                            self.db,
-                            user_id=user_for_scoring.id,
-                            job_id=new_job.id,
-                            score=score
-                        )
-                    except Exception as e:
-                        logger.warning(f"Could not save UserJob score for job {new_job.id}: {e}")
+        if watermarks:
+            skipped = sum(w.skipped for w in watermarks.values())
+            logger.info(f"Incremental crawl: {skipped} already-known jobs skipped")
+            # Only jobs that were stored become known; the rest come back next crawl
+            stored_ids = {job.external_id for job in saved_jobs}
+            for watermark in watermarks.values():
+                watermark.confirm(stored_ids)
+            await save_watermarks(self.db, watermarks.values())
 
-                # Generate & Store Embedding (Pinecone) — optional
-                try:
-                    from app.services.embedding_service import EmbeddingService
-                    from app.services.pinecone_service import PineconeService
-                    
-                    embed_text = f"{new_job.title} {new_job.company} {new_job.description or ''}"
-                    
-                    embedding_service = EmbeddingService()
-                    if embedding_service.api_key:
-                        vector = await embedding_service.get_embedding(embed_text)
-                        
-                        pinecone_service = PineconeService()
-                        pinecone_service.upsert_job(
-                            job_id=new_job.id,
-                            embedding=vector,
-                            metadata={
-                                "title": new_job.title,
-                                "company": new_job.company,
-                                "location": new_job.location,
-                                "is_remote": new_job.is_remote
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Embedding/Pinecone skipped for job {new_job.id}: {e}")
-                
-                all_new_jobs.append(new_job)
-                    
-            except Exception as e:
-                logger.error(f"Error saving job '{scraped_job.title}': {e}")
-                
-        logger.info(f"Returning {len(all_new_jobs)} jobs for query '{query}'")
-        return all_new_jobs
+        logger.info(f"Returning {len(saved_jobs)} jobs for query '{query}'")
+        return saved_jobs
+
+    async def _load_scoring_preferences(self, user) -> dict:
+        """Build the scoring profile from the user and their most recent analyzed resume."""
+        try:
+            stmt = select(Resume).where(
+                Resume.user_id == user.id,
+                Resume.is_analyzed == True
+            ).order_by(desc(Resume.analyzed_at)).limit(1)
+            result = await self.db.execute(stmt)
+            resume = result.scalars().first()
+        except Exception as e:
+            logger.warning(f"Could not load resume for scoring: {e}")
+            resume = None
+        return ScoringService.extract_skills_and_preferences(user, resume)
+
+    async def _iter_batches(self, queue: asyncio.Queue, producer_count: int) -> AsyncIterator[List[ScrapedJob]]:
+        """
+        Merge the scraper streams into micro-batches. A batch is emitted when it
+        reaches STREAM_BATCH_SIZE or when no job arrived for STREAM_FLUSH_SECONDS.
+        """
+        batch: List[ScrapedJob] = []
+        finished = 0
+        while finished < producer_count:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=self.STREAM_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                if batch:
+                    yield batch
+                    batch = []
+                continue
+            if item is _STREAM_DONE:
+                finished += 1
+                continue
+            batch.append(item)
+            if len(batch) >= self.STREAM_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
     def _get_seed_jobs(self, query: str) -> List[ScrapedJob]:
         """Return some sample jobs if nothing was found, so the user can test the UI."""
@@ -266,20 +234,56 @@ class JobService:
             )
         ]
 
-    async def _run_scraper_safe(self, scraper: BaseScraper, query: str, limit: int) -> List[ScrapedJob]:
-        """Run a scraper with error handling — never crash the whole search."""
+    async def _stream_scraper_safe(self, scraper: BaseScraper, query: str, limit: int, queue: asyncio.Queue, watermark: Optional[Watermark] = None):
+        """
+        Feed one scraper's stream into the shared queue with error handling — never
+        crash the whole search. Always signals completion with _STREAM_DONE.
+        With a watermark, jobs it already knows are dropped and new ones recorded.
+        """
         scraper_name = type(scraper).__name__
+        timeout = self.SCRAPER_TIMEOUT
+        left = search_deadline.remaining()
+        if left is not None:
+            if left <= 0:
+                logger.info(f"{scraper_name}: search deadline already passed, skipping")
+                await queue.put(_STREAM_DONE)
+                return
+            timeout = min(timeout, left + self.DEADLINE_GRACE)
+        health = scraper_health.get(scraper_name)
+        if not health.allow():
+            logger.info(f"{scraper_name}: circuit open, skipping")
+            await queue.put(_STREAM_DONE)
+            return
+        count = 0
+        logger.info(f"Fetching {limit} jobs from {scraper_name} for '{query}'...")
         try:
-            # 25 seconds timeout to prevent hanging the entire process
-            results = await asyncio.wait_for(
-                scraper.search_jobs(query, limit=limit),
-                timeout=25.0
-            )
-            logger.info(f"{scraper_name}: returned {len(results)} results")
-            return results
-        except asyncio.TimeoutError:
-            logger.error(f"{scraper_name} timed out after 25 seconds.")
-            return []
+            async with health.track() as call:
+                # Timeout to prevent hanging the entire process; jobs already queued are kept
+                async with asyncio.timeout(timeout):
+                    # Identical concurrent searches (same scraper, query, limit) share one run;
+                    # incremental crawls return filtered results, so they get their own key
+                    key = search_coalescer.make_key(scraper_name, query, limit)
+                    if watermark is not None:
+                        key += ":incremental"
+                    source = call.source(lambda: scraper.search_jobs_stream(query, limit=limit))
+                    with watermark_scope(watermark):
+                        async with aclosing(search_coalescer.stream(key, source, limit)) as stream:
+                            async for job in stream:
+                                if watermark is not None:
+                                    if watermark.is_known(job):
+                                        watermark.skipped += 1
+                                        continue
+                                    watermark.observe(job)
+                                await queue.put(job)
+                                count += 1
+                                call.results = count
+                                if count >= limit:
+                                    break
+            logger.info(f"{scraper_name}: returned {count} results")
+        except asyncio.CancelledError:
+            raise
+        except TimeoutError:
+            logger.error(f"{scraper_name} timed out after {timeout:.1f} seconds ({count} results kept).")
         except Exception as e:
             logger.error(f"{scraper_name} failed: {e}")
-            return []
+        await queue.put(_STREAM_DONE)
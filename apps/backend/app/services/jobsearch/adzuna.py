@@ -1,7 +1,9 @@
 """Adzuna Scraper - Uses Adzuna REST API (requires API key)."""
 import logging
-from typing import List, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -11,6 +13,8 @@ logger = logging.getLogger(__name__)
 class AdzunaScraper(BaseScraper):
     PLATFORM_NAME = "adzuna"
     BASE_URL = "https://api.adzuna.com/v1/api/jobs"
+    PAGE_SIZE = 50
+    CACHE_TTL = 900.0  # metered API quota
     COUNTRIES = {"br": "Brazil", "us": "United States", "gb": "United Kingdom", "de": "Germany", "ca": "Canada"}
 
     def __init__(self):
@@ -26,27 +30,51 @@ class AdzunaScraper(BaseScraper):
         if not self.is_configured:
             logger.warning("AdzunaScraper: Not configured (missing API keys). Skipping.")
             return []
-        logger.info(f"AdzunaScraper: Searching for '{query}' in {country}")
         jobs = []
-        try:
-            url = f"{self.BASE_URL}/{country}/search/1"
-            params = {
-                "app_id": self.app_id, "app_key": self.app_key,
-                "results_per_page": min(limit, 50), "what": query,
-                "content-type": "application/json",
-            }
-            resp = await self.fetch(url, params=params, headers={"Accept": "application/json"})
-            data = resp.json()
-            for item in data.get("results", []):
+        async with aclosing(self.search_jobs_stream(query, limit=limit, country=country)) as stream:
+            async for job in stream:
+                jobs.append(job)
+        return jobs[:limit]
+
+    async def search_jobs_stream(self, query: str, limit: int = 10, country: str = "br") -> AsyncIterator[ScrapedJob]:
+        """Walk Adzuna's numbered result pages, yielding each page as it arrives (stops at the watermark)."""
+        if not self.is_configured:
+            return
+        logger.info(f"AdzunaScraper: Searching for '{query}' in {country}")
+        per_page = min(limit, self.PAGE_SIZE)
+        yielded = 0
+        page = 1
+        while yielded < limit:
+            try:
+                url = f"{self.BASE_URL}/{country}/search/{page}"
+                params = {
+                    "app_id": self.app_id, "app_key": self.app_key,
+                    "results_per_page": per_page, "what": query,
+                    "content-type": "application/json",
+                }
+                resp = await self.fetch(url, params=params, headers={"Accept": "application/json"})
+                results = resp.json().get("results", [])
+            except Exception as e:
+                logger.error(f"AdzunaScraper: failed on page {page}: {e}")
+                return
+            page_jobs = []
+            for item in results:
                 try:
                     job = self._parse_result(item, country)
-                    if job:
-                        jobs.append(job)
                 except Exception as e:
                     logger.warning(f"AdzunaScraper: parse error: {e}")
-        except Exception as e:
-            logger.error(f"AdzunaScraper: failed: {e}")
-        return jobs
+                    continue
+                if job:
+                    page_jobs.append(job)
+            fresh, reached_watermark = self._new_since_watermark(page_jobs)
+            for job in fresh:
+                yield job
+                yielded += 1
+                if yielded >= limit:
+                    return
+            if reached_watermark or len(results) < per_page:
+                return
+            page += 1
 
     def _parse_result(self, item: dict, country: str) -> Optional[ScrapedJob]:
         title = item.get("title", "").strip()
@@ -65,7 +93,7 @@ class AdzunaScraper(BaseScraper):
         location = ", ".join(location_parts) if location_parts else self.COUNTRIES.get(country, country)
         description = item.get("description", title)
         url = item.get("redirect_url", item.get("url", ""))
-        external_id = f"adzuna_{item.get('id', hash(url))}"
+        external_id = f"adzuna_{item.get('id', stable_hash(url))}"
         salary_min = salary_max = None
         try:
             if item.get("salary_min"):
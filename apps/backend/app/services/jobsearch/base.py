@@ -6,13 +6,32 @@ Features:
   - Automatic retry with exponential backoff (3 attempts)
   - Optional proxy support via settings.SCRAPER_PROXY_URL
   - Configurable timeouts
+  - Shared per-host connection pool (keep-alive / HTTP/2) across all scrapers
+  - Per-host adaptive rate limiting (token bucket, backs off on 429/403)
+  - On-disk response cache with ETag / Last-Modified revalidation (304s)
+  - Whole-feed sources are downloaded once per refresh interval and shared
+  - No retries while the scraper's circuit breaker is open or probing
+  - Honours the search deadline (caps timeouts, skips retries that can't finish)
+  - Incremental crawling: paginated scrapers stop at their watermark
 """
 import httpx
 import random
 import logging
 import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional, Tuple
+from app.infrastructure.http.client_pool import http_client_pool
+from app.infrastructure.http.response_cache import response_cache
+from app.infrastructure.http.rate_limiter import (
+    THROTTLE_STATUS_CODES,
+    parse_retry_after,
+    rate_limiter,
+)
+from app.services.jobsearch.feed_index import FeedIndex, feed_registry
+from app.services.jobsearch import deadline as search_deadline
+from app.services.jobsearch.health import BreakerState, scraper_health
+from app.services.jobsearch import watermark as watermarks
 from app.services.jobsearch.models import ScrapedJob
 
 logger = logging.getLogger(__name__)
@@ -48,7 +67,6 @@ def _build_stealth_headers(referer: str = "") -> dict:
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
         "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
         "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
         "Sec-Fetch-Dest": "document",
         "Sec-Fetch-Mode": "navigate",
@@ -70,24 +88,47 @@ class BaseScraper(ABC):
     """
     Abstract base class for all job scrapers.
     Provides a robust HTTP client via `self.fetch()` with retries,
-    stealth headers, and optional proxy support.
+    stealth headers, and optional proxy support. Connections come from
+    the process-wide `http_client_pool`, so they are reused across calls,
+    and every request waits for its host's token in `rate_limiter`.
+
+    Responses are cached on disk by `response_cache`. Within CACHE_TTL a
+    cached body is returned without touching the network; after that the
+    request is sent with the stored validators and a 304 reuses the body.
+    Set CACHE_TTL = None on a scraper to disable caching for it.
     """
 
     MAX_RETRIES = 3
     BASE_TIMEOUT = 20.0  # seconds
+    CACHE_TTL: Optional[float] = 240.0  # seconds a cached response is served without revalidation
+
+    # Feed sources return every open job in one document and filter locally.
+    # They implement `load_feed()`; queries are then answered by `search_feed()`
+    # from one shared index, refreshed at most every FEED_REFRESH_SECONDS.
+    IS_FEED_SOURCE = False
+    FEED_REFRESH_SECONDS = 300.0
+
+    # Whether posted_at is a real posting date; lets the watermark treat
+    # anything older than its newest item as already seen
+    WATERMARK_TRUSTS_POSTED_AT = False
 
     async def fetch(
         self,
         url: str,
         *,
+        method: str = "GET",
         params: dict = None,
+        json: dict = None,
         headers: dict = None,
         referer: str = "",
         timeout: float = None,
         json_response: bool = False,
+        use_cache: bool = True,
     ) -> httpx.Response:
         """
-        Fetch a URL with stealth headers, retries, and optional proxy.
+        Fetch a URL with stealth headers, retries, optional proxy and caching.
+        `method` / `json` send other requests (e.g. search APIs taking a POST
+        body) through the same pool, rate limiter and retries; only GETs are cached.
         Returns the httpx.Response object.
         Raises the last exception if all retries fail.
         """
@@ -95,6 +136,17 @@ class BaseScraper(ABC):
         if headers:
             stealth.update(headers)
 
+        cache_key = None
+        cached = None
+        if use_cache and method.upper() == "GET" and self.CACHE_TTL is not None and response_cache.enabled:
+            cache_key = response_cache.make_key("GET", url, params)
+            cached = await response_cache.get(cache_key, fresh_for=self.CACHE_TTL)
+            if cached and cached.age < self.CACHE_TTL:
+                return cached.to_response()
+            if cached:
+                stealth.update(cached.conditional_headers())
+                stealth.pop("Cache-Control", None)  # max-age=0 would defeat the validators on some CDNs
+
         proxy_url = None
         try:
             from app.core.config import settings
@@ -102,32 +154,68 @@ class BaseScraper(ABC):
         except Exception:
             pass
 
+        # A scraper whose circuit is not closed gets one attempt: don't sleep through backoff
+        health = scraper_health.get(type(self).__name__)
+        max_attempts = self.MAX_RETRIES if health.state == BreakerState.CLOSED else 1
+
         last_error = None
-        for attempt in range(1, self.MAX_RETRIES + 1):
+        for attempt in range(1, max_attempts + 1):
             try:
-                async with httpx.AsyncClient(
-                    proxy=proxy_url,
-                    timeout=timeout or self.BASE_TIMEOUT,
-                    follow_redirects=True,
-                ) as client:
-                    response = await client.get(url, params=params, headers=stealth)
-                    response.raise_for_status()
-                    return response
-
-            except (httpx.HTTPStatusError, httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout) as e:
+                await rate_limiter.acquire(url)
+                request_timeout = timeout or self.BASE_TIMEOUT
+                left = search_deadline.remaining()
+                if left is not None:
+                    if left <= 0:
+                        raise search_deadline.DeadlineExceeded(f"search deadline passed before fetching {url}")
+                    request_timeout = min(request_timeout, left)
+                client = http_client_pool.get_client(url, proxy=proxy_url)
+                response = await client.request(
+                    method, url, params=params, json=json, headers=stealth, timeout=request_timeout
+                )
+                if response.status_code == 304 and cached:
+                    rate_limiter.record_success(url)
+                    cached = await response_cache.refresh(cache_key, cached, response)
+                    return cached.to_response()
+                if response.status_code in THROTTLE_STATUS_CODES:
+                    rate_limiter.record_throttle(
+                        url, retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                response.raise_for_status()
+                rate_limiter.record_success(url)
+                if cache_key:
+                    await response_cache.store(cache_key, response)
+                return response
+
+            except (
+                httpx.HTTPStatusError,
+                httpx.ConnectError,
+                httpx.ReadTimeout,
+                httpx.ConnectTimeout,
+                httpx.RemoteProtocolError,  # server dropped an idle keep-alive connection
+            ) as e:
                 last_error = e
                 wait = 2 ** attempt + random.uniform(0, 1)
+                left = search_deadline.remaining()
+                if attempt >= max_attempts or (left is not None and left <= wait):
+                    logger.warning(f"{type(self).__name__}: giving up on {url} after {attempt} attempt(s): {e}")
+                    break
                 logger.warning(
-                    f"{type(self).__name__}: attempt {attempt}/{self.MAX_RETRIES} failed for {url}: {e}. "
+                    f"{type(self).__name__}: attempt {attempt}/{max_attempts} failed for {url}: {e}. "
                     f"Retrying in {wait:.1f}s..."
                 )
                 await asyncio.sleep(wait)
 
+            except search_deadline.DeadlineExceeded as e:
+                last_error = e
+                break
+
             except Exception as e:
                 last_error = e
                 logger.error(f"{type(self).__name__}: unexpected error on {url}: {e}")
                 break
 
+        if not search_deadline.expired():  # running out of budget is not the scraper's fault
+            health.record_fetch_error()
         raise last_error  # type: ignore
 
     async def fetch_json(self, url: str, *, params: dict = None, headers: dict = None, referer: str = "") -> dict:
@@ -140,6 +228,51 @@ class BaseScraper(ABC):
         """Search for jobs. Must be implemented by each scraper."""
         pass
 
+    async def search_jobs_stream(self, query: str, limit: int = 10) -> AsyncIterator[ScrapedJob]:
+        """
+        Yield jobs as soon as they are parsed, for `async for` consumers.
+        Default adapter: runs `search_jobs` and yields its results. Paginated
+        scrapers override this to yield page by page, and implement
+        `search_jobs` on top of it with `_collect_stream`.
+        """
+        for job in await self.search_jobs(query, limit=limit):
+            yield job
+
+    async def _collect_stream(self, query: str, limit: int) -> List[ScrapedJob]:
+        """Drain `search_jobs_stream` into a list (for scrapers that stream natively)."""
+        jobs = []
+        async with aclosing(self.search_jobs_stream(query, limit=limit)) as stream:
+            async for job in stream:
+                jobs.append(job)
+                if len(jobs) >= limit:
+                    break
+        return jobs
+
+    async def load_feed(self) -> List[ScrapedJob]:
+        """Download and parse the whole feed. Must be implemented by feed sources."""
+        raise NotImplementedError(f"{type(self).__name__} is not a feed source")
+
+    async def feed_index(self) -> FeedIndex:
+        """The shared, periodically refreshed index of this scraper's feed."""
+        return await feed_registry.get(self.PLATFORM_NAME, self.load_feed, self.FEED_REFRESH_SECONDS)
+
+    async def search_feed(self, query: str, limit: int) -> List[ScrapedJob]:
+        """Answer a query from the shared feed index (no download if it is fresh)."""
+        index = await self.feed_index()
+        return index.search(query, limit)
+
+    def _new_since_watermark(self, page: List[ScrapedJob]) -> Tuple[List[ScrapedJob], bool]:
+        """
+        Split a parsed page against the current crawl's watermark.
+        Returns (jobs not seen before, whether to stop paging). Paging stops once
+        a non-empty page is entirely known; with no watermark nothing is filtered.
+        """
+        watermark = watermarks.current()
+        if watermark is None:
+            return page, False
+        fresh = [job for job in page if not watermark.is_known(job)]
+        return fresh, bool(page) and not fresh
+
     async def get_job_details(self, job_url: str) -> Optional[ScrapedJob]:
         """Optional: Fetch full details for a specific job URL."""
         return None
@@ -1,9 +1,10 @@
 """Catho Scraper - Uses Catho's internal search API (JSON)."""
 import logging
 import json
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup
+from app.core.fingerprint import stable_hash
+from app.infrastructure.parsing.html_parser import make_soup, parse_executor
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -14,122 +15,161 @@ class CathoScraper(BaseScraper):
     PLATFORM_NAME = "catho"
     # Catho's SPA uses an internal GraphQL/REST API
     SEARCH_URL = "https://www.catho.com.br/vagas"
+    API_URL = "https://api-vagas.catho.com.br/v2/vagas"
+    PAGE_SIZE = 50
 
     async def search_jobs(self, query: str, limit: int = 20) -> List[ScrapedJob]:
-        logger.info(f"CathoScraper: Searching for '{query}'")
-        jobs = []
+        jobs = await self._collect_stream(query, limit)
+        logger.info(f"CathoScraper: returning {len(jobs)} jobs")
+        return jobs
 
-        try:
-            # Try Catho's internal API first (their SPA uses this)
-            api_url = "https://api-vagas.catho.com.br/v2/vagas"
-            params = {"q": query, "page": 1, "order": "relevancia", "tamanhoPagina": min(limit, 50)}
-            headers = {
-                "Accept": "application/json",
-                "Origin": "https://www.catho.com.br",
-            }
+    async def search_jobs_stream(self, query: str, limit: int = 20) -> AsyncIterator[ScrapedJob]:
+        """
+        Page through Catho's internal API (their SPA uses this), yielding each page.
+        Falls back to HTML scraping when the API yields nothing; stops at the watermark.
+        """
+        logger.info(f"CathoScraper: Searching for '{query}'")
+        yielded = 0
+        page = 1
+        page_size = min(limit, self.PAGE_SIZE)
+        headers = {
+            "Accept": "application/json",
+            "Origin": "https://www.catho.com.br",
+        }
+        while yielded < limit:
+            params = {"q": query, "page": page, "order": "relevancia", "tamanhoPagina": page_size}
             try:
-                resp = await self.fetch(api_url, params=params, headers=headers, referer="https://www.catho.com.br/vagas/")
+                resp = await self.fetch(self.API_URL, params=params, headers=headers, referer="https://www.catho.com.br/vagas/")
                 data = resp.json()
-                items = data.get("vagas", data.get("data", data.get("results", [])))
-                if isinstance(items, dict):
-                    items = items.get("vagas", items.get("data", []))
-                for item in (items or [])[:limit]:
-                    try:
-                        title = item.get("cargo", item.get("titulo", item.get("title", "N/A")))
-                        company = item.get("empresa", item.get("company", "Confidencial"))
-                        if isinstance(company, dict):
-                            company = company.get("nome", company.get("name", "Confidencial"))
-                        location = item.get("cidade", item.get("localizacao", "Brasil"))
-                        if isinstance(location, dict):
-                            location = location.get("nome", "Brasil")
-                        is_remote = item.get("homeOffice", False) or "remoto" in str(location).lower()
-                        desc = item.get("descricao", item.get("description", ""))
-                        slug = item.get("id", item.get("idVaga", ""))
-                        job_url = item.get("url", f"https://www.catho.com.br/vagas/{slug}")
-                        external_id = f"catho_{slug or hash(job_url)}"
-                        salary_min = item.get("salarioMinimo", item.get("faixaSalarial", {}).get("minimo"))
-                        salary_max = item.get("salarioMaximo", item.get("faixaSalarial", {}).get("maximo"))
-                        try:
-                            salary_min = int(float(salary_min)) if salary_min else None
-                            salary_max = int(float(salary_max)) if salary_max else None
-                        except (ValueError, TypeError):
-                            salary_min = salary_max = None
-                        jobs.append(ScrapedJob(
-                            title=title, company=str(company), location=str(location),
-                            is_remote=is_remote, salary_min=salary_min, salary_max=salary_max,
-                            salary_currency="BRL", description=str(desc)[:3000],
-                            url=job_url, external_id=external_id,
-                            source_platform=self.PLATFORM_NAME, posted_at=datetime.utcnow(),
-                            technologies=[],
-                        ))
-                    except Exception as e:
-                        logger.warning(f"CathoScraper: parse error: {e}")
-                if jobs:
-                    logger.info(f"CathoScraper (API): found {len(jobs)} results")
-                    return jobs
             except Exception as e:
-                logger.info(f"CathoScraper: API failed ({e}), trying HTML")
+                logger.info(f"CathoScraper: API failed on page {page} ({e})")
+                break
+            items = data.get("vagas", data.get("data", data.get("results", [])))
+            if isinstance(items, dict):
+                items = items.get("vagas", items.get("data", []))
+            items = items or []
+            page_jobs = [job for job in (self._parse_api_item(item) for item in items) if job]
+            fresh, reached_watermark = self._new_since_watermark(page_jobs)
+            for job in fresh:
+                yield job
+                yielded += 1
+                if yielded >= limit:
+                    return
+            if reached_watermark:
+                logger.info(f"CathoScraper: reached watermark on page {page}")
+                return
+            if len(items) < page_size:
+                break
+            page += 1
 
-            # Fallback to HTML scraping
-            url = f"{self.SEARCH_URL}/?q={query}"
-            resp = await self.fetch(url, referer="https://www.catho.com.br/")
-            soup = BeautifulSoup(resp.text, "html.parser")
+        if yielded:
+            logger.info(f"CathoScraper (API): found {yielded} results")
+            return
 
-            # Try __NEXT_DATA__ first (if Catho uses Next.js)
-            script = soup.find("script", id="__NEXT_DATA__")
-            if script:
-                try:
-                    next_data = json.loads(script.string)
-                    page_props = next_data.get("props", {}).get("pageProps", {})
-                    items = page_props.get("jobs", page_props.get("vagas", []))
-                    for item in (items or [])[:limit]:
-                        title = item.get("cargo", item.get("title", "N/A"))
-                        company = item.get("empresa", "Confidencial")
-                        if isinstance(company, dict):
-                            company = company.get("nome", "Confidencial")
-                        job_url = item.get("url", "")
-                        external_id = f"catho_{item.get('id', hash(job_url))}"
-                        jobs.append(ScrapedJob(
-                            title=title, company=str(company), location="Brasil",
-                            is_remote=False, description="",
-                            url=job_url, external_id=external_id,
-                            source_platform=self.PLATFORM_NAME, posted_at=datetime.utcnow(),
-                            technologies=[],
-                        ))
-                    if jobs:
-                        logger.info(f"CathoScraper (__NEXT_DATA__): found {len(jobs)} results")
-                        return jobs
-                except Exception:
-                    pass
+        for job in await self._search_html(query, limit):
+            yield job
 
-            # Broad HTML parsing
-            job_cards = soup.select("article, li[class*='job'], div[class*='job-card'], div[class*='vaga']")
-            for card in job_cards[:limit]:
-                try:
-                    title_el = card.select_one("h2, h3, a[class*='title']")
-                    if not title_el:
-                        continue
-                    title = title_el.get_text(strip=True)
-                    if not title or len(title) < 3:
-                        continue
-                    link = card.select_one("a[href]")
-                    href = link["href"] if link else ""
-                    job_url = href if href.startswith("http") else f"https://www.catho.com.br{href}"
-                    company_el = card.select_one("[class*='company'], [class*='empresa']")
-                    company = company_el.get_text(strip=True) if company_el else "Confidencial"
-                    external_id = f"catho_{hash(job_url)}"
-                    jobs.append(ScrapedJob(
-                        title=title, company=company, location="Brasil",
-                        is_remote="remoto" in card.get_text().lower(),
-                        description=card.get_text(strip=True)[:300],
-                        url=job_url, external_id=external_id,
-                        source_platform=self.PLATFORM_NAME, posted_at=datetime.utcnow(),
-                        technologies=[],
-                    ))
-                except Exception:
-                    pass
+    def _parse_api_item(self, item: dict) -> Optional[ScrapedJob]:
+        try:
+            title = item.get("cargo", item.get("titulo", item.get("title", "N/A")))
+            company = item.get("empresa", item.get("company", "Confidencial"))
+            if isinstance(company, dict):
+                company = company.get("nome", company.get("name", "Confidencial"))
+            location = item.get("cidade", item.get("localizacao", "Brasil"))
+            if isinstance(location, dict):
+                location = location.get("nome", "Brasil")
+            is_remote = item.get("homeOffice", False) or "remoto" in str(location).lower()
+            desc = item.get("descricao", item.get("description", ""))
+            slug = item.get("id", item.get("idVaga", ""))
+            job_url = item.get("url", f"https://www.catho.com.br/vagas/{slug}")
+            external_id = f"catho_{slug or stable_hash(job_url)}"
+            salary_min = item.get("salarioMinimo", item.get("faixaSalarial", {}).get("minimo"))
+            salary_max = item.get("salarioMaximo", item.get("faixaSalarial", {}).get("maximo"))
+            try:
+                salary_min = int(float(salary_min)) if salary_min else None
+                salary_max = int(float(salary_max)) if salary_max else None
+            except (ValueError, TypeError):
+                salary_min = salary_max = None
+            return ScrapedJob(
+                title=title, company=str(company), location=str(location),
+                is_remote=is_remote, salary_min=salary_min, salary_max=salary_max,
+                salary_currency="BRL", description=str(desc)[:3000],
+                url=job_url, external_id=external_id,
+                source_platform=self.PLATFORM_NAME, posted_at=datetime.utcnow(),
+                technologies=[],
+            )
+        except Exception as e:
+            logger.warning(f"CathoScraper: parse error: {e}")
+            return None
 
+    async def _search_html(self, query: str, limit: int) -> List[ScrapedJob]:
+        """Fallback: scrape the public search page (__NEXT_DATA__ first, then job cards)."""
+        jobs = []
+        try:
+            url = f"{self.SEARCH_URL}/?q={query}"
+            resp = await self.fetch(url, referer="https://www.catho.com.br/")
+            jobs = await parse_executor.run(parse_search_page, resp.text, limit)
         except Exception as e:
             logger.error(f"CathoScraper: failed: {e}")
-        logger.info(f"CathoScraper: returning {len(jobs)} jobs")
         return jobs
+
+
+def parse_search_page(html: str, limit: int) -> List[ScrapedJob]:
+    """Parse Catho's public search page (runs in the parse pool)."""
+    platform = CathoScraper.PLATFORM_NAME
+    jobs = []
+    soup = make_soup(html)
+
+    # Try __NEXT_DATA__ first (if Catho uses Next.js)
+    script = soup.find("script", id="__NEXT_DATA__")
+    if script:
+        try:
+            next_data = json.loads(script.string)
+            page_props = next_data.get("props", {}).get("pageProps", {})
+            items = page_props.get("jobs", page_props.get("vagas", []))
+            for item in (items or [])[:limit]:
+                title = item.get("cargo", item.get("title", "N/A"))
+                company = item.get("empresa", "Confidencial")
+                if isinstance(company, dict):
+                    company = company.get("nome", "Confidencial")
+                job_url = item.get("url", "")
+                external_id = f"catho_{item.get('id', stable_hash(job_url))}"
+                jobs.append(ScrapedJob(
+                    title=title, company=str(company), location="Brasil",
+                    is_remote=False, description="",
+                    url=job_url, external_id=external_id,
+                    source_platform=platform, posted_at=datetime.utcnow(),
+                    technologies=[],
+                ))
+            if jobs:
+                return jobs
+        except Exception:
+            pass
+
+    # Broad HTML parsing
+    job_cards = soup.select("article, li[class*='job'], div[class*='job-card'], div[class*='vaga']")
+    for card in job_cards[:limit]:
+        try:
+            title_el = card.select_one("h2, h3, a[class*='title']")
+            if not title_el:
+                continue
+            title = title_el.get_text(strip=True)
+            if not title or len(title) < 3:
+                continue
+            link = card.select_one("a[href]")
+            href = link["href"] if link else ""
+            job_url = href if href.startswith("http") else f"https://www.catho.com.br{href}"
+            company_el = card.select_one("[class*='company'], [class*='empresa']")
+            company = company_el.get_text(strip=True) if company_el else "Confidencial"
+            external_id = f"catho_{stable_hash(job_url)}"
+            jobs.append(ScrapedJob(
+                title=title, company=company, location="Brasil",
+                is_remote="remoto" in card.get_text().lower(),
+                description=card.get_text(strip=True)[:300],
+                url=job_url, external_id=external_id,
+                source_platform=platform, posted_at=datetime.utcnow(),
+                technologies=[],
+            ))
+        except Exception:
+            pass
+    return jobs
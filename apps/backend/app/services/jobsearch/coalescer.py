@@ -0,0 +1,239 @@
+"""
+Single-flight coalescing of identical scraper searches.
+
+When two callers (two users, or the spider and a user) run the same scraper
+for the same query at the same time, only the first one (the leader) hits the
+network. Concurrent followers await the leader's in-flight future, and a
+completed result is memoized for a short TTL.
+
+The key is (scraper, normalized query, limit). Coalescing is always done
+in-process; with SEARCH_COALESCE_BACKEND="redis" the memo and a leader lock
+are also shared across workers through REDIS_URL.
+"""
+import asyncio
+import json
+import logging
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from app.services.jobsearch.models import ScrapedJob
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+class MemoryCoalesceStore:
+    """In-memory stand-in for the shared store (tests, single-process setups)."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, float]] = {}
+
+    def _live(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._live(key)
+
+    async def set(self, key: str, value: str, ttl: float):
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        """SET NX semantics: True if the lock was free and is now ours."""
+        if self._live(key) is not None:
+            return False
+        self._data[key] = ("1", time.monotonic() + ttl)
+        return True
+
+    async def release(self, key: str):
+        self._data.pop(key, None)
+
+
+class RedisCoalesceStore:
+    """Shared store on Redis, so coalescing also spans worker processes."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: str, ttl: float):
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        return bool(await self._redis.set(key, "1", nx=True, px=int(ttl * 1000)))
+
+    async def release(self, key: str):
+        await self._redis.delete(key)
+
+
+class SearchCoalescer:
+    """
+    Wraps a scraper stream so identical concurrent searches share one run.
+    The leader streams jobs to its caller as they arrive; followers get the
+    leader's full (or, if it timed out, partial) result when it finishes.
+    """
+
+    POLL_INTERVAL = 0.25  # seconds between checks while another worker leads
+
+    def __init__(self, memo_ttl: float = 60.0, lock_ttl: float = 30.0, store=None):
+        self.memo_ttl = memo_ttl
+        self.lock_ttl = lock_ttl
+        self.store = store
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._memo: Dict[str, Tuple[List[ScrapedJob], float]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(scraper_name: str, query: str, limit: int) -> str:
+        return f"{scraper_name}:{normalize_query(query)}:{limit}"
+
+    def _check_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:  # futures are loop-bound
+            self._inflight = {}
+            self._loop = loop
+
+    def _memo_get(self, key: str) -> Optional[List[ScrapedJob]]:
+        item = self._memo.get(key)
+        if item is None:
+            return None
+        jobs, expires_at = item
+        if time.monotonic() >= expires_at:
+            del self._memo[key]
+            return None
+        return jobs
+
+    async def stream(
+        self,
+        key: str,
+        source: Callable[[], AsyncIterator[ScrapedJob]],
+        limit: int,
+    ) -> AsyncIterator[ScrapedJob]:
+        """Yield the jobs for `key`, running `source()` only if nobody else is."""
+        self._check_loop()
+
+        jobs = self._memo_get(key)
+        if jobs is None and key in self._inflight:
+            self.coalesced += 1
+            # shield: a follower timing out must not cancel the leader's future
+            jobs = await asyncio.shield(self._inflight[key])
+        if jobs is not None:
+            for job in jobs:
+                yield job.model_copy()  # callers mutate jobs (scoring)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        collected: List[ScrapedJob] = []
+        complete = False
+        ran_here = False
+        try:
+            if self.store is not None:
+                remote = await self._await_remote_leader(key)
+                if remote is not None:
+                    collected, complete = remote, True
+                    for job in remote:
+                        yield job.model_copy()
+                    return
+            ran_here = True
+            async with aclosing(source()) as jobs_stream:
+                async for job in jobs_stream:
+                    # Share a copy: the leader's caller mutates the job it gets (scoring)
+                    collected.append(job.model_copy())
+                    yield job
+                    if len(collected) >= limit:
+                        break
+            complete = True
+        finally:
+            # A consumer that stops after `limit` jobs still counts as a full result
+            complete = complete or len(collected) >= limit
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if not future.done():
+                future.set_result(list(collected))
+            if complete:
+                self._memo[key] = (list(collected), time.monotonic() + self.memo_ttl)
+            if self.store is not None and ran_here:
+                await self._publish(key, collected if complete else None)
+
+    async def collect(
+        self,
+        key: str,
+        source: Callable[[], AsyncIterator[ScrapedJob]],
+        limit: int,
+    ) -> List[ScrapedJob]:
+        """`stream()` drained into a list, for callers that don't consume incrementally."""
+        jobs = []
+        async with aclosing(self.stream(key, source, limit)) as jobs_stream:
+            async for job in jobs_stream:
+                jobs.append(job)
+        return jobs
+
+    async def _await_remote_leader(self, key: str) -> Optional[List[ScrapedJob]]:
+        """
+        Use another worker's memoized result, or wait for the worker holding the
+        lock. Returns None when this worker should run the search itself (with
+        the lock acquired where possible).
+        """
+        try:
+            deadline = time.monotonic() + self.lock_ttl
+            while True:
+                cached = await self.store.get(f"coalesce:result:{key}")
+                if cached is not None:
+                    self.coalesced += 1
+                    return [ScrapedJob.model_validate(item) for item in json.loads(cached)]
+                if await self.store.acquire(f"coalesce:lock:{key}", self.lock_ttl):
+                    return None
+                if time.monotonic() >= deadline:
+                    return None
+                await asyncio.sleep(self.POLL_INTERVAL)
+        except Exception as e:
+            logger.warning(f"SearchCoalescer: shared store unavailable ({e}), running locally")
+            return None
+
+    async def _publish(self, key: str, jobs: Optional[List[ScrapedJob]]):
+        try:
+            if jobs is not None:
+                payload = json.dumps([job.model_dump(mode="json") for job in jobs])
+                await self.store.set(f"coalesce:result:{key}", payload, self.memo_ttl)
+            await self.store.release(f"coalesce:lock:{key}")
+        except Exception as e:
+            logger.warning(f"SearchCoalescer: could not publish result for {key}: {e}")
+
+    def clear(self):
+        self._memo.clear()
+
+
+def _build_default_coalescer() -> SearchCoalescer:
+    from app.core.config import settings
+
+    store = None
+    if settings.SEARCH_COALESCE_BACKEND == "redis":
+        try:
+            store = RedisCoalesceStore(settings.REDIS_URL)
+        except Exception as e:
+            logger.warning(f"SearchCoalescer: Redis backend unavailable ({e}), using in-process only")
+    return SearchCoalescer(
+        memo_ttl=settings.SEARCH_COALESCE_MEMO_SECONDS,
+        lock_ttl=settings.SEARCH_COALESCE_LOCK_SECONDS,
+        store=store,
+    )
+
+
+# Singleton instance for the app
+search_coalescer = _build_default_coalescer()
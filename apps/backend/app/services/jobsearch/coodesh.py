@@ -4,6 +4,7 @@ import json
 from typing import List
 from datetime import datetime
 from bs4 import BeautifulSoup
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -54,7 +55,7 @@ class CoodeshScraper(BaseScraper):
                                                     is_remote=item.get("remote", True),
                                                     description=str(item.get("description", ""))[:3000],
                                                     url=job_url,
-                                                    external_id=f"coodesh_{item.get('id', hash(job_url))}",
+                                                    external_id=f"coodesh_{item.get('id', stable_hash(job_url))}",
                                                     source_platform=self.PLATFORM_NAME,
                                                     posted_at=datetime.utcnow(), technologies=[],
                                                 ))
@@ -87,7 +88,7 @@ class CoodeshScraper(BaseScraper):
                                 jobs.append(ScrapedJob(
                                     title=title, company="Coodesh", location="Remoto",
                                     is_remote=True, description="", url=job_url,
-                                    external_id=f"coodesh_{hash(job_url)}",
+                                    external_id=f"coodesh_{stable_hash(job_url)}",
                                     source_platform=self.PLATFORM_NAME,
                                     posted_at=datetime.utcnow(), technologies=[],
                                 ))
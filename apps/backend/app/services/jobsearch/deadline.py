@@ -0,0 +1,49 @@
+"""
+Request-scoped deadline for the scraper fan-out.
+
+`JobService.search_and_save_jobs(deadline_seconds=...)` opens a
+`deadline_scope`; the deadline lives in a ContextVar, so every scraper task
+created inside the scope inherits it. `BaseScraper.fetch` reads it to cap
+request timeouts and to stop retrying, which makes scrapers return the jobs
+they have already parsed instead of being cancelled with them.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("scrape_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised by fetch when the search deadline has already passed."""
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """Set an absolute deadline `seconds` from now (None = no deadline). Nested scopes only tighten it."""
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + max(0.0, seconds)
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None when there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
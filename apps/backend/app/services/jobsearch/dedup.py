@@ -0,0 +1,66 @@
+"""
+Set-based deduplication of a batch of candidate job rows before insert.
+
+Rows are the dicts written by crud.job.bulk_upsert (see ScrapedJob.to_job_row).
+A row is a duplicate when it shares its external_id, fingerprint (see
+app.core.fingerprint), source URL hash or (title, company) with:
+
+  - an earlier row of the same batch (dropped), or
+  - a stored job (resolved to that Job).
+
+The DB side costs one query per key type for the whole batch
+(crud.job.find_existing) instead of one or two SELECTs per job.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from app.core.fingerprint import job_fingerprint, url_hash
+from app.crud.job import job as crud_job
+from app.models.job import Job
+
+
+@dataclass
+class DedupResult:
+    new: List[int] = field(default_factory=list)            # row indexes to insert
+    existing: Dict[int, Job] = field(default_factory=dict)  # row index -> stored duplicate
+    in_batch: List[int] = field(default_factory=list)       # rows repeating an earlier row
+
+    @property
+    def duplicates(self) -> int:
+        return len(self.existing) + len(self.in_batch)
+
+
+def _keys(row: dict) -> set:
+    keys = {("external_id", row.get("external_id"))}
+    if row.get("fingerprint") is not None:
+        keys.add(("fingerprint", row["fingerprint"]))
+    if row.get("source_url_hash") is not None:
+        keys.add(("url", row["source_url_hash"]))
+    if row.get("title") and row.get("company"):
+        keys.add(("name", row["title"], row["company"]))
+    return keys
+
+
+async def dedupe_rows(db, rows: List[dict]) -> DedupResult:
+    result = DedupResult()
+    seen = set()
+    candidates = []
+    for i, row in enumerate(rows):
+        if "source_url_hash" not in row:
+            row["source_url_hash"] = url_hash(row.get("source_url"))
+        if row.get("fingerprint") is None:
+            row["fingerprint"] = job_fingerprint(row.get("source_url"), row.get("title"), row.get("company"), row.get("location"))
+        keys = _keys(row)
+        if keys & seen:
+            result.in_batch.append(i)
+            continue
+        seen |= keys
+        candidates.append(i)
+
+    matches = await crud_job.find_existing(db, [rows[i] for i in candidates])
+    for i, match in zip(candidates, matches):
+        if match is None:
+            result.new.append(i)
+        else:
+            result.existing[i] = match
+    return result
@@ -3,6 +3,7 @@ import logging
 from typing import List, Optional
 from datetime import datetime
 
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -46,20 +47,17 @@ class ExaScraper(BaseScraper):
             }
             
             logger.info(f"ExaScraper: Executing semantic search for '{semantic_query}'")
-            import httpx
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, json=payload, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self.fetch(url, method="POST", json=payload, headers=headers, timeout=30.0)
+            data = resp.json()
                 
             results = data.get("results", [])
             
-            for index, item in enumerate(results):
+            for item in results:
                 title = item.get("title") or "Unknown Job Listing"
                 link = item.get("url") or ""
                 text = item.get("text") or ""
                 author = item.get("author") or "Exa Semantic Search"
-                ext_id = item.get("id") or f"exa_{index}_{hash(link)}"
+                ext_id = item.get("id") or f"exa_{stable_hash(link)}"
                 
                 # Exa results can be generic links, so we'll parse them roughly
                 job = ScrapedJob(
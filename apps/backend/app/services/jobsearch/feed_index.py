@@ -0,0 +1,150 @@
+"""
+Shared in-memory index for whole-feed sources (RemoteOK, WeWorkRemotely).
+
+Feed sources return every open job in one document and we filter locally, so
+running N queries used to download the same feed N times. `feed_registry`
+keeps one parsed `FeedIndex` per platform, refreshed at most once per
+`FEED_REFRESH_SECONDS`, and every query is answered from it.
+"""
+import asyncio
+import logging
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from app.services.jobsearch.models import ScrapedJob
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[^\W_][\w+#.]*")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping '+', '#' and '.' so c++, c# and node.js survive."""
+    return [t.rstrip(".") for t in _TOKEN_RE.findall((text or "").lower())]
+
+
+class FeedIndex:
+    """
+    Parsed feed with an inverted index over tokens.
+    Title, company and tags form the primary index; the (HTML-stripped)
+    description is a secondary index that only adds weaker matches.
+    Query terms match any indexed token they are a prefix of, which keeps
+    the old substring behaviour ("dev" finds "developer").
+    """
+
+    def __init__(self, jobs: List[ScrapedJob]):
+        self.jobs = jobs
+        self.loaded_at = time.monotonic()
+        self._primary: Dict[str, Set[int]] = defaultdict(set)
+        self._secondary: Dict[str, Set[int]] = defaultdict(set)
+        for i, job in enumerate(jobs):
+            tags = " ".join(job.technologies or [])
+            for token in tokenize(f"{job.title} {job.company} {tags}"):
+                self._primary[token].add(i)
+            for token in tokenize(_TAG_RE.sub(" ", job.description or "")):
+                self._secondary[token].add(i)
+        self._vocab = sorted(set(self._primary) | set(self._secondary))
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def _expand(self, term: str) -> List[str]:
+        start = bisect_left(self._vocab, term)
+        matches = []
+        for token in self._vocab[start:]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def search(self, query: str, limit: int) -> List[ScrapedJob]:
+        """Jobs matching any query term, best first (title/tag hits outrank description hits)."""
+        terms = set(tokenize(query))
+        if not terms:
+            return self.latest(limit)
+
+        scores: Dict[int, int] = defaultdict(int)
+        for term in terms:
+            primary: Set[int] = set()
+            secondary: Set[int] = set()
+            for token in self._expand(term):
+                primary |= self._primary.get(token, set())
+                secondary |= self._secondary.get(token, set())
+            for i in primary:
+                scores[i] += 2
+            for i in secondary - primary:
+                scores[i] += 1
+
+        ranked = sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+        # Copies, so per-query mutation (e.g. scoring) never leaks into the shared index
+        return [self.jobs[i].model_copy() for i in ranked]
+
+    def latest(self, limit: int) -> List[ScrapedJob]:
+        return [job.model_copy() for job in self.jobs[:limit]]
+
+
+class FeedRegistry:
+    """
+    One FeedIndex per feed key, with single-flight refresh: concurrent queries
+    that find the index stale wait for one download instead of each starting
+    their own. If a refresh fails, the previous index keeps serving.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[str, FeedIndex] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _lock(self, key: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:  # asyncio.Lock is loop-bound
+            self._locks = {}
+            self._loop = loop
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    async def get(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[List[ScrapedJob]]],
+        max_age: float,
+    ) -> FeedIndex:
+        index = self._indexes.get(key)
+        if index is not None and index.age < max_age:
+            return index
+
+        async with self._lock(key):
+            index = self._indexes.get(key)
+            if index is not None and index.age < max_age:
+                return index  # another query refreshed it while we waited
+            try:
+                jobs = await loader()
+            except Exception as e:
+                if index is None:
+                    raise
+                logger.warning(f"FeedRegistry: refresh of '{key}' failed ({e}), serving stale index")
+                index.loaded_at = time.monotonic()  # don't retry the download on every query
+                return index
+            index = FeedIndex(jobs)
+            self._indexes[key] = index
+            logger.info(f"FeedRegistry: indexed {len(index)} jobs for '{key}'")
+            return index
+
+    def invalidate(self, key: Optional[str] = None):
+        if key is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(key, None)
+
+
+# Singleton instance for the app
+feed_registry = FeedRegistry()
@@ -3,6 +3,7 @@ import logging
 from typing import List, Optional
 from datetime import datetime
 
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -47,12 +48,8 @@ class FirecrawlJobScraper(BaseScraper):
             }
             
             logger.info(f"FirecrawlJobScraper: Scraping '{target_url}'")
-            # Note: We do not use self.fetch() because we want to send a POST payload here.
-            import httpx
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(api_url, json=payload, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self.fetch(api_url, method="POST", json=payload, headers=headers, timeout=30.0)
+            data = resp.json()
                 
             # Firecrawl returns markdown content by default
             markdown = data.get("data", {}).get("markdown", "")
@@ -68,7 +65,7 @@ class FirecrawlJobScraper(BaseScraper):
             title = ""
             company = "Firecrawl Scraped"
             
-            for i, line in enumerate(lines[:min(len(lines), limit * 10)]): # rough boundary
+            for line in lines[:min(len(lines), limit * 10)]: # rough boundary
                 if "python" in line.lower() or "developer" in line.lower() or "engineer" in line.lower():
                     title = line.strip("#").strip()
                     job = ScrapedJob(
@@ -78,7 +75,7 @@ class FirecrawlJobScraper(BaseScraper):
                          is_remote=True,
                          description=f"Extracted snippet: {line}",
                          url=target_url,
-                         external_id=f"firecrawl_{i}_{hash(line)}",
+                         external_id=f"firecrawl_{stable_hash(line)}",
                          source_platform="firecrawl",
                          posted_at=datetime.utcnow()
                     )
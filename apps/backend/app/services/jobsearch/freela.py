@@ -3,6 +3,7 @@ import logging
 from typing import List
 from datetime import datetime
 from bs4 import BeautifulSoup
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -58,7 +59,7 @@ class FreelaScraper(BaseScraper):
                         desc_el = parent.select_one("p, [class*='description'], [class*='descricao']")
                         if desc_el:
                             desc = desc_el.get_text(strip=True)
-                    external_id = f"99freelas_{hash(job_url)}"
+                    external_id = f"99freelas_{stable_hash(job_url)}"
                     jobs.append(ScrapedJob(
                         title=title, company="Cliente 99Freelas",
                         location="Remoto (Freelance)", is_remote=True,
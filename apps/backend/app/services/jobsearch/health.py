@@ -0,0 +1,245 @@
+"""
+Per-scraper circuit breaker and health scoreboard.
+
+Each scraper class gets a `ScraperHealth` tracking its recent outcomes and
+latencies. The breaker follows the usual three states:
+
+  - closed:    calls run normally; when the failure/timeout rate over the last
+               SCRAPER_BREAKER_WINDOW calls reaches SCRAPER_BREAKER_FAILURE_RATE
+               the circuit opens.
+  - open:      calls are skipped instantly for `open_seconds`.
+  - half_open: one probe call is let through; success closes the circuit,
+               failure re-opens it with the open period doubled (capped).
+
+A call that returns nothing after its fetches failed counts as a failure too,
+since most scrapers swallow their own HTTP errors and return []. The call in
+progress lives in a ContextVar, so `BaseScraper.fetch` charges its errors to
+that call rather than to whichever searches share the scraper class.
+
+Results served by the search coalescer (a follower of another run, or its
+memo) are not recorded: they say nothing about the scraper's latency.
+"""
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+from app.services.jobsearch import deadline as search_deadline
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Call:
+    """Handle yielded by `ScraperHealth.track()`; set `results` as jobs arrive."""
+
+    def __init__(self, health: "ScraperHealth"):
+        self.health = health
+        self.results = 0
+        self.fetch_errors = 0
+        self.ran = True
+
+    def source(self, make_stream: Callable):
+        """
+        Wrap a coalescer source so the call is only recorded if the source
+        actually runs here, not when the coalescer serves someone else's result.
+        """
+        self.ran = False
+
+        def run():
+            self.ran = True
+            return make_stream()
+
+        return run
+
+
+_current_call: ContextVar[Optional[_Call]] = ContextVar("scraper_call", default=None)
+
+
+class ScraperHealth:
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        failure_rate: float = 0.5,
+        min_calls: int = 4,
+        open_seconds: float = 60.0,
+        max_open_seconds: float = 900.0,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate
+        self.min_calls = min_calls
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+
+        self.state = BreakerState.CLOSED
+        self.open_seconds = open_seconds
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+        self._outcomes: deque = deque(maxlen=window)   # True = success
+        self._latencies: deque = deque(maxlen=window * 5)
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.fetch_errors = 0
+
+    # -- breaker ------------------------------------------------------------
+
+    def allow(self) -> bool:
+        """Whether a call may run now. Counts skipped calls."""
+        if self.state == BreakerState.OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+            self.state = BreakerState.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == BreakerState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            logger.info(f"Circuit {self.name}: half-open, sending probe")
+            return True
+        if self.state == BreakerState.CLOSED:
+            return True
+        self.skipped += 1
+        return False
+
+    def _open(self):
+        self.state = BreakerState.OPEN
+        self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+        logger.warning(f"Circuit {self.name}: OPEN for {self.open_seconds:.0f}s")
+
+    def record(self, ok: bool, latency: float, timed_out: bool = False):
+        self.calls += 1
+        self._latencies.append(latency)
+        self._outcomes.append(ok)
+        if not ok:
+            self.failures += 1
+        if timed_out:
+            self.timeouts += 1
+
+        if self.state == BreakerState.HALF_OPEN:
+            if ok:
+                logger.info(f"Circuit {self.name}: probe succeeded, closing")
+                self.state = BreakerState.CLOSED
+                self.open_seconds = self.base_open_seconds
+                self._outcomes.clear()
+                self._probe_in_flight = False
+            else:
+                self.open_seconds = min(self.open_seconds * 2, self.max_open_seconds)
+                self._open()
+        elif self.state == BreakerState.CLOSED and not ok:
+            if len(self._outcomes) >= self.min_calls and self.failure_rate >= self.failure_rate_threshold:
+                self._open()
+
+    def record_fetch_error(self):
+        """A fetch gave up; charged to the call in progress (see `track()`)."""
+        self.fetch_errors += 1
+        call = _current_call.get()
+        if call is not None and call.health is self:
+            call.fetch_errors += 1
+
+    def release_probe(self):
+        """A probe was cancelled before it finished; let the next call probe instead."""
+        self._probe_in_flight = False
+
+    @asynccontextmanager
+    async def track(self):
+        """Time a call and record its outcome (exceptions and timeouts are failures)."""
+        call = _Call(self)
+        token = _current_call.set(call)
+        start = time.monotonic()
+        try:
+            yield call
+        except TimeoutError:
+            if search_deadline.expired() or not call.ran:
+                self.release_probe()  # cut off by the caller's overall deadline: no verdict
+            else:
+                self.record(False, time.monotonic() - start, timed_out=True)
+            raise
+        except Exception:
+            if call.ran:
+                self.record(False, time.monotonic() - start)
+            else:
+                self.release_probe()
+            raise
+        except BaseException:  # cancelled: no verdict on the scraper
+            self.release_probe()
+            raise
+        else:
+            if call.ran:
+                failed_silently = call.results == 0 and call.fetch_errors > 0
+                self.record(not failed_silently, time.monotonic() - start)
+            else:
+                self.release_probe()  # served by the coalescer: no verdict
+        finally:
+            _current_call.reset(token)
+
+    # -- scoreboard ---------------------------------------------------------
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok in self._outcomes if not ok) / len(self._outcomes)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        idx = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    def snapshot(self) -> dict:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "scraper": self.name,
+            "state": self.state.value,
+            "failure_rate": round(self.failure_rate, 3),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "open_seconds": self.open_seconds if self.state != BreakerState.CLOSED else None,
+        }
+
+
+class ScraperHealthBoard:
+    """Registry of ScraperHealth, one per scraper class name."""
+
+    def __init__(self):
+        self._health: Dict[str, ScraperHealth] = {}
+
+    def get(self, name: str) -> ScraperHealth:
+        health = self._health.get(name)
+        if health is None:
+            from app.core.config import settings
+
+            health = ScraperHealth(
+                name,
+                window=settings.SCRAPER_BREAKER_WINDOW,
+                failure_rate=settings.SCRAPER_BREAKER_FAILURE_RATE,
+                min_calls=settings.SCRAPER_BREAKER_MIN_CALLS,
+                open_seconds=settings.SCRAPER_BREAKER_OPEN_SECONDS,
+                max_open_seconds=settings.SCRAPER_BREAKER_MAX_OPEN_SECONDS,
+            )
+            self._health[name] = health
+        return health
+
+    def snapshot(self) -> List[dict]:
+        return [self._health[name].snapshot() for name in sorted(self._health)]
+
+    def reset(self):
+        self._health.clear()
+
+
+# Singleton instance for the app
+scraper_health = ScraperHealthBoard()
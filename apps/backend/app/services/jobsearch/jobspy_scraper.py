@@ -1,8 +1,10 @@
 """JobSpy Scraper - Uses python-jobspy library (LinkedIn, Indeed, Glassdoor, etc.)."""
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from datetime import datetime
+from app.services.jobsearch import deadline as search_deadline
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -13,89 +15,117 @@ class JobSpyScraper(BaseScraper):
     PLATFORM_NAME = "jobspy"
     PLATFORMS = ["indeed", "linkedin", "glassdoor", "google", "zip_recruiter"]
 
+    # One worker per platform; kept apart from the default executor so slow
+    # JobSpy calls don't starve other asyncio.to_thread users.
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if JobSpyScraper._executor is None:
+            JobSpyScraper._executor = ThreadPoolExecutor(
+                max_workers=len(cls.PLATFORMS), thread_name_prefix="jobspy",
+            )
+        return JobSpyScraper._executor
+
     async def search_jobs(self, query: str, limit: int = 10, location: str = "Brazil") -> List[ScrapedJob]:
         logger.info(f"JobSpyScraper: Searching for '{query}' across {self.PLATFORMS}")
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        tasks = {
+            loop.run_in_executor(executor, self._scrape_platform, platform, query, limit, location): platform
+            for platform in self.PLATFORMS
+        }
+        # Platforms still running when the search deadline hits are dropped (their
+        # threads finish in the background); the finished ones are kept.
         try:
-            results = await asyncio.to_thread(self._scrape_sync, query, limit, location)
-            logger.info(f"JobSpyScraper: Found {len(results)} jobs")
-            return results
-        except Exception as e:
-            logger.error(f"JobSpyScraper: failed: {e}")
-            return []
+            done, pending = await asyncio.wait(tasks, timeout=search_deadline.remaining())
+        finally:
+            for future in tasks:
+                future.cancel()
+        for future in pending:
+            logger.warning(f"JobSpyScraper: {tasks[future]} did not finish before the deadline")
 
-    def _scrape_sync(self, query: str, limit: int, location: str) -> List[ScrapedJob]:
-        from jobspy import scrape_jobs
-        from app.core.config import settings
         jobs = []
-        for platform in self.PLATFORMS:
+        for future in done:
             try:
-                logger.info(f"JobSpyScraper: Scraping {platform}...")
-                proxies = [settings.SCRAPER_PROXY_URL] if settings.SCRAPER_PROXY_URL else None
-                df = scrape_jobs(
-                    site_name=[platform], search_term=query, location=location,
-                    results_wanted=min(limit, 15), hours_old=72,
-                    country_indeed="Brazil" if platform == "indeed" else None,
-                    proxies=proxies,
-                )
-                if df is None or df.empty:
-                    continue
-                for _, row in df.iterrows():
-                    try:
-                        job = self._row_to_scraped_job(row, platform)
-                        if job:
-                            jobs.append(job)
-                    except Exception as e:
-                        logger.warning(f"JobSpyScraper: parse row error ({platform}): {e}")
-                logger.info(f"JobSpyScraper: Got {len(df)} results from {platform}")
+                jobs.extend(future.result())
             except Exception as e:
-                logger.warning(f"JobSpyScraper: Platform {platform} failed: {e}")
+                logger.warning(f"JobSpyScraper: Platform {tasks[future]} failed: {e}")
+        logger.info(f"JobSpyScraper: Found {len(jobs)} jobs")
         return jobs
 
-    def _row_to_scraped_job(self, row, platform: str) -> Optional[ScrapedJob]:
-        title = str(row.get("title", "")).strip()
-        company = str(row.get("company_name", row.get("company", ""))).strip()
-        if not title or not company or title == "nan" or company == "nan":
-            return None
-        job_url = str(row.get("job_url", row.get("link", "")))
-        external_id = f"{platform}_{hash(job_url)}"
-        location = str(row.get("location", ""))
-        if location == "nan":
-            location = ""
-        is_remote = bool(row.get("is_remote", False))
-        if not is_remote:
-            is_remote = "remote" in location.lower() or "remoto" in location.lower()
-        salary_min = salary_max = None
-        try:
-            sal_min = row.get("min_amount", row.get("salary_min"))
-            sal_max = row.get("max_amount", row.get("salary_max"))
-            if sal_min and str(sal_min) != "nan":
-                salary_min = int(float(sal_min))
-            if sal_max and str(sal_max) != "nan":
-                salary_max = int(float(sal_max))
-        except (ValueError, TypeError):
-            pass
-        salary_currency = str(row.get("currency", "BRL"))
-        if salary_currency == "nan":
-            salary_currency = "BRL"
-        description = str(row.get("description", ""))
-        if description == "nan":
-            description = title
-        posted_at = None
-        try:
-            date_val = row.get("date_posted")
-            if date_val and str(date_val) not in ("nan", "NaT"):
-                posted_at = date_val if isinstance(date_val, datetime) else datetime.fromisoformat(str(date_val))
-        except Exception:
-            pass
-        job_type = str(row.get("job_type", ""))
-        if job_type == "nan":
-            job_type = ""
-        return ScrapedJob(
-            title=title, company=company,
-            location=location or "Not specified", is_remote=is_remote,
-            salary_min=salary_min, salary_max=salary_max, salary_currency=salary_currency,
-            description=description[:5000],
-            url=job_url if job_url != "nan" else "",
-            external_id=external_id, source_platform=platform,
-            posted_at=posted_at, employment_type=job_type, technologies=[],
+    def _scrape_platform(self, platform: str, query: str, limit: int, location: str) -> List[ScrapedJob]:
+        from jobspy import scrape_jobs
+        from app.core.config import settings
+
+        logger.info(f"JobSpyScraper: Scraping {platform}...")
+        proxies = [settings.SCRAPER_PROXY_URL] if settings.SCRAPER_PROXY_URL else None
+        df = scrape_jobs(
+            site_name=[platform], search_term=query, location=location,
+            results_wanted=min(limit, 15), hours_old=72,
+            country_indeed="Brazil" if platform == "indeed" else None,
+            proxies=proxies,
         )
+        if df is None or df.empty:
+            return []
+        jobs = self._frame_to_jobs(df, platform)
+        logger.info(f"JobSpyScraper: Got {len(df)} results from {platform}")
+        return jobs
+
+    @staticmethod
+    def _frame_to_jobs(df, platform: str) -> List[ScrapedJob]:
+        """Convert a JobSpy DataFrame column-wise, then build one ScrapedJob per record."""
+        import pandas as pd
+
+        def column(*names) -> "pd.Series":
+            for name in names:
+                if name in df.columns:
+                    return df[name]
+            return pd.Series(None, index=df.index, dtype=object)
+
+        def text(*names) -> "pd.Series":
+            values = column(*names)
+            return values.where(values.notna(), "").astype(str).str.strip()
+
+        def amounts(*names) -> "pd.Series":
+            values = pd.to_numeric(column(*names), errors="coerce").to_numpy()
+            # object dtype keeps ints and None (a numeric column would turn None back into NaN)
+            return pd.Series([int(v) if v == v and v else None for v in values], index=df.index, dtype=object)
+
+        title = text("title")
+        company = text("company_name", "company")
+        location = text("location")
+        description = text("description")
+        currency = text("currency")
+        posted = pd.to_datetime(column("date_posted"), errors="coerce")
+
+        frame = pd.DataFrame({
+            "title": title,
+            "company": company,
+            "location": location.where(location != "", "Not specified"),
+            "is_remote": (
+                column("is_remote").fillna(False).astype(bool)
+                | location.str.lower().str.contains("remote|remoto", regex=True)
+            ),
+            "salary_min": amounts("min_amount", "salary_min"),
+            "salary_max": amounts("max_amount", "salary_max"),
+            "salary_currency": currency.where(currency != "", "BRL"),
+            "description": description.where(description != "", title).str.slice(0, 5000),
+            "url": text("job_url", "link"),
+            "posted_at": posted.astype(object).where(posted.notna(), None),
+            "employment_type": text("job_type"),
+        }, index=df.index)
+        frame = frame[(title != "") & (company != "")]
+
+        jobs = []
+        for record in frame.to_dict("records"):
+            try:
+                if record["posted_at"] is not None:
+                    record["posted_at"] = record["posted_at"].to_pydatetime()
+                jobs.append(ScrapedJob(
+                    **record, external_id=f"{platform}_{stable_hash(record['url'])}",
+                    source_platform=platform, technologies=[],
+                ))
+            except Exception as e:
+                logger.warning(f"JobSpyScraper: parse row error ({platform}): {e}")
+        return jobs
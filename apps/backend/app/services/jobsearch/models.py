@@ -2,6 +2,8 @@ from pydantic import BaseModel, HttpUrl
 from typing import Optional, List
 from datetime import datetime
 
+from app.core.fingerprint import job_fingerprint, url_hash
+
 class ScrapedJob(BaseModel):
     """
     Standardized job data structure returned by all scrapers.
@@ -28,3 +30,28 @@ class ScrapedJob(BaseModel):
     
     # Internal score generated during search
     compatibility_score: Optional[float] = None
+
+    @property
+    def fingerprint(self) -> int:
+        """Stable 64-bit fingerprint of the canonical URL, title, company and location."""
+        return job_fingerprint(self.url, self.title, self.company, self.location)
+
+    def to_job_row(self) -> dict:
+        """Column values for a `jobs` row (see crud.job.bulk_upsert); per-user scores are kept out."""
+        return {
+            "external_id": self.external_id,
+            "fingerprint": self.fingerprint,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "is_remote": self.is_remote,
+            "salary_min": self.salary_min,
+            "salary_max": self.salary_max,
+            "salary_currency": self.salary_currency,
+            "description": self.description,
+            "source_platform": self.source_platform,
+            "source_url": self.url,
+            "source_url_hash": url_hash(self.url),
+            "posted_date": self.posted_at,
+            "is_active": True,
+        }
@@ -0,0 +1,108 @@
+"""
+Cross-source near-duplicate clustering (MinHash + LSH, see app.core.minhash).
+
+Runs after new jobs are written: each job gets its signature and band buckets
+stored, and when a bucket-sharing job is similar enough the new job is linked
+to the oldest copy through Job.canonical_job_id. Read paths show only
+canonical jobs (canonical_job_id IS NULL), so one vacancy is one card.
+
+Cost per batch: one query to load the jobs, one for candidate buckets, one
+for candidate signatures, then the writes, whatever the batch size.
+"""
+import logging
+from typing import Dict, Iterable, List
+
+from sqlalchemy import bindparam, delete, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import minhash
+from app.models.job import Job
+from app.models.job_lsh_bucket import JobLshBucket
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_THRESHOLD = 0.7
+CHUNK_SIZE = 500  # keys per IN (...) list
+
+
+def _chunks(items: list, size: int = CHUNK_SIZE) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def link_near_duplicates(db: AsyncSession, job_ids: List[int]) -> Dict[int, int]:
+    """
+    Sign, bucket and cluster `job_ids`. Returns {job_id: canonical_job_id} for
+    the jobs found to duplicate an older one. Commits once.
+    """
+    job_ids = sorted(set(job_ids))
+    if not job_ids:
+        return {}
+
+    jobs = []
+    for chunk in _chunks(job_ids):
+        result = await db.execute(
+            select(Job.id, Job.title, Job.company, Job.description).where(Job.id.in_(chunk))
+        )
+        jobs.extend(result.all())
+    jobs.sort(key=lambda j: j.id)
+    signatures = {j.id: minhash.signature(minhash.job_text(j.title, j.company, j.description)) for j in jobs}
+    buckets = {job_id: minhash.band_buckets(sig) for job_id, sig in signatures.items()}
+
+    # Stored jobs sharing any bucket with the batch
+    batch = set(signatures)
+    pairs = list({(band, bucket) for bs in buckets.values() for band, bucket in enumerate(bs)})
+    by_bucket: Dict[tuple, set] = {}
+    for chunk in _chunks(pairs):
+        result = await db.execute(
+            select(JobLshBucket.job_id, JobLshBucket.band, JobLshBucket.bucket)
+            .where(tuple_(JobLshBucket.band, JobLshBucket.bucket).in_(chunk))
+        )
+        for job_id, band, bucket in result.all():
+            if job_id not in batch:
+                by_bucket.setdefault((band, bucket), set()).add(job_id)
+
+    candidate_ids = sorted(set().union(*by_bucket.values())) if by_bucket else []
+    stored = {}  # job_id -> (signature, canonical id)
+    for chunk in _chunks(candidate_ids):
+        result = await db.execute(
+            select(Job.id, Job.minhash, Job.canonical_job_id).where(Job.id.in_(chunk), Job.minhash.isnot(None))
+        )
+        for job_id, data, canonical_id in result.all():
+            stored[job_id] = (minhash.from_bytes(data), canonical_id or job_id)
+
+    # Oldest first, so earlier jobs of the batch are candidates for later ones
+    links: Dict[int, int] = {}
+    for j in jobs:
+        sig = signatures[j.id]
+        candidates = set()
+        for band, bucket in enumerate(buckets[j.id]):
+            candidates |= by_bucket.get((band, bucket), set())
+        roots = [
+            stored[c][1] for c in candidates
+            if c in stored and stored[c][1] < j.id and minhash.similarity(sig, stored[c][0]) >= SIMILARITY_THRESHOLD
+        ]
+        if roots:
+            links[j.id] = min(roots)
+        for band, bucket in enumerate(buckets[j.id]):
+            by_bucket.setdefault((band, bucket), set()).add(j.id)
+        stored[j.id] = (sig, links.get(j.id, j.id))
+
+    for chunk in _chunks(job_ids):
+        await db.execute(delete(JobLshBucket).where(JobLshBucket.job_id.in_(chunk)))
+    await db.execute(insert(JobLshBucket), [
+        {"job_id": job_id, "band": band, "bucket": bucket}
+        for job_id, bs in buckets.items() for band, bucket in enumerate(bs)
+    ])
+    await db.execute(
+        update(Job.__table__).where(Job.__table__.c.id == bindparam("job_id"))
+        .values(minhash=bindparam("sig"), canonical_job_id=bindparam("canonical_id")),
+        [
+            {"job_id": job_id, "sig": minhash.to_bytes(sig), "canonical_id": links.get(job_id)}
+            for job_id, sig in signatures.items()
+        ],
+    )
+    await db.commit()
+    if links:
+        logger.info(f"Linked {len(links)}/{len(jobs)} new jobs to an existing vacancy")
+    return links
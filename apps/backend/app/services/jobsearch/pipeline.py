@@ -0,0 +1,423 @@
+"""
+Staged job ingestion pipeline.
+
+    fetch -> normalize -> dedup -> persist -> embed -> index -> score
+
+Each stage has its own workers and reads micro-batches from a bounded
+asyncio.Queue. A full queue makes the stage before it wait (ultimately the
+scrapers), so memory stays bounded, and a slow stage such as Gemini embeddings
+no longer holds up the DB writes of the next batch. The index stage only hands
+vectors to the write-behind vector_writer.
+
+  - Pipeline / Stage: generic runner; per-stage batches, items in/out, errors,
+    busy time, throughput and queue depth (StageStats).
+  - JobIngestion:     the job stages, shared by JobService and
+                      scripts/run_spider_local.py.
+  - ingestion_stats:  last run of each named pipeline (GET /stats/pipeline).
+
+The DB stages use the caller's AsyncSession, which cannot run two statements
+at once, so they run one worker each and take turns on a lock. A rollback on
+that session expires every Job it holds, so the stages after persist get
+plain values (StoredJob) read under the lock, never Job instances.
+"""
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.job import job as crud_job
+from app.crud.user_job import user_job as crud_user_job
+from app.models.job import Job
+from app.services.jobsearch.dedup import DedupResult, dedupe_rows
+from app.services.jobsearch.models import ScrapedJob
+from app.services.jobsearch.near_dup import link_near_duplicates
+from app.services.vector_writer import vector_writer
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    batches: int = 0
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue: Optional[asyncio.Queue] = field(default=None, repr=False)  # the stage's inbox
+
+    def snapshot(self, elapsed: float) -> dict:
+        return {
+            "workers": self.workers,
+            "batches": self.batches,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items_out / elapsed, 2) if elapsed > 0 else 0.0,
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[[Any], Awaitable[Optional[Any]]]  # returns the item to pass on, or None to drop it
+    workers: int = 1
+
+
+class Pipeline:
+    def __init__(self, name: str, source_name: str, stages: List[Stage], queue_size: int = 8):
+        self.name = name
+        self.stages = stages
+        self.queue_size = queue_size
+        self.stats = {source_name: StageStats(source_name, workers=1)}
+        self.stats.update({s.name: StageStats(s.name, workers=max(1, s.workers)) for s in stages})
+        self._source_stats = self.stats[source_name]
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    async def run(self, source: AsyncIterable[Any]) -> List[Any]:
+        """Push every item of `source` through the stages; returns the last stage's outputs."""
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        for stage, queue in zip(self.stages, queues):
+            self.stats[stage.name].queue = queue
+        results: List[Any] = []
+        self.started_at = time.perf_counter()
+        tasks = [asyncio.create_task(self._feed(source, queues[0]))]
+        for i, stage in enumerate(self.stages):
+            outbox = queues[i + 1] if i + 1 < len(queues) else None
+            tasks.append(asyncio.create_task(self._run_stage(stage, queues[i], outbox, results)))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.finished_at = time.perf_counter()
+            ingestion_stats.record(self)
+        return results
+
+    def snapshot(self) -> dict:
+        if self.started_at is None:
+            return {"name": self.name, "elapsed_seconds": 0.0, "stages": {}}
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        return {
+            "name": self.name,
+            "running": self.finished_at is None,
+            "elapsed_seconds": round(elapsed, 3),
+            "stages": {name: s.snapshot(elapsed) for name, s in self.stats.items()},
+        }
+
+    async def _put(self, queue: asyncio.Queue, item: Any, stats: StageStats):
+        await queue.put(item)
+        stats.max_queue_depth = max(stats.max_queue_depth, queue.qsize())
+
+    async def _feed(self, source: AsyncIterable[Any], outbox: asyncio.Queue):
+        stats = self._source_stats
+        downstream = self.stats[self.stages[0].name]
+        waited = time.perf_counter()
+        async for item in source:
+            stats.busy_seconds += time.perf_counter() - waited
+            stats.batches += 1
+            stats.items_out += len(item)
+            await self._put(outbox, item, downstream)
+            waited = time.perf_counter()
+        await outbox.put(_DONE)
+
+    async def _run_stage(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue], results: List[Any]):
+        stats = self.stats[stage.name]
+        downstream = self.stats[self.stages[self.stages.index(stage) + 1].name] if outbox is not None else None
+
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    await inbox.put(_DONE)  # let the sibling workers see it too
+                    return
+                stats.batches += 1
+                stats.items_in += len(item)
+                started = time.perf_counter()
+                try:
+                    out = await stage.fn(item)
+                except Exception as e:
+                    stats.errors += 1
+                    logger.error(f"{self.name}/{stage.name}: batch of {len(item)} failed: {e}")
+                    continue
+                finally:
+                    stats.busy_seconds += time.perf_counter() - started
+                if out is None:
+                    continue
+                stats.items_out += len(out)
+                if outbox is None:
+                    results.append(out)
+                else:
+                    await self._put(outbox, out, downstream)
+
+        await asyncio.gather(*(worker() for _ in range(stats.workers)))
+        if outbox is not None:
+            await outbox.put(_DONE)
+
+
+class IngestionStats:
+    """Most recent run of each named pipeline, for the stats endpoint."""
+
+    def __init__(self):
+        self._last: Dict[str, Pipeline] = {}
+
+    def record(self, pipeline: Pipeline):
+        self._last[pipeline.name] = pipeline
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {name: p.snapshot() for name, p in self._last.items()}
+
+
+ingestion_stats = IngestionStats()
+
+
+@dataclass(frozen=True)
+class StoredJob:
+    """What the embed and index stages need of a stored job, copied while it is loaded."""
+    id: int
+    title: str
+    company: str
+    description: Optional[str]
+    metadata: Dict[str, Any]  # vector store payload
+
+    @classmethod
+    def from_job(cls, job: Job) -> "StoredJob":
+        return cls(job.id, job.title, job.company, job.description, {
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "is_remote": job.is_remote,
+            "source_platform": job.source_platform,
+        })
+
+
+def _job_id(job: Job) -> int:
+    """The primary key of `job` without loading it (it may have been expired)."""
+    return inspect(job).identity[0]
+
+
+@dataclass
+class IngestBatch:
+    seq: int
+    scraped: List[ScrapedJob]
+    rows: List[dict] = field(default_factory=list)
+    dedup: Optional[DedupResult] = None
+    persisted: bool = False
+    jobs: List[Job] = field(default_factory=list)         # stored jobs (existing and new), input order
+    scores: Dict[int, float] = field(default_factory=dict)  # job_id -> compatibility score
+    to_embed: List[StoredJob] = field(default_factory=list)  # new jobs that are not cross-posts
+    vectors: Dict[int, List[float]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.jobs) if self.persisted else len(self.scraped)
+
+
+class JobIngestion:
+    """
+    The job ingestion stages over one AsyncSession.
+
+    `admit` filters (and may score) each scraped micro-batch before anything is
+    written; `prepare_row` adjusts the row built from a ScrapedJob; with `user`,
+    the score stage records per-user scores in user_jobs.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        name: str = "ingest",
+        user=None,
+        admit: Optional[Callable[[List[ScrapedJob]], List[ScrapedJob]]] = None,
+        prepare_row: Optional[Callable[[ScrapedJob, dict], dict]] = None,
+    ):
+        self.db = db
+        self.name = name
+        self.user = user
+        self.admit = admit
+        self.prepare_row = prepare_row
+        self._db_lock = asyncio.Lock()
+        self._embedding_service = None
+        # Totals across the run
+        self.scraped = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.failed = 0  # new rows whose write failed
+        self.pipeline = Pipeline(name, "fetch", [
+            Stage("normalize", self.normalize),
+            Stage("dedup", self.dedup),
+            Stage("persist", self.persist),
+            Stage("embed", self.embed, workers=settings.INGEST_EMBED_WORKERS),
+            Stage("index", self.index),
+            Stage("score", self.score),
+        ], queue_size=settings.INGEST_QUEUE_SIZE)
+
+    async def run(self, batches: AsyncIterable[List[ScrapedJob]]) -> List[Job]:
+        """Ingest scraped micro-batches; returns the stored jobs in arrival order."""
+        seq = itertools.count()
+
+        async def source():
+            async for scraped in batches:
+                if scraped:
+                    yield IngestBatch(next(seq), list(scraped))
+
+        done = await self.pipeline.run(source())
+        done.sort(key=lambda b: b.seq)
+        jobs = [job for batch in done for job in batch.jobs]
+        # A later batch's rollback may have expired earlier jobs; reload them for the caller
+        stale = list({_job_id(j) for j in jobs if inspect(j).expired_attributes})
+        if stale:
+            await crud_job.get_many(self.db, stale)
+        return jobs
+
+    async def run_jobs(self, scraped: Iterable[ScrapedJob], batch_size: int = 100) -> List[Job]:
+        scraped = list(scraped)
+
+        async def chunks():
+            for start in range(0, len(scraped), batch_size):
+                yield scraped[start:start + batch_size]
+
+        return await self.run(chunks())
+
+    def log_summary(self):
+        snapshot = self.pipeline.snapshot()
+        stages = ", ".join(
+            f"{name} {s['items_out']} ({s['items_per_second']}/s, q<={s['max_queue_depth']}, err {s['errors']})"
+            for name, s in snapshot["stages"].items()
+        )
+        logger.info(f"Ingestion '{self.name}' in {snapshot['elapsed_seconds']}s: {stages}")
+
+    # --- stages --------------------------------------------------------------
+
+    async def normalize(self, batch: IngestBatch) -> Optional[IngestBatch]:
+        self.scraped += len(batch.scraped)
+        if self.admit is not None:
+            batch.scraped = self.admit(batch.scraped)
+        rows = []
+        for sj in batch.scraped:
+            row = sj.to_job_row()
+            rows.append(self.prepare_row(sj, row) if self.prepare_row else row)
+        batch.rows = rows
+        return batch if rows else None
+
+    async def dedup(self, batch: IngestBatch) -> IngestBatch:
+        async with self._db_lock:
+            try:
+                batch.dedup = await dedupe_rows(self.db, batch.rows)
+            except Exception:
+                await self.db.rollback()
+                raise
+        return batch
+
+    async def persist(self, batch: IngestBatch) -> Optional[IngestBatch]:
+        """Bulk upsert the new rows and link cross-posts; collect the stored jobs."""
+        dedup = batch.dedup
+        new_ids: Dict[str, int] = {}  # external_id -> id
+        inserted_ids = set()
+        failed = 0
+        repeated = set(dedup.in_batch)
+        async with self._db_lock:
+            if dedup.new:
+                try:
+                    upserted = await crud_job.bulk_upsert(self.db, [batch.rows[i] for i in dedup.new])
+                    inserted_ids = {u.id for u in upserted if u.inserted}
+                    new_ids = {u.external_id: u.id for u in upserted}
+                except Exception as e:
+                    logger.error(f"Error writing batch of {len(dedup.new)} jobs: {e}")
+                    await self.db.rollback()
+                    failed = len(dedup.new)
+
+            # Cross-posts of a vacancy already stored are linked to it and not embedded again
+            linked = {}
+            if inserted_ids:
+                try:
+                    linked = await link_near_duplicates(self.db, list(inserted_ids))
+                except Exception as e:
+                    logger.warning(f"Near-duplicate linking skipped for {len(inserted_ids)} jobs: {e}")
+                    await self.db.rollback()
+
+            # Loaded (again) under the lock: an earlier rollback may have expired the dedup matches
+            ids = []
+            for i, sj in enumerate(batch.scraped):
+                if i in repeated:
+                    continue
+                existing = dedup.existing.get(i)
+                job_id = _job_id(existing) if existing is not None else new_ids.get(sj.external_id)
+                if job_id is not None:
+                    ids.append(job_id)
+                    batch.scores[job_id] = getattr(sj, "compatibility_score", None) or 0
+            stored = {j.id: j for j in await crud_job.get_many(self.db, list(dict.fromkeys(ids)))}
+            batch.jobs = [stored[i] for i in ids if i in stored]
+            batch.to_embed = [
+                StoredJob.from_job(stored[i]) for i in dict.fromkeys(ids)
+                if i in stored and i in inserted_ids and i not in linked
+            ]
+
+        batch.persisted = True
+        self.inserted += len(inserted_ids)
+        self.failed += failed
+        self.duplicates += len(batch.scraped) - len(inserted_ids) - failed
+        return batch if batch.jobs else None
+
+    async def embed(self, batch: IngestBatch) -> IngestBatch:
+        service = self._get_embedding_service()
+        if service is None or not batch.to_embed:
+            return batch
+        texts = [f"{job.title} {job.company} {job.description or ''}" for job in batch.to_embed]
+        try:
+            # Batched by the shared engine, together with the other embed workers' batches
+            vectors = await service.get_embeddings(texts)
+        except Exception as e:
+            logger.warning(f"Embedding skipped for {len(texts)} jobs: {e}")
+            return batch
+        batch.vectors = {job.id: vector for job, vector in zip(batch.to_embed, vectors)}
+        return batch
+
+    async def index(self, batch: IngestBatch) -> IngestBatch:
+        if not batch.vectors:
+            return batch
+        metadata = {j.id: j.metadata for j in batch.to_embed}
+        # Write-behind: the shared writer batches and retries the upserts in the background
+        for job_id, vector in batch.vectors.items():
+            vector_writer.enqueue_job(job_id, vector, metadata[job_id])
+        return batch
+
+    async def score(self, batch: IngestBatch) -> IngestBatch:
+        if self.user is None or not batch.scores:
+            return batch
+        async with self._db_lock:
+            try:
+                await crud_user_job.bulk_upsert_scores(self.db, self.user.id, batch.scores)
+            except Exception as e:
+                logger.warning(f"Could not save UserJob scores for {len(batch.scores)} jobs: {e}")
+                await self.db.rollback()
+        return batch
+
+    # --- optional services (embeddings need GEMINI_API_KEY) ---
+
+    def _get_embedding_service(self):
+        if self._embedding_service is None:
+            try:
+                from app.services.embedding_service import EmbeddingService
+                service = EmbeddingService()
+            except Exception as e:
+                logger.warning(f"Embeddings disabled for this run: {e}")
+                service = None
+            self._embedding_service = service if service is not None and service.api_key else False
+        return self._embedding_service or None
+
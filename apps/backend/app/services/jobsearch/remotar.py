@@ -4,6 +4,7 @@ import json
 from typing import List
 from datetime import datetime
 from bs4 import BeautifulSoup
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -86,7 +87,7 @@ class RemotarScraper(BaseScraper):
                         continue
                     seen.add(title)
                     job_url = f"{self.BASE_URL}{href}" if href.startswith("/") else (href or self.BASE_URL)
-                    external_id = f"remotar_{hash(job_url)}"
+                    external_id = f"remotar_{stable_hash(job_url)}"
                     company_el = card.select_one("[class*='company'], [class*='empresa']")
                     company = company_el.get_text(strip=True) if company_el else "Confidencial"
                     jobs.append(ScrapedJob(
@@ -112,7 +113,7 @@ class RemotarScraper(BaseScraper):
             slug = item.get("slug") or item.get("id") or ""
             job_url = item.get("url") or f"{self.BASE_URL}/vaga/{slug}"
             desc = item.get("description") or ""
-            external_id = f"remotar_{item.get('id', hash(job_url))}"
+            external_id = f"remotar_{item.get('id', stable_hash(job_url))}"
             return ScrapedJob(
                 title=title, company=str(company), location="Remoto (Brasil)",
                 is_remote=True, description=str(desc)[:3000], url=job_url,
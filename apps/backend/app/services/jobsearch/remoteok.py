@@ -1,8 +1,9 @@
 """RemoteOK Scraper - Uses RemoteOK's public JSON API."""
 import logging
 import json
-from typing import List
+from typing import List, Optional
 from datetime import datetime
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -12,119 +13,97 @@ logger = logging.getLogger(__name__)
 class RemoteOKScraper(BaseScraper):
     PLATFORM_NAME = "remoteok"
     API_URL = "https://remoteok.com/api"
+    IS_FEED_SOURCE = True
+    CACHE_TTL = 0.0  # always revalidate on feed refresh; an unchanged feed costs a 304
 
     async def search_jobs(self, query: str, limit: int = 20) -> List[ScrapedJob]:
         logger.info(f"RemoteOKScraper: Searching for '{query}'")
         try:
-            # RemoteOK requires specific headers to return JSON
-            resp = await self.fetch(
-                self.API_URL,
-                headers={
-                    "Accept": "application/json",
-                    "Content-Type": "application/json",
-                },
-                referer="https://remoteok.com/",
-                timeout=30.0,
-            )
-
-            # Parse JSON - handle encoding issues
-            try:
-                data = resp.json()
-            except Exception:
-                text = resp.content.decode("utf-8", errors="replace")
-                # RemoteOK sometimes wraps in HTML, try to extract JSON
-                if text.strip().startswith("["):
-                    data = json.loads(text)
-                elif '{"' in text:
-                    json_start = text.find("[")
-                    json_end = text.rfind("]") + 1
-                    if json_start >= 0 and json_end > json_start:
-                        data = json.loads(text[json_start:json_end])
-                    else:
-                        logger.warning("RemoteOKScraper: Could not extract JSON from response")
-                        return await self._fallback_html(query, limit)
-                else:
-                    logger.warning("RemoteOKScraper: Response is not JSON, falling back to HTML")
-                    return await self._fallback_html(query, limit)
+            index = await self.feed_index()
+        except Exception as e:
+            logger.error(f"RemoteOKScraper: API failed: {e}, trying HTML fallback")
+            return await self._fallback_html(query, limit)
 
-            # First item is metadata, skip it
-            job_items = data[1:] if isinstance(data, list) and len(data) > 1 else []
+        jobs = index.search(query, limit)
+        # If no matches for query, take latest as fallback
+        if not jobs:
+            logger.info(f"RemoteOKScraper: No match for '{query}', using latest {limit} jobs")
+            jobs = index.latest(limit)
 
-            if not job_items:
-                logger.info("RemoteOKScraper: API returned no jobs, trying HTML fallback")
-                return await self._fallback_html(query, limit)
+        logger.info(f"RemoteOKScraper: found {len(jobs)} results for '{query}'")
+        return jobs
 
-            search_terms = query.lower().split()
-            jobs = []
-            for entry in job_items:
-                if len(jobs) >= limit:
-                    break
-                if not isinstance(entry, dict):
-                    continue
-                title = entry.get("position", "")
-                company = entry.get("company", "")
-                description = entry.get("description", "")
-                tags = entry.get("tags")
-                tags_str = " ".join(tags) if isinstance(tags, list) else str(tags or "")
-                text_to_search = f"{title} {company} {tags_str} {description}".lower()
+    async def load_feed(self) -> List[ScrapedJob]:
+        """Download the whole API feed once; raises if it is unusable so callers can fall back."""
+        # RemoteOK requires specific headers to return JSON
+        resp = await self.fetch(
+            self.API_URL,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            referer="https://remoteok.com/",
+            timeout=30.0,
+        )
 
-                match = not search_terms or any(t in text_to_search for t in search_terms)
-                if not match:
-                    continue
+        # Parse JSON - handle encoding issues
+        try:
+            data = resp.json()
+        except Exception:
+            text = resp.content.decode("utf-8", errors="replace")
+            # RemoteOK sometimes wraps in HTML, try to extract JSON
+            if text.strip().startswith("["):
+                data = json.loads(text)
+            elif '{"' in text:
+                json_start = text.find("[")
+                json_end = text.rfind("]") + 1
+                if json_start >= 0 and json_end > json_start:
+                    data = json.loads(text[json_start:json_end])
+                else:
+                    raise ValueError("could not extract JSON from response")
+            else:
+                raise ValueError("response is not JSON")
 
-                raw_date = entry.get("date")
-                posted_at = datetime.utcnow()
-                if raw_date:
-                    try:
-                        if "T" in str(raw_date):
-                            posted_at = datetime.fromisoformat(str(raw_date).replace("Z", "+00:00"))
-                        else:
-                            posted_at = datetime.fromtimestamp(int(raw_date))
-                    except Exception:
-                        pass
+        # First item is metadata, skip it
+        job_items = data[1:] if isinstance(data, list) and len(data) > 1 else []
+        jobs = [job for job in (self._parse_entry(e) for e in job_items) if job]
+        if not jobs:
+            raise ValueError("API returned no jobs")
+        return jobs
 
-                job_url = entry.get("url", "")
-                if not job_url and entry.get("slug"):
-                    job_url = f"https://remoteok.com/remote-jobs/{entry['slug']}"
+    def _parse_entry(self, entry) -> Optional[ScrapedJob]:
+        if not isinstance(entry, dict):
+            return None
+        title = entry.get("position", "")
+        if not title:
+            return None
+        company = entry.get("company", "")
 
-                jobs.append(ScrapedJob(
-                    title=title, company=company,
-                    location=entry.get("location", "Remote"), is_remote=True,
-                    description=description[:3000],
-                    url=job_url,
-                    external_id=f"remoteok_{entry.get('id', hash(title + company))}",
-                    source_platform=self.PLATFORM_NAME, posted_at=posted_at,
-                    technologies=entry.get("tags", []),
-                ))
+        raw_date = entry.get("date")
+        posted_at = datetime.utcnow()
+        if raw_date:
+            try:
+                if "T" in str(raw_date):
+                    posted_at = datetime.fromisoformat(str(raw_date).replace("Z", "+00:00"))
+                else:
+                    posted_at = datetime.fromtimestamp(int(raw_date))
+            except Exception:
+                pass
 
-            # If no matches for query, take latest as fallback
-            if not jobs and job_items:
-                logger.info(f"RemoteOKScraper: No match for '{query}', using latest {limit} jobs")
-                for entry in job_items[:limit]:
-                    if not isinstance(entry, dict):
-                        continue
-                    title = entry.get("position", "")
-                    if not title:
-                        continue
-                    company = entry.get("company", "")
-                    job_url = entry.get("url", "")
-                    if not job_url and entry.get("slug"):
-                        job_url = f"https://remoteok.com/remote-jobs/{entry['slug']}"
-                    jobs.append(ScrapedJob(
-                        title=title, company=company,
-                        location=entry.get("location", "Remote"), is_remote=True,
-                        description=entry.get("description", "")[:3000],
-                        url=job_url,
-                        external_id=f"remoteok_{entry.get('id', hash(title + company))}",
-                        source_platform=self.PLATFORM_NAME, posted_at=datetime.utcnow(),
-                        technologies=entry.get("tags", []),
-                    ))
+        job_url = entry.get("url", "")
+        if not job_url and entry.get("slug"):
+            job_url = f"https://remoteok.com/remote-jobs/{entry['slug']}"
 
-            logger.info(f"RemoteOKScraper: found {len(jobs)} results for '{query}'")
-            return jobs
-        except Exception as e:
-            logger.error(f"RemoteOKScraper: API failed: {e}, trying HTML fallback")
-            return await self._fallback_html(query, limit)
+        tags = entry.get("tags")
+        return ScrapedJob(
+            title=title, company=company,
+            location=entry.get("location") or "Remote", is_remote=True,
+            description=(entry.get("description") or "")[:3000],
+            url=job_url,
+            external_id=f"remoteok_{entry.get('id', stable_hash(title, company))}",
+            source_platform=self.PLATFORM_NAME, posted_at=posted_at,
+            technologies=[str(t) for t in tags] if isinstance(tags, list) else [],
+        )
 
     async def _fallback_html(self, query: str, limit: int) -> List[ScrapedJob]:
         """Fallback: scrape RemoteOK HTML page."""
@@ -157,7 +136,7 @@ class RemoteOKScraper(BaseScraper):
                     job_url = f"https://remoteok.com/remote-jobs/{slug}" if slug else ""
                     tag_els = row.select("td.tags a, span.tag")
                     techs = [t.get_text(strip=True) for t in tag_els]
-                    external_id = f"remoteok_{slug or hash(title + company)}"
+                    external_id = f"remoteok_{slug or stable_hash(title, company)}"
                     jobs.append(ScrapedJob(
                         title=title, company=company, location="Remote", is_remote=True,
                         description="", url=job_url, external_id=external_id,
@@ -25,6 +25,8 @@ from typing import List, Dict, Any, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import DuplicateKeyError, BulkWriteError
 
+from app.services.jobsearch.coalescer import search_coalescer
+from app.services.jobsearch.health import scraper_health
 from app.services.jobsearch.models import ScrapedJob
 
 logger = logging.getLogger(__name__)
@@ -106,6 +108,7 @@ def _scraped_job_to_raw_doc(job: ScrapedJob) -> Dict[str, Any]:
     """Convert a ScrapedJob pydantic model to a raw MongoDB document."""
     doc = job.model_dump()
     doc["_id"] = _generate_doc_id(job)
+    doc["fingerprint"] = job.fingerprint
     doc["status"] = "pending_processing"
     doc["source"] = job.source_platform
     doc["ingested_at"] = datetime.now(timezone.utc)
@@ -140,12 +143,20 @@ class JobSpider:
     async def _run_single_scraper(self, scraper, query: str, limit: int) -> List[ScrapedJob]:
         """Run a single scraper with error isolation."""
         scraper_name = type(scraper).__name__
+        health = scraper_health.get(scraper_name)
+        if not health.allow():
+            logger.info(f"⏸️  {scraper_name}: circuit open, skipping '{query}'")
+            return []
         try:
             logger.info(f"🔍 {scraper_name}: starting search for '{query}' (limit={limit})")
-            results = await asyncio.wait_for(
-                scraper.search_jobs(query, limit=limit),
-                timeout=120.0,  # 2 minutes max per scraper
-            )
+            # Coalesced: a user search for the same query running meanwhile shares this run
+            key = search_coalescer.make_key(scraper_name, query, limit)
+            async with health.track() as call:
+                results = await asyncio.wait_for(
+                    search_coalescer.collect(key, call.source(lambda: scraper.search_jobs_stream(query, limit=limit)), limit),
+                    timeout=120.0,  # 2 minutes max per scraper
+                )
+                call.results = len(results)
             logger.info(f"✅ {scraper_name}: found {len(results)} jobs for '{query}'")
             return results
         except asyncio.TimeoutError:
@@ -281,8 +292,10 @@ class JobSpider:
         return self.stats
 
     async def close(self):
-        """Close MongoDB connection."""
+        """Close MongoDB connection and pooled scraper HTTP clients."""
+        from app.infrastructure.http.client_pool import http_client_pool
         self.mongo_client.close()
+        await http_client_pool.aclose()
 
 
 # ---------------------------------------------------------------------------
@@ -4,6 +4,7 @@ import logging
 from typing import List, Optional
 from datetime import datetime
 
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -44,19 +45,14 @@ class TavilyScraper(BaseScraper):
             }
             
             logger.info(f"TavilyScraper: Searching for '{search_query}'")
-            import httpx
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    url, 
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self.fetch(
+                url, method="POST", json=payload, headers={"Content-Type": "application/json"}, timeout=30.0
+            )
+            data = resp.json()
             
             results = data.get("results", [])
             
-            for index, item in enumerate(results):
+            for item in results:
                 title = item.get("title", "Unknown Title")
                 url = item.get("url", "")
                 content = item.get("content", "")
@@ -83,7 +79,7 @@ class TavilyScraper(BaseScraper):
                     is_remote=True,
                     description=description,
                     url=url,
-                    external_id=f"tavily_{index}_{hash(url)}",
+                    external_id=f"tavily_{stable_hash(url)}",
                     source_platform="tavily",
                     posted_at=datetime.utcnow(),
                 )
@@ -0,0 +1,169 @@
+"""
+Per-(scraper, query) watermarks for incremental crawling.
+
+A `Watermark` remembers the external_ids a scraper recently returned for a
+query (plus the newest external_id / posted_at). While a crawl runs, the
+scraper's watermark is set in a ContextVar so that:
+
+  - paginated scrapers stop paging once a whole page is already known
+    (`BaseScraper._new_since_watermark`), and
+  - the runners (JobService, run_spider_local) drop known jobs, so the
+    downstream stages only receive new ones.
+
+A job the runner passes on is only pending (`observe`). It becomes known once
+the runner `confirm`s that it was stored, so a job whose write failed, that
+admission dropped or that a cut-short run never persisted comes back on the
+next crawl.
+
+Watermarks are loaded for all scrapers of a query in one DB round-trip and
+saved back in one commit when the crawl ends.
+"""
+import json
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from app.services.jobsearch.coalescer import normalize_query
+from app.services.jobsearch.models import ScrapedJob
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["Watermark"]] = ContextVar("scraper_watermark", default=None)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class Watermark:
+    def __init__(
+        self,
+        source: str,
+        query: str,
+        recent_ids: Optional[List[str]] = None,
+        last_external_id: Optional[str] = None,
+        last_posted_at: Optional[datetime] = None,
+        trust_posted_at: bool = False,
+        max_ids: int = 500,
+    ):
+        self.source = source
+        self.query = normalize_query(query)
+        self.recent_ids: List[str] = list(recent_ids or [])[:max_ids]
+        self.last_external_id = last_external_id
+        self.last_posted_at = _aware(last_posted_at)
+        # Only sources with real posting dates may treat "older than the mark" as known
+        self.trust_posted_at = trust_posted_at
+        self.max_ids = max_ids
+        self._known = set(self.recent_ids)
+        self._pending: Dict[str, Optional[datetime]] = {}  # observed this run, not yet stored: id -> posted_at
+        self._new_ids: List[str] = []
+        self.skipped = 0
+
+    @classmethod
+    def from_model(cls, row, **kwargs) -> "Watermark":
+        try:
+            recent_ids = json.loads(row.recent_ids) if row.recent_ids else []
+        except ValueError:
+            recent_ids = []
+        return cls(
+            row.source, row.query, recent_ids=recent_ids,
+            last_external_id=row.last_external_id, last_posted_at=row.last_posted_at, **kwargs,
+        )
+
+    def is_known(self, job: ScrapedJob) -> bool:
+        if job.external_id in self._known or job.external_id in self._pending:
+            return True
+        if self.trust_posted_at and self.last_posted_at and job.posted_at:
+            return _aware(job.posted_at) < self.last_posted_at
+        return False
+
+    def observe(self, job: ScrapedJob):
+        """Record a new job as passed on this run; it is not known until `confirm`ed."""
+        if job.external_id in self._known:
+            return
+        self._pending.setdefault(job.external_id, _aware(job.posted_at))
+
+    def confirm(self, stored_ids: Iterable[str]):
+        """Mark the observed jobs among `stored_ids` as known (newest first in recent_ids)."""
+        stored_ids = set(stored_ids)
+        for external_id, posted_at in list(self._pending.items()):
+            if external_id not in stored_ids:
+                continue
+            del self._pending[external_id]
+            self._known.add(external_id)
+            self._new_ids.append(external_id)
+            if posted_at and (self.last_posted_at is None or posted_at > self.last_posted_at):
+                self.last_posted_at = posted_at
+                self.last_external_id = external_id
+            elif self.last_external_id is None:
+                self.last_external_id = external_id
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._new_ids)
+
+    def to_values(self) -> dict:
+        new_ids = set(self._new_ids)
+        recent = (self._new_ids + [i for i in self.recent_ids if i not in new_ids])[: self.max_ids]
+        return {
+            "source": self.source,
+            "query": self.query,
+            "last_external_id": self.last_external_id,
+            "last_posted_at": self.last_posted_at,
+            "recent_ids": json.dumps(recent),
+        }
+
+
+@contextmanager
+def watermark_scope(watermark: Optional[Watermark]):
+    token = _current.set(watermark)
+    try:
+        yield watermark
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[Watermark]:
+    return _current.get()
+
+
+async def load_watermarks(db, query: str, scrapers: Iterable) -> Dict[str, Watermark]:
+    """Watermarks for every scraper of `query`, keyed by scraper class name (one DB query)."""
+    from app.core.config import settings
+    from app.crud.scraper_watermark import scraper_watermark as crud_watermark
+
+    scrapers = list(scrapers)
+    names = [type(s).__name__ for s in scrapers]
+    rows = {}
+    try:
+        rows = {r.source: r for r in await crud_watermark.get_for_query(db, query=normalize_query(query), sources=names)}
+    except Exception as e:
+        logger.warning(f"Could not load scraper watermarks for '{query}': {e}")
+
+    watermarks = {}
+    for scraper, name in zip(scrapers, names):
+        kwargs = {
+            "trust_posted_at": getattr(scraper, "WATERMARK_TRUSTS_POSTED_AT", False),
+            "max_ids": settings.SCRAPER_WATERMARK_MAX_IDS,
+        }
+        row = rows.get(name)
+        watermarks[name] = Watermark.from_model(row, **kwargs) if row else Watermark(name, query, **kwargs)
+    return watermarks
+
+
+async def save_watermarks(db, watermarks: Iterable[Watermark]):
+    """Persist the watermarks that advanced during this crawl (one commit)."""
+    from app.crud.scraper_watermark import scraper_watermark as crud_watermark
+
+    values = [w.to_values() for w in watermarks if w.changed]
+    if not values:
+        return
+    try:
+        await crud_watermark.upsert_many(db, values)
+    except Exception as e:
+        logger.warning(f"Could not save scraper watermarks: {e}")
+        await db.rollback()
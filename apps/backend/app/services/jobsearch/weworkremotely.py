@@ -1,8 +1,10 @@
 """We Work Remotely Scraper - Uses RSS feed for reliability."""
 import logging
+import time
 import feedparser
 from typing import List
 from datetime import datetime
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -11,6 +13,8 @@ logger = logging.getLogger(__name__)
 
 class WeWorkRemotelyScraper(BaseScraper):
     PLATFORM_NAME = "weworkremotely"
+    IS_FEED_SOURCE = True
+    CACHE_TTL = 0.0  # always revalidate on feed refresh; an unchanged feed costs a 304
     # RSS feeds are more reliable than HTML scraping for WWR (avoids 403)
     RSS_CATEGORIES = [
         "https://weworkremotely.com/categories/remote-programming-jobs.rss",
@@ -20,54 +24,55 @@ class WeWorkRemotelyScraper(BaseScraper):
 
     async def search_jobs(self, query: str, limit: int = 20) -> List[ScrapedJob]:
         logger.info(f"WeWorkRemotelyScraper: Searching for '{query}' via RSS")
-        jobs = []
-        search_terms = query.lower().split()
+        try:
+            jobs = await self.search_feed(query, limit)
+        except Exception as e:
+            logger.warning(f"WeWorkRemotelyScraper: RSS feeds unavailable: {e}")
+            jobs = []
+        logger.info(f"WeWorkRemotelyScraper: found {len(jobs)} results for '{query}'")
+        return jobs
 
+    async def load_feed(self) -> List[ScrapedJob]:
+        """Download every category feed once and parse all entries."""
+        jobs = []
+        failures = 0
         for rss_url in self.RSS_CATEGORIES:
-            if len(jobs) >= limit:
-                break
             try:
                 resp = await self.fetch(rss_url, headers={"Accept": "application/rss+xml, application/xml, text/xml"})
                 feed = feedparser.parse(resp.text)
+                jobs.extend(self._parse_entry(entry) for entry in feed.entries)
+            except Exception as e:
+                failures += 1
+                logger.warning(f"WeWorkRemotelyScraper: RSS {rss_url} failed: {e}")
+        if failures == len(self.RSS_CATEGORIES):
+            raise RuntimeError("all RSS category feeds failed")
+        return jobs
 
-                for entry in feed.entries:
-                    if len(jobs) >= limit:
-                        break
-                    title = entry.get("title", "")
-                    summary = entry.get("summary", entry.get("description", ""))
-                    company = ""
-                    # WWR format: "Company: Title"
-                    if ":" in title:
-                        parts = title.split(":", 1)
-                        company = parts[0].strip()
-                        title = parts[1].strip()
-
-                    text = f"{title} {summary} {company}".lower()
-                    if search_terms and not any(t in text for t in search_terms):
-                        continue
-
-                    link = entry.get("link", "")
-                    external_id = f"weworkremotely_{hash(link)}"
-
-                    posted_at = datetime.utcnow()
-                    if entry.get("published_parsed"):
-                        try:
-                            import time
-                            posted_at = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                        except Exception:
-                            pass
+    def _parse_entry(self, entry) -> ScrapedJob:
+        title = entry.get("title", "")
+        summary = entry.get("summary", entry.get("description", ""))
+        company = ""
+        # WWR format: "Company: Title"
+        if ":" in title:
+            parts = title.split(":", 1)
+            company = parts[0].strip()
+            title = parts[1].strip()
 
-                    jobs.append(ScrapedJob(
-                        title=title, company=company or "WWR Listing",
-                        location="Remote (Worldwide)", is_remote=True,
-                        description=summary[:3000] if summary else "",
-                        url=link, external_id=external_id,
-                        source_platform=self.PLATFORM_NAME,
-                        posted_at=posted_at, technologies=[],
-                    ))
+        link = entry.get("link", "")
+        external_id = f"weworkremotely_{stable_hash(link)}"
 
-            except Exception as e:
-                logger.warning(f"WeWorkRemotelyScraper: RSS {rss_url} failed: {e}")
+        posted_at = datetime.utcnow()
+        if entry.get("published_parsed"):
+            try:
+                posted_at = datetime.fromtimestamp(time.mktime(entry.published_parsed))
+            except Exception:
+                pass
 
-        logger.info(f"WeWorkRemotelyScraper: found {len(jobs)} results for '{query}'")
-        return jobs
+        return ScrapedJob(
+            title=title, company=company or "WWR Listing",
+            location="Remote (Worldwide)", is_remote=True,
+            description=summary[:3000] if summary else "",
+            url=link, external_id=external_id,
+            source_platform=self.PLATFORM_NAME,
+            posted_at=posted_at, technologies=[],
+        )
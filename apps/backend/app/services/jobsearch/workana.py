@@ -3,6 +3,7 @@ import logging
 from typing import List
 from datetime import datetime
 from bs4 import BeautifulSoup
+from app.core.fingerprint import stable_hash
 from app.services.jobsearch.base import BaseScraper
 from app.services.jobsearch.models import ScrapedJob
 
@@ -59,7 +60,7 @@ class WorkanaScraper(BaseScraper):
                         budget = budget_el.get_text(strip=True) if budget_el else ""
                         desc_el = parent.select_one("p, [class*='description']")
                         desc = desc_el.get_text(strip=True) if desc_el else ""
-                    external_id = f"workana_{hash(job_url)}"
+                    external_id = f"workana_{stable_hash(job_url)}"
                     jobs.append(ScrapedJob(
                         title=title, company="Cliente Workana",
                         location="Remoto (Freelance)", is_remote=True,
@@ -0,0 +1,83 @@
+import logging
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from app.core.config import settings
+from app.infrastructure.vectors.local_index import LocalVectorIndex
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVectorService:
+    """
+    Same interface as PineconeService, backed by the in-process NumPy index
+    (app/infrastructure/vectors/local_index.py) stored in VECTOR_LOCAL_DIR.
+    """
+
+    def __init__(self, index: Optional[LocalVectorIndex] = None):
+        self.index = index or LocalVectorIndex(
+            directory=settings.VECTOR_LOCAL_DIR,
+            ivf_threshold=settings.VECTOR_IVF_THRESHOLD,
+            nprobe=settings.VECTOR_IVF_NPROBE,
+        )
+
+    @property
+    def is_configured(self) -> bool:
+        return True
+
+    def upsert_resume(self, resume_id: int, embedding: List[float], metadata: Dict[str, Any]):
+        """
+        Upsert a resume vector.
+        Namespace: 'resumes'
+        """
+        try:
+            clean_metadata = {k: v for k, v in metadata.items() if v is not None}
+            self.index.upsert("resumes", [(resume_id, embedding, clean_metadata)])
+            logger.info(f"Upserted resume {resume_id} to the local vector index.")
+        except Exception as e:
+            logger.error(f"Error upserting resume {resume_id}: {e}")
+
+    def upsert_job(self, job_id: int, embedding: List[float], metadata: Dict[str, Any]):
+        """
+        Upsert a job vector.
+        Namespace: 'jobs'
+        """
+        try:
+            clean_metadata = {k: v for k, v in metadata.items() if v is not None}
+            self.index.upsert("jobs", [(job_id, embedding, clean_metadata)])
+        except Exception as e:
+            logger.error(f"Error upserting job {job_id}: {e}")
+
+    def upsert_vectors(self, namespace: str, items: Sequence[Tuple[int, List[float], Dict[str, Any]]]):
+        """
+        Upsert many (id, embedding, metadata) at once.
+        Raises on failure so the caller (VectorWriter) can retry.
+        """
+        self.index.upsert(namespace, [
+            (item_id, embedding, {k: v for k, v in (metadata or {}).items() if v is not None})
+            for item_id, embedding, metadata in items
+        ])
+
+    def get_resume_vector(self, resume_id: int) -> Optional[List[float]]:
+        """
+        Fetch a stored resume vector (normalised to unit length).
+        """
+        try:
+            return self.index.fetch("resumes", resume_id)
+        except Exception as e:
+            logger.error(f"Error fetching resume vector {resume_id}: {e}")
+            return None
+
+    def search_jobs(self, query_embedding: List[float], top_k: int = 10, filter: Optional[Dict] = None) -> List[Dict]:
+        """
+        Search for jobs similar to the query embedding.
+        """
+        try:
+            return [
+                {"id": job_id, "score": score, "metadata": metadata}
+                for job_id, score, metadata in self.index.search("jobs", query_embedding, top_k=top_k, filter=filter)
+            ]
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return []
+
+    def close(self):
+        self.index.close()
@@ -1,27 +1,37 @@
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from pinecone import Pinecone, ServerlessSpec
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _open_index(api_key: str, index_name: str):
+    """One Pinecone client and Index handle per (key, index) for the whole process."""
+    return Pinecone(api_key=api_key).Index(index_name)
+
+
 class PineconeService:
     def __init__(self):
         self.api_key = settings.PINECONE_KEY or settings.PINECONE_API_KEY
         self.index_name = settings.PINECONE_INDEX_NAME
-        self.pc = None
         self.index = None
         
         if self.api_key:
             try:
-                self.pc = Pinecone(api_key=self.api_key)
                 # Check if index exists, if not create (careful with serverless specs)
                 # For now, let's assume index exists or user creates it. 
                 # Auto-creation can be complex with regions.
-                self.index = self.pc.Index(self.index_name)
+                self.index = _open_index(self.api_key, self.index_name)
             except Exception as e:
                 logger.error(f"Failed to initialize Pinecone: {e}")
 
+    @property
+    def is_configured(self) -> bool:
+        return self.index is not None
+
     def upsert_resume(self, resume_id: int, embedding: List[float], metadata: Dict[str, Any]):
         """
         Upsert a resume vector.
@@ -76,6 +86,25 @@ class PineconeService:
         except Exception as e:
             logger.error(f"Error upserting job {job_id}: {e}")
 
+    def upsert_vectors(self, namespace: str, items: Sequence[Tuple[int, List[float], Dict[str, Any]]]):
+        """
+        Upsert many (id, embedding, metadata) in one request.
+        Raises on failure so the caller (VectorWriter) can retry.
+        """
+        if not self.index:
+            raise RuntimeError("Pinecone index not initialized")
+        self.index.upsert(
+            vectors=[
+                {
+                    "id": str(item_id),
+                    "values": embedding,
+                    "metadata": {k: v for k, v in (metadata or {}).items() if v is not None},
+                }
+                for item_id, embedding, metadata in items
+            ],
+            namespace=namespace
+        )
+
     def get_resume_vector(self, resume_id: int) -> Optional[List[float]]:
         """
         Fetch resume vector from Pinecone.
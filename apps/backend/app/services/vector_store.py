@@ -0,0 +1,34 @@
+"""
+The app's vector store, chosen by settings.VECTOR_BACKEND:
+
+    "pinecone"  Pinecone (needs PINECONE_API_KEY / PINECONE_KEY)
+    "local"     in-process NumPy index on disk (LocalVectorService)
+    "auto"      Pinecone when a key is configured, the local index otherwise
+
+Both expose upsert_job / upsert_resume / search_jobs / get_resume_vector.
+"""
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _build_default_store():
+    backend = settings.VECTOR_BACKEND.lower()
+    has_key = bool(settings.PINECONE_KEY or settings.PINECONE_API_KEY)
+    if backend == "pinecone" or (backend == "auto" and has_key):
+        try:
+            from app.services.pinecone_service import PineconeService
+            return PineconeService()
+        except Exception as e:
+            logger.warning(f"Pinecone unavailable ({e}); using the local vector index")
+    elif backend not in ("local", "auto"):
+        logger.warning(f"Unknown VECTOR_BACKEND '{settings.VECTOR_BACKEND}'; using the local vector index")
+
+    from app.services.local_vector_service import LocalVectorService
+    return LocalVectorService()
+
+
+# Singleton instance for the app
+vector_store = _build_default_store()
@@ -0,0 +1,223 @@
+"""
+Process-wide write-behind queue for vector upserts.
+
+`enqueue_job()` / `enqueue_resume()` only record the vector and return, so a
+request or ingestion run never waits on the vector store. A background task
+sends what is queued through `vector_store.upsert_vectors()` in batches of up
+to `max_batch`, as soon as a namespace has a full batch or every
+`flush_seconds` otherwise. The store call runs in a thread.
+
+A failed batch is put back at the front of its queue (unless a newer vector
+for the same id arrived meanwhile) and the writer backs off exponentially;
+after `max_retries` failed attempts a vector is dropped. Batches for a store
+that is not configured (no Pinecone index) are dropped, not counted as
+written. Past `max_queue` queued vectors the oldest are dropped. Queue depth, flush latency and the
+counters are reported by `stats()`.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS = 60.0
+
+# id -> (embedding, metadata, failed attempts)
+_Entry = Tuple[List[float], Dict[str, Any], int]
+
+
+class VectorWriter:
+    def __init__(
+        self,
+        store=None,
+        max_batch: int = 100,
+        flush_seconds: float = 1.0,
+        max_retries: int = 5,
+        max_queue: int = 50_000,
+        retry_base_seconds: float = 1.0,
+    ):
+        self._store = store
+        self.max_batch = max(1, max_batch)
+        self.flush_seconds = flush_seconds
+        self.max_retries = max(1, max_retries)
+        self.max_queue = max_queue
+        self.retry_base_seconds = retry_base_seconds
+
+        self._pending: Dict[str, "OrderedDict[int, _Entry]"] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._consecutive_failures = 0
+        self._backoff_until = 0.0
+        self._latencies: deque = deque(maxlen=200)
+        # Counters
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.dropped = 0
+
+    @property
+    def store(self):
+        if self._store is None:
+            from app.services.vector_store import vector_store
+            self._store = vector_store
+        return self._store
+
+    @property
+    def depth(self) -> int:
+        return sum(len(p) for p in self._pending.values())
+
+    # --- producers (event loop only, never block) ----------------------------
+
+    def enqueue(self, namespace: str, item_id: int, embedding: List[float], metadata: Optional[Dict[str, Any]] = None):
+        pending = self._pending.setdefault(namespace, OrderedDict())
+        pending.pop(item_id, None)  # a newer vector replaces one not yet sent
+        pending[item_id] = (embedding, metadata or {}, 0)
+        self.enqueued += 1
+        if self.depth > self.max_queue:
+            pending.popitem(last=False)
+            self.dropped += 1
+        self.start()
+        if len(pending) >= self.max_batch:
+            self._wake.set()
+
+    def enqueue_job(self, job_id: int, embedding: List[float], metadata: Optional[Dict[str, Any]] = None):
+        self.enqueue("jobs", job_id, embedding, metadata)
+
+    def enqueue_resume(self, resume_id: int, embedding: List[float], metadata: Optional[Dict[str, Any]] = None):
+        self.enqueue("resumes", resume_id, embedding, metadata)
+
+    # --- lifecycle -----------------------------------------------------------
+
+    def start(self):
+        """Start the flush task on the running loop (no-op if it is already running there)."""
+        self._bind_loop()
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush task and make a last attempt to send everything queued."""
+        task, self._task = self._task, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._backoff_until = 0.0
+        await self.flush()
+        if self.depth:
+            logger.warning(f"VectorWriter: {self.depth} vectors not written at shutdown")
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # The event, lock and task belong to one loop (tests run one per case)
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:  # never let the writer die
+                logger.error(f"VectorWriter: flush failed: {e}")
+
+    # --- flushing ------------------------------------------------------------
+
+    async def flush(self):
+        """Send everything queued, `max_batch` vectors per request, unless backing off."""
+        self._bind_loop()
+        async with self._flush_lock:
+            if time.monotonic() < self._backoff_until:
+                return
+            for namespace, pending in list(self._pending.items()):
+                while pending:
+                    batch = [pending.popitem(last=False) for _ in range(min(self.max_batch, len(pending)))]
+                    if not await self._send(namespace, batch):
+                        return
+
+    async def _send(self, namespace: str, batch: List[Tuple[int, _Entry]]) -> bool:
+        if not getattr(self.store, "is_configured", True):
+            self.dropped += len(batch)  # nothing to retry against
+            logger.warning(f"VectorWriter: vector store not configured, dropped {len(batch)} '{namespace}' vectors")
+            return True
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(
+                self.store.upsert_vectors, namespace, [(item_id, emb, meta) for item_id, (emb, meta, _) in batch]
+            )
+        except asyncio.CancelledError:
+            self._requeue(namespace, batch, count_attempt=False)  # stopping: stop() retries it
+            raise
+        except Exception as e:
+            self.failed_batches += 1
+            self._consecutive_failures += 1
+            backoff = min(self.retry_base_seconds * 2 ** (self._consecutive_failures - 1), MAX_BACKOFF_SECONDS)
+            self._backoff_until = time.monotonic() + backoff
+            self._requeue(namespace, batch, count_attempt=True)
+            logger.warning(f"VectorWriter: {len(batch)} '{namespace}' vectors failed ({e}); retrying in {backoff:.0f}s")
+            return False
+        finally:
+            self._latencies.append(time.perf_counter() - started)
+        self._consecutive_failures = 0
+        self.batches += 1
+        self.written += len(batch)
+        return True
+
+    def _requeue(self, namespace: str, batch: List[Tuple[int, _Entry]], count_attempt: bool):
+        pending = self._pending.setdefault(namespace, OrderedDict())
+        for item_id, (embedding, metadata, attempts) in reversed(batch):
+            attempts += 1 if count_attempt else 0
+            if attempts >= self.max_retries:
+                self.dropped += 1
+            elif item_id not in pending:  # a newer vector queued meanwhile wins
+                pending[item_id] = (embedding, metadata, attempts)
+                pending.move_to_end(item_id, last=False)
+
+    def _percentile(self, p: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))]
+
+    def stats(self) -> dict:
+        p50, p95 = self._percentile(50), self._percentile(95)
+        return {
+            "queue_depth": self.depth,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "dropped": self.dropped,
+            "flush_p50_ms": round(1000 * p50, 1) if p50 is not None else None,
+            "flush_p95_ms": round(1000 * p95, 1) if p95 is not None else None,
+            "backoff_seconds": round(max(0.0, self._backoff_until - time.monotonic()), 1),
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+def _build_default_writer() -> VectorWriter:
+    return VectorWriter(
+        max_batch=settings.VECTOR_WRITE_BATCH_SIZE,
+        flush_seconds=settings.VECTOR_WRITE_FLUSH_SECONDS,
+        max_retries=settings.VECTOR_WRITE_MAX_RETRIES,
+        max_queue=settings.VECTOR_WRITE_MAX_QUEUE,
+    )
+
+
+# Singleton instance for the app
+vector_writer = _build_default_writer()
@@ -1,7 +1,13 @@
 import os
+import sys
 import logging
 from datetime import datetime, timezone
 
+# app.core.fingerprint só depende da stdlib; importa do backend sem as dependências do app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from app.core.fingerprint import job_fingerprint
+
 class MongoPipeline:
     collection_name = 'raw_jobs'
 
@@ -26,6 +32,7 @@ class MongoPipeline:
         
         # Garante indice único pelo URL (upsert)
         self.db[self.collection_name].create_index("url", unique=True)
+        self.db[self.collection_name].create_index("fingerprint")
 
     def close_spider(self, spider):
         if self.client:
@@ -36,6 +43,9 @@ class MongoPipeline:
         document = dict(item)
         document['collected_at'] = datetime.now(timezone.utc)
         document['status'] = 'pending_processing'
+        document['fingerprint'] = job_fingerprint(
+            document.get('url'), document.get('title'), document.get('company'), document.get('location')
+        )
         
         url_key = document.get('url')
         if not url_key:
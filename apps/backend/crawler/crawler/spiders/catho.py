@@ -16,7 +16,7 @@ class CathoSpider(scrapy.Spider):
         yield scrapy.Request(url, callback=self.parse)
 
     def parse(self, response):
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "lxml")  # lxml ships with Scrapy
 
         job_lists = soup.find("ul", class_=lambda x: x and "gtm-job-list" in x) or soup.find("ul", {"id": "search-result"})
         if not job_lists:
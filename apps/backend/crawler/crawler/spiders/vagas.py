@@ -17,7 +17,7 @@ class VagasSpider(scrapy.Spider):
         yield scrapy.Request(url, callback=self.parse)
 
     def parse(self, response):
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "lxml")  # lxml ships with Scrapy
         job_cards = soup.select("a.link-detalhes-vaga")
         
         for a in job_cards:
@@ -3,16 +3,18 @@ import os
 import sys
 import logging
 from datetime import datetime, timezone
-from bs4 import BeautifulSoup
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 
 # Configuração para importar o app do projeto principal
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 from app.db.session import async_session_maker
-from app.models.job import Job
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from app.core.fingerprint import job_fingerprint, url_hash
+from app.crud.job import job as crud_job
+from app.services.jobsearch.dedup import dedupe_rows
+from app.services.jobsearch.near_dup import link_near_duplicates
+from app.infrastructure.parsing.html_parser import make_soup, parse_executor
 
 # --- CONFIGURAÇÕES ---
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
@@ -40,41 +42,73 @@ async def process_batch():
 
     logger.info(f"Processing batch of {len(raw_jobs)} jobs.")
     
+    statuses = {}  # _id -> (status, error_message)
+    rows = {}      # _id -> linha candidata
+    for raw_job in raw_jobs:
+        try:
+            row = await prepare_job_row(raw_job)
+            statuses[raw_job["_id"]] = ("processed" if row else "error_processing", None)
+            if row:
+                rows[raw_job["_id"]] = row
+        except Exception as e:
+            logger.error(f"Error processing job {raw_job.get('_id', 'unknown')}: {str(e)}")
+            statuses[raw_job["_id"]] = ("error_processing", str(e))
+
     async with async_session_maker() as pg_db:
-        processed_count = 0
-        
-        for raw_job in raw_jobs:
-            try:
-                success = await process_and_save_job(pg_db, raw_job)
-                
-                # Atualizando o status no Mongo
-                new_status = "processed" if success else "error_processing"
-                await raw_jobs_collection.update_one(
-                    {"_id": raw_job["_id"]},
-                    {"$set": {"status": new_status, "processed_at": datetime.now(timezone.utc)}}
-                )
-                
-                if success:
-                    processed_count += 1
-            except Exception as e:
-                logger.error(f"Error processing job {raw_job.get('_id', 'unknown')}: {str(e)}")
-                await raw_jobs_collection.update_one(
-                    {"_id": raw_job["_id"]},
-                    {"$set": {"status": "error_processing", "error_message": str(e)}}
-                )
-        return processed_count
-
-
-async def process_and_save_job(pg_db: AsyncSession, raw_data: dict) -> bool:
+        try:
+            # Deduplicação em lote: uma consulta por chave (external_id, fingerprint, hash da URL, título + empresa),
+            # depois um único INSERT ... ON CONFLICT (external_id) e um commit para o lote inteiro
+            candidates = list(rows.values())
+            dedup = await dedupe_rows(pg_db, candidates)
+            new_rows = [candidates[i] for i in dedup.new]
+            upserted = await crud_job.bulk_upsert(pg_db, new_rows) if new_rows else []
+            logger.info(f"Saved {len(new_rows)} jobs to DB ({dedup.duplicates} already existed)")
+        except Exception as e:
+            logger.error(f"Error saving batch of {len(rows)} jobs: {str(e)}")
+            await pg_db.rollback()
+            upserted = []
+            for raw_id in rows:
+                statuses[raw_id] = ("error_processing", str(e))
+
+        # Mesma vaga em outras fontes (MinHash/LSH): as vagas já estão salvas, então falha aqui não é erro do lote
+        try:
+            await link_near_duplicates(pg_db, [u.id for u in upserted if u.inserted])
+        except Exception as e:
+            logger.warning(f"Near-duplicate linking skipped: {str(e)}")
+            await pg_db.rollback()
+
+    # Atualizando o status no Mongo
+    processed_count = 0
+    for raw_id, (status, error_message) in statuses.items():
+        fields = {"status": status, "processed_at": datetime.now(timezone.utc)}
+        if error_message:
+            fields["error_message"] = error_message
+        await raw_jobs_collection.update_one({"_id": raw_id}, {"$set": fields})
+        if status == "processed":
+            processed_count += 1
+    return processed_count
+
+
+def extract_fallback_fields(raw_html: str):
+    """Título e descrição a partir do HTML bruto (roda no pool de parse)."""
+    soup = make_soup(raw_html)
+    # Exemplo simples de fallback (O ideal é ter regras por source)
+    title_tag = soup.find('h1')
+    title = title_tag.text.strip() if title_tag else "Sem Título"
+    description = soup.text.strip()[:1000] # Simplificação
+    return title, description
+
+
+async def prepare_job_row(raw_data: dict) -> Optional[dict]:
     """
-    Limpa o HTML e salva no banco relacional (PostgreSQL).
-    Retorna True se salvou com sucesso.
+    Limpa o HTML e monta a linha para o banco relacional (PostgreSQL).
+    Retorna None quando o documento não tem dados suficientes.
     """
     source_url = raw_data.get("url")
     external_id = raw_data.get("_id") # Idealmente deve ser um hash único da URL (ex: url_hash)
     
     if not external_id or not source_url:
-        return False
+        return None
         
     # Extrair/Limpar dados base do HTML ou JSON salvo
     raw_html = raw_data.get("raw_html", "")
@@ -84,13 +118,12 @@ async def process_and_save_job(pg_db: AsyncSession, raw_data: dict) -> bool:
     
     # Se o crawler salvou raw_html bruto sem parsear, o ETL pode fazer isso aqui:
     if raw_html and (not description or not title):
-        soup = BeautifulSoup(raw_html, "html.parser")
-        # Exemplo simples de fallback (O ideal é ter regras por source)
+        # Parse fora do event loop (pool de processos para HTML grande)
+        html_title, html_description = await parse_executor.run(extract_fallback_fields, raw_html)
         if not title:
-            title_tag = soup.find('h1')
-            title = title_tag.text.strip() if title_tag else "Sem Título"
+            title = html_title
         if not description:
-            description = soup.text.strip()[:1000] # Simplificação
+            description = html_description
             
     # --- Normalização ---
     title = title.strip()
@@ -107,29 +140,13 @@ async def process_and_save_job(pg_db: AsyncSession, raw_data: dict) -> bool:
     elif any(keyword in title.lower() for keyword in ["remoto", "remote"]):
         is_remote = True
         
-    # --- Deduplicação Inteligente no Postgres ---
-    # Verifica se já existe um `external_id`
-    stmt = select(Job).where(Job.external_id == str(external_id))
-    result = await pg_db.execute(stmt)
-    existing_job = result.scalars().first()
-    
-    if existing_job:
-        logger.debug(f"Job {external_id} already exists in DB. Skipping insert.")
-        return True # Já existe, mas o processamento terminou com sucesso = Ignorar no Mongo
-        
-    # Ou por URL
-    stmt_url = select(Job).where(Job.source_url == source_url)
-    result_url = await pg_db.execute(stmt_url)
-    existing_job_url = result_url.scalars().first()
-    
-    if existing_job_url:
-        logger.debug(f"Job with URL {source_url} already exists. Skipping insert.")
-        return True
-        
+    # A deduplicação contra o Postgres é feita em lote em process_batch
     # Regras adicionais de negócios, salário parse, extração de tech poderiam ser inseridas aqui
 
-    new_job = Job(
+    return dict(
         external_id=str(external_id),
+        fingerprint=job_fingerprint(source_url, title, company, location),
+        source_url_hash=url_hash(source_url),
         title=title,
         company=company,
         description=description,
@@ -139,11 +156,6 @@ async def process_and_save_job(pg_db: AsyncSession, raw_data: dict) -> bool:
         source_url=source_url,
         posted_date=datetime.now(timezone.utc), # Ideal é extrair a data real da vaga
     )
-    
-    pg_db.add(new_job)
-    await pg_db.commit()
-    logger.info(f"Saved job to DB: {title} na {company}")
-    return True
 
 async def worker_loop():
     logger.info("ETL Worker started.")
@@ -163,3 +175,5 @@ if __name__ == "__main__":
         asyncio.run(worker_loop())
     except KeyboardInterrupt:
         logger.info("ETL Worker stopped.")
+    finally:
+        parse_executor.shutdown()
@@ -0,0 +1,45 @@
+"""
+Sign and cluster jobs stored before near-duplicate detection existed.
+
+Walks jobs without a MinHash signature in id order (oldest first, so the
+oldest copy of a vacancy stays canonical) and runs the same linking stage as
+ingestion. Safe to re-run: jobs already signed are skipped.
+
+    python scripts/backfill_near_duplicates.py [--batch 500]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+from app.services.jobsearch.near_dup import link_near_duplicates
+
+
+async def backfill(batch_size: int):
+    signed = linked = 0
+    last_id = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            result = await db.execute(
+                select(Job.id).where(Job.id > last_id, Job.minhash.is_(None)).order_by(Job.id).limit(batch_size)
+            )
+            job_ids = result.scalars().all()
+            if not job_ids:
+                break
+            linked += len(await link_near_duplicates(db, job_ids))
+            signed += len(job_ids)
+            last_id = job_ids[-1]
+            print(f"  {signed} jobs signed, {linked} linked to an older copy")
+    print(f"Done: {signed} jobs signed, {linked} near-duplicates linked")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch", type=int, default=500)
+    asyncio.run(backfill(parser.parse_args().batch))
@@ -0,0 +1,108 @@
+"""
+Benchmark scraper HTML parsing.
+
+1. Parser throughput: parse_listing() on a synthetic vagas.com.br page with
+   the stdlib html.parser vs lxml (when installed).
+2. Event-loop impact: N pages parsed inline vs through parse_executor, while a
+   ticker task measures the worst event-loop stall.
+
+Usage: python scripts/bench_html_parsing.py [--cards 300] [--pages 16] [--workers 4]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Setup path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from app.infrastructure.parsing import html_parser
+from app.infrastructure.parsing.html_parser import ParseExecutor
+from app.services.jobsearch.vagas import parse_listing
+
+CARD = """
+<li class="vaga">
+  <header class="info-header"><h2 class="cargo">
+    <a class="link-detalhes-vaga" href="/vagas/v{i}/desenvolvedor-python-{i}">Desenvolvedor Python {i}</a>
+  </h2></header>
+  <span class="emprVaga">Empresa {i} Tecnologia</span>
+  <span class="vaga-local">{city}</span>
+  <div class="detalhes"><p>Atuar com Python, FastAPI, PostgreSQL e AWS. Experiência com Docker,
+  testes automatizados e integração contínua. Benefícios: VR, VA, plano de saúde. {i}</p></div>
+</li>"""
+
+
+def build_page(cards: int) -> str:
+    body = "".join(CARD.format(i=i, city="Remoto" if i % 3 == 0 else "São Paulo - SP") for i in range(cards))
+    return f"<html><head><title>Vagas</title></head><body><ul>{body}</ul></body></html>"
+
+
+def bench_parsers(html: str, cards: int, rounds: int = 5):
+    parsers = ["html.parser"]
+    if html_parser.HTML_PARSER != "html.parser":
+        parsers.append(html_parser.HTML_PARSER)
+    size_mb = len(html.encode()) / 1e6
+    print(f"page: {cards} cards, {size_mb:.2f} MB")
+    for name in parsers:
+        html_parser.HTML_PARSER = name
+        started = time.perf_counter()
+        for _ in range(rounds):
+            html_parser.make_soup(html)
+        tree = (time.perf_counter() - started) / rounds
+        started = time.perf_counter()
+        for _ in range(rounds):
+            jobs = parse_listing(html, cards)
+        per_page = (time.perf_counter() - started) / rounds
+        print(
+            f"  {name:12s} tree {tree * 1000:7.1f} ms  parse_listing {per_page * 1000:7.1f} ms/page"
+            f"  {size_mb / per_page:5.2f} MB/s  ({len(jobs)} jobs)"
+        )
+
+
+async def _ticker(stop: asyncio.Event, interval: float = 0.005) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - before - interval)
+    return worst
+
+
+async def bench_event_loop(html: str, cards: int, pages: int, workers: int):
+    modes = {
+        "inline": ParseExecutor(max_workers=0, inline_bytes=len(html) + 1),
+        "thread": ParseExecutor(max_workers=0, inline_bytes=0),
+        f"pool x{workers}": ParseExecutor(max_workers=workers, inline_bytes=0),
+    }
+    print(f"{pages} pages, concurrently:")
+    for name, executor in modes.items():
+        if executor.enabled:  # start every worker outside the timing
+            await asyncio.gather(*(executor.run(parse_listing, html, 1) for _ in range(workers)))
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(executor.run(parse_listing, html, cards) for _ in range(pages)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        worst_stall = await ticker
+        executor.shutdown()
+        print(f"  {name:10s} {elapsed:6.2f} s total  {pages / elapsed:6.1f} pages/s  worst loop stall {worst_stall * 1000:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper HTML parsing")
+    parser.add_argument("--cards", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    html = build_page(args.cards)
+    default_parser = html_parser.HTML_PARSER
+    bench_parsers(html, args.cards)
+    html_parser.HTML_PARSER = default_parser
+    asyncio.run(bench_event_loop(html, args.cards, args.pages, args.workers))
+
+
+if __name__ == "__main__":
+    main()
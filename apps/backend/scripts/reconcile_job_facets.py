@@ -0,0 +1,29 @@
+"""
+Recount the explore facet counters (job_facet_counts) from the jobs table.
+
+The counters are maintained by triggers on jobs, so they only drift if those
+were bypassed (e.g. disabled during a bulk load). Safe to run at any time,
+e.g. nightly from cron; prints any drift it corrected.
+
+    python scripts/reconcile_job_facets.py
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from app.crud import job_facet
+from app.database import AsyncSessionLocal
+
+
+async def reconcile():
+    async with AsyncSessionLocal() as db:
+        drift = await job_facet.reconcile(db)
+    for (platform, is_remote), (counted, actual) in sorted(drift.items()):
+        print(f"  {platform} remote={is_remote}: {counted} -> {actual}")
+    print(f"Done: {len(drift)} counters corrected")
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile())
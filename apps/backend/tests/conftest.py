@@ -1,3 +1,5 @@
+import importlib
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
@@ -6,6 +8,9 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from app.main import app
 from app.database import Base, get_db
 
+# The module itself: app.api.v1 re-exports its router under the same name
+resumes_api = importlib.import_module("app.api.v1.resumes")
+
 # Use an in-memory SQLite database for fast unit testing with aiosqlite
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -14,7 +19,9 @@ engine = create_async_engine(
     connect_args={"check_same_thread": False},
     # poolclass=StaticPool # if needed for in-memory sharing
 )
-TestingSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+# expire_on_commit=False like the app's sessions, so objects stay readable after a commit
+TestingSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession, expire_on_commit=False)
+
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
 async def setup_db():
@@ -44,7 +51,10 @@ async def db(setup_db):
                 await conn.execute(table.delete())
 
 @pytest_asyncio.fixture()
-async def client(db):
+async def client(db, tmp_path, monkeypatch):
+    # Uploaded resumes go to a per-test directory, not the app's uploads/
+    monkeypatch.setattr(resumes_api, "UPLOAD_DIR", tmp_path / "resumes")
+
     async def override_get_db():
         yield db
 
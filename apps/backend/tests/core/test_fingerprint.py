@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.core.fingerprint import canonical_url, job_fingerprint, stable_hash
+from app.crud.job import job as crud_job
+from app.models.job import Job
+
+
+def test_equivalent_urls_share_a_fingerprint():
+    assert canonical_url("HTTP://www.Vagas.com.br/vagas/v1//?utm_source=x&b=2&a=1#top") == "https://vagas.com.br/vagas/v1?a=1&b=2"
+    assert job_fingerprint("https://acme.com/jobs/1/?trk=feed", "Dev  Python", "Açme", None) == \
+        job_fingerprint("https://www.acme.com/jobs/1", "dev python", "acme", "")
+    assert job_fingerprint("https://acme.com/jobs/1", "Dev", "Acme", "SP") != \
+        job_fingerprint("https://acme.com/jobs/2", "Dev", "Acme", "SP")
+
+
+def test_fingerprint_is_stable_across_processes():
+    code = "from app.core.fingerprint import job_fingerprint, stable_hash; print(job_fingerprint('https://a.com/1', 'Dev', 'Acme', 'SP'), stable_hash('https://a.com/1'))"
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert outputs == {f"{job_fingerprint('https://a.com/1', 'Dev', 'Acme', 'SP')} {stable_hash('https://a.com/1')}"}
+
+
+@pytest.mark.asyncio
+async def test_rows_get_a_fingerprint_on_insert(db):
+    db.add(Job(
+        external_id="fp_1", title="Backend Dev", company="Acme", location="Remote",
+        source_platform="test", source_url="https://acme.com/jobs/1",
+    ))
+    await db.commit()
+
+    fingerprint = job_fingerprint("https://www.acme.com/jobs/1/", "backend dev", "ACME", "remote")
+    (found,) = await crud_job.find_existing(db, [{"external_id": "fp_2", "fingerprint": fingerprint}])
+    assert found is not None and found.external_id == "fp_1"
@@ -0,0 +1,94 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.core.cursor import InvalidCursor, decode_cursor, encode_cursor
+from app.crud.job import job as crud_job
+from app.crud.user_job import user_job as crud_user_job
+from app.models.user import User
+from tests.factories import make_row
+
+
+@pytest_asyncio.fixture
+async def auth_client(client):
+    creds = {"email": "pages@test.com", "username": "pages@test.com", "password": "Password123!", "full_name": "Pages"}
+    await client.post("/api/v1/auth/signup", json=creds)
+    response = await client.post("/api/v1/auth/login", data={"username": creds["email"], "password": creds["password"]})
+    client.headers.update({"Authorization": f"Bearer {response.json()['access_token']}"})
+    return client
+
+
+async def _walk(fetch):
+    """Follow cursors until the last page; returns the page sizes and all ids in order."""
+    sizes, ids, cursor = [], [], None
+    while True:
+        page, cursor = await fetch(cursor)
+        sizes.append(len(page))
+        ids.extend(page)
+        if cursor is None:
+            return sizes, ids
+
+
+def test_cursor_round_trip():
+    token = encode_cursor("recommended", 87.5, 42)
+    assert "=" not in token
+    assert decode_cursor(token, "recommended", 2) == [87.5, 42]
+    for bad in ("not-a-cursor", encode_cursor("explore", 42)):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(bad, "recommended", 2)
+
+
+@pytest.mark.asyncio
+async def test_explore_and_search_pages(client, db):
+    rows = await crud_job.bulk_upsert(db, [
+        make_row(f"page_{i}", title=f"Desenvolvedor Python {i}", is_remote=i % 2 == 0,
+                 source_platform="gupy" if i < 5 else "catho")
+        for i in range(7)
+    ])
+    newest_first = sorted((r.id for r in rows), reverse=True)
+
+    async def explore(cursor, **params):
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {}), **params}
+        data = (await client.get("/api/v1/jobs/explore", params=params)).json()
+        assert data["has_more"] == (data["next_cursor"] is not None)
+        return [j["id"] for j in data["jobs"]], data["next_cursor"]
+
+    assert await _walk(explore) == ([3, 3, 1], newest_first)
+    sizes, ids = await _walk(lambda c: explore(c, platform="gupy"))
+    assert ids == newest_first[2:]
+
+    # Search pages carry a rank position tied to the query and filters
+    sizes, ids = await _walk(lambda c: explore(c, q="python"))
+    assert sizes == [3, 3, 1] and sorted(ids) == sorted(newest_first)
+    _, cursor = await explore(None, q="python")
+    response = await client.get("/api/v1/jobs/explore", params={"q": "python", "platform": "gupy", "cursor": cursor})
+    assert response.status_code == 400
+
+    response = await client.get("/api/v1/jobs/explore", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_recommended_pages_over_ties_and_unscored(auth_client, db):
+    rows = await crud_job.bulk_upsert(db, [make_row(f"page_{i}", title=f"Desenvolvedor Python {i}") for i in range(8)])
+    ids = [r.id for r in rows]
+    user_id = (await db.execute(select(User.id).where(User.email == "pages@test.com"))).scalar_one()
+    scores = {ids[0]: 90.0, ids[1]: 70.0, ids[2]: 70.0, ids[3]: 70.0, ids[4]: 50.0, ids[5]: None, ids[6]: None}
+    await crud_user_job.bulk_upsert_scores(db, user_id, scores)
+
+    async def recommended(cursor):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await auth_client.get("/api/v1/jobs/recommended", params=params)
+        assert response.status_code == 200
+        return [j["id"] for j in response.json()], response.headers.get("X-Next-Cursor")
+
+    sizes, seen = await _walk(recommended)
+    assert sizes == [2, 2, 2, 1]
+    assert seen == [ids[0], ids[3], ids[2], ids[1], ids[4], ids[6], ids[5]]
+
+    async def search(cursor):
+        params = {"query": "python", "limit": 5, **({"cursor": cursor} if cursor else {})}
+        response = await auth_client.post("/api/v1/jobs/search", params=params)
+        return [j["id"] for j in response.json()], response.headers.get("X-Next-Cursor")
+
+    assert await _walk(search) == ([5, 3], sorted(ids, reverse=True))
@@ -0,0 +1,29 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_scraper_stats_requires_auth(client):
+    response = await client.get("/api/v1/stats/scrapers")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_scraper_stats_lists_breakers(client):
+    from app.services.jobsearch.health import scraper_health
+
+    await client.post(
+        "/api/v1/auth/signup",
+        json={"email": "stats@test.com", "username": "stats@test.com", "password": "Password123!", "full_name": "Stats User"}
+    )
+    response = await client.post("/api/v1/auth/login", data={"username": "stats@test.com", "password": "Password123!"})
+    client.headers.update({"Authorization": f"Bearer {response.json()['access_token']}"})
+
+    health = scraper_health.get("GupyScraper")
+    health.record(True, 0.4)
+    response = await client.get("/api/v1/stats/scrapers")
+
+    assert response.status_code == 200
+    gupy = next(s for s in response.json()["scrapers"] if s["scraper"] == "GupyScraper")
+    assert gupy["state"] == "closed"
+    assert gupy["p50_seconds"] == 0.4
+    scraper_health.reset()
@@ -0,0 +1,22 @@
+"""Builders for the jobs used across the test suite."""
+from app.services.jobsearch.models import ScrapedJob
+
+
+def make_job(external_id: str, **fields) -> ScrapedJob:
+    """A ScrapedJob for tests; fields not given get filler values."""
+    return ScrapedJob(**{
+        "title": f"Job {external_id}",
+        "company": "Acme",
+        "location": "Remote",
+        "is_remote": True,
+        "description": "",
+        "url": f"https://jobs.example.com/{external_id}",
+        "external_id": external_id,
+        "source_platform": "test",
+        **fields,
+    })
+
+
+def make_row(external_id: str, **fields) -> dict:
+    """make_job() as the row crud.job.bulk_upsert writes."""
+    return make_job(external_id, **fields).to_job_row()
@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from app.infrastructure.http.client_pool import HTTPClientPool
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_per_host():
+    pool = HTTPClientPool()
+    a = pool.get_client("https://remoteok.com/api")
+    b = pool.get_client("https://remoteok.com/remote-dev-jobs")
+    c = pool.get_client("https://portal.api.gupy.io/api/v1/jobs")
+
+    assert a is b
+    assert a is not c
+    assert pool.size == 2
+
+    await pool.aclose()
+    assert a.is_closed and c.is_closed
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_goes_through_shared_pool():
+    from app.services.jobsearch.gupy import GupyScraper
+
+    scraper = GupyScraper()
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_get, \
+         patch("app.services.jobsearch.base.http_client_pool", HTTPClientPool()) as pool:
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+
+        await scraper.fetch("https://portal.api.gupy.io/api/v1/jobs")
+        await scraper.fetch("https://portal.api.gupy.io/api/v1/jobs")
+
+        assert mock_get.await_count == 2
+        assert pool.size == 1
+        await pool.aclose()
+
+
+def test_clients_of_a_finished_loop_are_closed():
+    import asyncio
+
+    pool = HTTPClientPool()
+
+    async def open_client():
+        return pool.get_client("https://remoteok.com/api")
+
+    stale = asyncio.run(open_client())
+
+    async def next_run():
+        fresh = pool.get_client("https://remoteok.com/api")
+        await pool.aclose()
+        return fresh
+
+    fresh = asyncio.run(next_run())
+    assert fresh is not stale
+    assert stale.is_closed and fresh.is_closed
+
+
+@pytest.mark.asyncio
+async def test_post_goes_through_shared_pool():
+    from app.services.jobsearch.exa_scraper import ExaScraper
+
+    scraper = ExaScraper()
+    scraper.api_key = "test"
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request, \
+         patch("app.services.jobsearch.base.http_client_pool", HTTPClientPool()) as pool:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"results": [{"title": "Python Dev", "url": "https://acme.io/1"}]}
+        mock_request.return_value = mock_response
+
+        jobs = await scraper.search_jobs("python", limit=1)
+
+        assert [job.title for job in jobs] == ["Python Dev"]
+        method, url = mock_request.await_args.args[:2]
+        assert method == "POST" and mock_request.await_args.kwargs["json"]["numResults"] == 1
+        assert pool.size == 1
+        await pool.aclose()
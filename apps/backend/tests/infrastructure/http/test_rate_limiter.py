@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from app.infrastructure.http.rate_limiter import HostRateLimiter, TokenBucket, parse_retry_after
+from app.services.jobsearch import deadline as search_deadline
+
+
+def test_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=2.0, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # Third request must wait roughly one interval (1 / 2 req/s)
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
+
+
+def test_bucket_backs_off_and_recovers():
+    bucket = TokenBucket(rate=4.0, burst=1, recovery_successes=3)
+    bucket.on_throttle()
+    assert bucket.rate == 2.0
+
+    for _ in range(3):
+        bucket.on_success()
+    assert bucket.rate == 2.5
+
+    for _ in range(30):
+        bucket.on_success()
+    assert bucket.rate == 4.0  # never above the configured budget
+
+
+def test_retry_after_blocks_bucket():
+    bucket = TokenBucket(rate=10.0, burst=5)
+    bucket.on_throttle(retry_after=3)
+    assert bucket.reserve() >= 2.9
+
+
+
+@pytest.mark.asyncio
+async def test_acquire_does_not_sleep_past_the_search_deadline():
+    bucket = TokenBucket(rate=10.0, burst=1)
+    bucket.on_throttle(retry_after=30)
+    with search_deadline.deadline_scope(0.2):
+        started = time.monotonic()
+        with pytest.raises(search_deadline.DeadlineExceeded):
+            await bucket.acquire()
+    assert time.monotonic() - started < 0.1
+
+def test_limiter_uses_per_host_budgets():
+    from app.core.config import settings
+
+    limiter = HostRateLimiter()
+    gupy = limiter.bucket(limiter.host_of("https://portal.api.gupy.io/api/v1/jobs"))
+    unknown = limiter.bucket(limiter.host_of("https://example.org/jobs"))
+
+    assert gupy.max_rate == settings.SCRAPER_RATE_LIMITS["portal.api.gupy.io"]
+    assert unknown.max_rate == pytest.approx(1.0 / settings.SCRAPER_RATE_LIMIT_DELAY)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,115 @@
+import os
+import time
+
+import httpx
+import pytest
+
+from app.infrastructure.http import response_cache as cache_module
+from app.infrastructure.http.response_cache import ResponseCache
+from app.services.jobsearch.base import BaseScraper
+
+
+class DummyScraper(BaseScraper):
+    CACHE_TTL = 0  # always revalidate
+
+    async def search_jobs(self, query, limit=10):
+        return []
+
+
+class FakeClient:
+    """Serves a 200 with an ETag, then 304 when the ETag is sent back."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def request(self, method, url, params=None, json=None, headers=None, timeout=None):
+        self.requests.append(headers)
+        request = httpx.Request("GET", url, params=params)
+        if headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'}, request=request)
+        return httpx.Response(
+            200, headers={"ETag": '"v1"'}, json={"data": [1, 2, 3]}, request=request
+        )
+
+
+def test_key_ignores_param_order():
+    a = ResponseCache.make_key("get", "https://x.io/jobs", {"q": "python", "page": 2})
+    b = ResponseCache.make_key("GET", "https://x.io/jobs", {"page": 2, "q": "python"})
+    assert a == b
+    assert a != ResponseCache.make_key("GET", "https://x.io/jobs", {"q": "python", "page": 3})
+
+
+@pytest.mark.asyncio
+async def test_store_roundtrip_and_no_store(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_age_seconds=3600)
+    request = httpx.Request("GET", "https://x.io/jobs")
+
+    ok = httpx.Response(200, headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, content=b"hello", request=request)
+    await cache.store("k1", ok)
+    entry = await cache.get("k1")
+    assert entry.body == b"hello"
+    assert entry.conditional_headers() == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    private = httpx.Response(200, headers={"Cache-Control": "no-store"}, content=b"x", request=request)
+    await cache.store("k2", private)
+    assert await cache.get("k2") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_revalidates_with_etag(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path), max_age_seconds=3600)
+    client = FakeClient()
+    monkeypatch.setattr("app.services.jobsearch.base.response_cache", cache)
+    monkeypatch.setattr(
+        "app.services.jobsearch.base.http_client_pool.get_client", lambda url, proxy=None: client
+    )
+
+    scraper = DummyScraper()
+    url = "https://api.example.org/jobs"
+    first = await scraper.fetch(url, params={"q": "python"})
+    second = await scraper.fetch(url, params={"q": "python"})
+
+    assert first.json() == second.json() == {"data": [1, 2, 3]}
+    assert "If-None-Match" not in client.requests[0]
+    assert client.requests[1]["If-None-Match"] == '"v1"'
+    assert cache.stats() == {"hits": 0, "revalidated": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_skips_network(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path), max_age_seconds=3600)
+    client = FakeClient()
+    monkeypatch.setattr("app.services.jobsearch.base.response_cache", cache)
+    monkeypatch.setattr(
+        "app.services.jobsearch.base.http_client_pool.get_client", lambda url, proxy=None: client
+    )
+
+    scraper = DummyScraper()
+    scraper.CACHE_TTL = 60
+    await scraper.fetch("https://api.example.org/jobs")
+    await scraper.fetch("https://api.example.org/jobs")
+
+    assert len(client.requests) == 1
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_sweep_expired_entries(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_age_seconds=3600, purge_interval_seconds=0)
+    request = httpx.Request("GET", "https://x.io/jobs")
+    await cache.store("old", httpx.Response(200, content=b"old", request=request))
+    await cache._purge_task
+    old_path = cache._path("old")
+    os.utime(old_path, (time.time() - 7200, time.time() - 7200))
+
+    # Never read again, the old entry still goes with the next sweep
+    await cache.store("new", httpx.Response(200, content=b"new", request=request))
+    assert await cache._purge_task == 1
+    assert not os.path.exists(old_path) and os.path.exists(cache._path("new"))
+    assert cache.stats() == {"hits": 0, "revalidated": 0, "misses": 2}
+
+
+def test_singleton_uses_settings():
+    from app.core.config import settings
+
+    assert cache_module.response_cache.max_age_seconds == settings.CACHE_TTL_HOURS * 3600
@@ -0,0 +1,61 @@
+import multiprocessing
+import os
+
+import pytest
+
+from app.infrastructure.parsing.html_parser import ParseExecutor
+from app.services.jobsearch.vagas import parse_listing
+
+CARD = """
+<li class="vaga">
+  <h2 class="cargo"><a class="link-detalhes-vaga" href="/vagas/v{i}/python-{i}">Desenvolvedor Python {i}</a></h2>
+  <span class="emprVaga">Empresa {i}</span>
+  <span class="vaga-local">Remoto</span>
+  <div class="detalhes"><p>FastAPI, PostgreSQL e AWS.</p></div>
+</li>"""
+
+
+def build_page(cards: int) -> str:
+    return "<html><body><ul>" + "".join(CARD.format(i=i) for i in range(cards)) + "</ul></body></html>"
+
+
+def crash_in_worker(html: str) -> str:
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return "parsed in the app process"
+
+
+@pytest.mark.asyncio
+async def test_pool_matches_inline_parse():
+    html = build_page(40)
+    executor = ParseExecutor(max_workers=1, inline_bytes=0)
+    try:
+        pooled = await executor.run(parse_listing, html, 40)
+    finally:
+        executor.shutdown()
+
+    inline = parse_listing(html, 40)
+    assert executor.stats()["pooled"] == 1
+    assert len(pooled) == 40
+    assert [j.external_id for j in pooled] == [j.external_id for j in inline]  # stable across processes
+    assert pooled[0].company == "Empresa 0" and pooled[0].is_remote
+
+
+@pytest.mark.asyncio
+async def test_small_pages_are_parsed_inline():
+    executor = ParseExecutor(max_workers=1, inline_bytes=1_000_000)
+    jobs = await executor.run(parse_listing, build_page(3), 10)
+    assert len(jobs) == 3
+    assert executor.stats()["inline"] == 1
+    assert executor._pool is None
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_thread():
+    executor = ParseExecutor(max_workers=1, inline_bytes=0)
+    try:
+        assert await executor.run(crash_in_worker, "<html></html>") == "parsed in the app process"
+        assert executor.stats()["fallbacks"] == 1
+        assert executor._pool is None  # rebuilt on the next call
+    finally:
+        executor.shutdown()
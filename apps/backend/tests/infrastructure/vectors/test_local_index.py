@@ -0,0 +1,133 @@
+import threading
+
+import numpy as np
+import pytest
+
+from app.infrastructure.vectors.local_index import LocalVectorIndex, _Namespace
+from app.services.local_vector_service import LocalVectorService
+
+DIM = 32
+
+
+def _clustered(n, seed=0, clusters=40):
+    """Unit vectors grouped around random centres, like real embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, DIM))
+    data = centres[rng.integers(0, clusters, n)] + 0.3 * rng.normal(size=(n, DIM))
+    return (data / np.linalg.norm(data, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _exact_top(data, query, k):
+    return set(np.argsort(-(data @ (query / np.linalg.norm(query))))[:k].tolist())
+
+
+def test_brute_force_is_exact(tmp_path):
+    data = _clustered(500)
+    index = LocalVectorIndex(str(tmp_path), ivf_threshold=10_000)
+    index.upsert("jobs", [(i, v, {}) for i, v in enumerate(data)])
+
+    query = data[7] + 0.1
+    hits = index.search("jobs", query, top_k=10)
+    assert {h[0] for h in hits} == _exact_top(data, query, 10)
+    assert hits[0][1] >= hits[-1][1]
+
+
+def test_ivf_recall(tmp_path):
+    data = _clustered(6000)
+    index = LocalVectorIndex(str(tmp_path), ivf_threshold=2000, nprobe=8)
+    for start in range(0, len(data), 1000):
+        index.upsert("jobs", [(i, data[i], {}) for i in range(start, start + 1000)])
+    assert index._namespace("jobs").centroids is not None
+
+    queries = _clustered(50, seed=1)
+    recall = np.mean([
+        len({h[0] for h in index.search("jobs", q, top_k=10)} & _exact_top(data, q, 10)) / 10 for q in queries
+    ])
+    assert recall >= 0.9
+
+
+def test_training_does_not_block_searches_or_writes(tmp_path, monkeypatch):
+    data = _clustered(2100)
+    index = LocalVectorIndex(str(tmp_path), ivf_threshold=2000, nprobe=1)
+    index.upsert("jobs", [(i, data[i], {}) for i in range(1000)])
+
+    fitting, release = threading.Event(), threading.Event()
+    fit = _Namespace.fit
+
+    def slow_fit(snapshot, iterations=10):
+        fitted = fit(snapshot, iterations)
+        fitting.set()
+        assert release.wait(5)
+        return fitted
+
+    monkeypatch.setattr(_Namespace, "fit", staticmethod(slow_fit))
+    trainer = threading.Thread(target=index.upsert, args=("jobs", [(i, data[i], {}) for i in range(1000, 2000)]))
+    trainer.start()
+    assert fitting.wait(5)
+
+    # While training runs: searches answer (exactly) and writes land, moving a packed row too
+    assert index.search("jobs", data[5], top_k=1)[0][0] == 5
+    moved = int(np.argmin(data[:2000] @ data[2050]))
+    index.upsert("jobs", [(i, data[i], {}) for i in range(2000, 2100)] + [(moved, data[2050], {})])
+    release.set()
+    trainer.join(5)
+
+    ns = index._namespace("jobs")
+    assert ns.centroids is not None and ns.trained_count == 2000 and not ns.training
+    assert index.count("jobs") == 2100
+    assert index.search("jobs", data[2099], top_k=1)[0][0] == 2099
+    assert {h[0] for h in index.search("jobs", data[2050], top_k=2)} == {moved, 2050}
+
+
+def test_filters_and_updates(tmp_path):
+    data = _clustered(300)
+    index = LocalVectorIndex(str(tmp_path), ivf_threshold=10_000)
+    index.upsert("jobs", [
+        (i, v, {"is_remote": i % 2 == 0, "location": "São Paulo" if i % 3 else "Recife", "company": f"c{i % 5}"})
+        for i, v in enumerate(data)
+    ])
+
+    hits = index.search("jobs", data[0], top_k=20, filter={"is_remote": True, "location": "são paulo"})
+    assert len(hits) == 20
+    assert all(job_id % 2 == 0 and job_id % 3 for job_id, _, _ in hits)
+
+    hits = index.search("jobs", data[0], top_k=300, filter={"location": {"$in": ["Recife"]}, "company": {"$ne": "c0"}})
+    assert {job_id for job_id, _, _ in hits} == {i for i in range(300) if i % 3 == 0 and i % 5}
+
+    # Re-upserting an id replaces its vector and metadata instead of adding a row
+    index.upsert("jobs", [(1, data[0], {"is_remote": True, "location": "Recife"})])
+    assert index.count("jobs") == 300
+    hits = index.search("jobs", data[0], top_k=2, filter={"location": "Recife", "is_remote": True})
+    assert {job_id for job_id, _, _ in hits} == {0, 1}
+
+
+def test_persists_across_reopen(tmp_path):
+    data = _clustered(3000)
+    index = LocalVectorIndex(str(tmp_path), ivf_threshold=1000)
+    index.upsert("jobs", [(i + 1, v, {"is_remote": i % 2 == 0}) for i, v in enumerate(data)])
+    expected = index.search("jobs", data[5], top_k=5, filter={"is_remote": False})
+    index.close()
+
+    reopened = LocalVectorIndex(str(tmp_path), ivf_threshold=1000)
+    assert reopened.count("jobs") == 3000
+    assert reopened.search("jobs", data[5], top_k=5, filter={"is_remote": False}) == expected
+    fresh = _clustered(1, seed=2)[0]
+    reopened.upsert("jobs", [(5000, fresh, {"is_remote": False})])
+    assert reopened.search("jobs", fresh, top_k=1, filter={"is_remote": False})[0][0] == 5000
+
+
+def test_service_interface(tmp_path):
+    service = LocalVectorService(LocalVectorIndex(str(tmp_path)))
+    data = _clustered(20)
+    for i, v in enumerate(data):
+        service.upsert_job(job_id=100 + i, embedding=v.tolist(), metadata={"title": f"job {i}", "location": None})
+    service.upsert_resume(resume_id=1, embedding=data[3].tolist(), metadata={"user_id": 9})
+
+    resume_vector = service.get_resume_vector(1)
+    assert resume_vector == pytest.approx(data[3].tolist(), abs=1e-6)
+    assert service.get_resume_vector(2) is None
+
+    matches = service.search_jobs(resume_vector, top_k=3)
+    assert matches[0]["id"] == 103
+    assert matches[0]["score"] == pytest.approx(1.0, abs=1e-5)
+    assert matches[0]["metadata"] == {"title": "job 3"}
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.cache.embedding_cache import EmbeddingCache
+from app.services import embedding_service
+from app.services.embedding_service import EmbeddingEngine, EmbeddingService
+
+
+class FakeEngine(EmbeddingEngine):
+    def __init__(self, **kwargs):
+        super().__init__(api_key=None, **kwargs)
+        self.api_key = "test"  # enabled, without configuring the Gemini client
+        self.batches = []
+
+    def _embed_batch(self, texts, task_type):
+        time.sleep(0.05)  # blocking network round-trip, as in the real client
+        if "boom" in texts:
+            raise RuntimeError("quota exceeded")
+        self.batches.append((task_type, len(texts)))
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_texts_share_batched_requests_off_the_loop():
+    engine = FakeEngine(max_batch=100, max_wait_ms=20, max_concurrency=4)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    tick_task = asyncio.create_task(ticker())
+    texts = [f"job {i}" * (i % 3 + 1) for i in range(200)]
+    vectors, query = await asyncio.gather(
+        engine.embed_many(texts),
+        engine.embed("python remote", task_type="retrieval_query"),
+    )
+    tick_task.cancel()
+
+    assert vectors == [[float(len(t))] for t in texts]
+    assert query == [13.0]
+    assert sorted(engine.batches) == [("retrieval_document", 100), ("retrieval_document", 100), ("retrieval_query", 1)]
+    assert ticks >= 5  # the loop kept running while the requests were in flight
+    assert engine.stats()["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_fails_each_waiting_text():
+    engine = FakeEngine(max_batch=10, max_wait_ms=5)
+    results = await asyncio.gather(engine.embed("boom"), engine.embed("fine"), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert engine.stats()["failed_requests"] == 1
+    assert await engine.embed("fine again") == [10.0]
+
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_fail_others_waiting_on_the_text():
+    engine = FakeEngine(max_batch=10, max_wait_ms=20)
+    cancelled = asyncio.create_task(engine.embed("python dev"))
+    waiting = asyncio.create_task(engine.embed("python dev"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await asyncio.wait_for(waiting, timeout=1) == [10.0]
+    assert cancelled.cancelled()
+
+class ShortEngine(FakeEngine):
+    def _embed_batch(self, texts, task_type):
+        return [[1.0]] * (len(texts) - 1)  # one vector missing from the response
+
+
+@pytest.mark.asyncio
+async def test_short_response_fails_every_waiting_text():
+    engine = ShortEngine(max_batch=10, max_wait_ms=5)
+    results = await asyncio.wait_for(
+        asyncio.gather(engine.embed("a"), engine.embed("b"), engine.embed("c"), return_exceptions=True),
+        timeout=1,
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert engine.stats()["failed_requests"] == 1
+
+
+def test_services_with_the_same_custom_key_share_an_engine(monkeypatch):
+    monkeypatch.setattr(embedding_service.genai, "configure", lambda **kwargs: None)
+    monkeypatch.setattr(embedding_service, "_engines_by_key", {})
+    first, second = EmbeddingService("custom-key"), EmbeddingService("custom-key")
+    assert first.engine is second.engine
+    assert first.engine is not embedding_service.embedding_engine
+    assert EmbeddingService("other-key").engine is not first.engine
+
+
+@pytest.mark.asyncio
+async def test_cached_and_in_flight_texts_are_not_sent_again(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"), max_items=3, memory_items=2)
+    engine = FakeEngine(max_batch=10, max_wait_ms=5)
+    engine.cache = cache
+
+    first = await asyncio.gather(engine.embed("python dev"), engine.embed("python dev"), engine.embed("java dev"))
+    assert first == [[10.0], [10.0], [8.0]]
+    assert engine.stats()["sent"] == 2
+
+    # Whitespace and (for queries) case are normalised away
+    assert await engine.embed("python   dev") == [10.0]
+    await engine.embed("Remote Python", task_type="retrieval_query")
+    assert await engine.embed("remote python", task_type="retrieval_query") == [13.0]
+    assert engine.stats()["sent"] == 3
+
+    # A fresh engine and memory tier still find the vectors on disk
+    reopened = FakeEngine(max_batch=10, max_wait_ms=5)
+    reopened.cache = EmbeddingCache(cache.path, max_items=3, memory_items=2)
+    assert await reopened.embed_many(["java dev", "python dev"]) == [[8.0], [10.0]]
+    assert reopened.stats()["sent"] == 0
+    assert reopened.cache.stats()["disk_hits"] == 2
+
+    # Past max_items the least recently used vectors are evicted
+    await reopened.embed_many(["a", "b"])
+    stats = reopened.cache.stats()
+    assert stats["evicted"] >= 1 and stats["disk_items"] <= 3
+    cache.close()
+    reopened.cache.close()
@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+
+from app.services.jobsearch.base import BaseScraper
+from app.services.jobsearch.feed_index import FeedIndex, FeedRegistry, tokenize, feed_registry
+from tests.factories import make_job
+
+
+FEED = [
+    make_job("feed_0", title="Senior Python Developer", technologies=["python", "django"], source_platform="feedtest"),
+    make_job("feed_1", title="Frontend Engineer", technologies=["react", "node.js"], source_platform="feedtest"),
+    make_job("feed_2", title="Data Analyst", description="<p>SQL and some <b>Python</b> scripting</p>",
+             source_platform="feedtest"),
+    make_job("feed_3", title="C++ Systems Engineer", technologies=["c++"], source_platform="feedtest"),
+]
+
+
+class CountingFeedScraper(BaseScraper):
+    PLATFORM_NAME = "feedtest"
+    IS_FEED_SOURCE = True
+
+    def __init__(self):
+        self.downloads = 0
+
+    async def load_feed(self):
+        self.downloads += 1
+        await asyncio.sleep(0.01)
+        return list(FEED)
+
+    async def search_jobs(self, query, limit=10):
+        return await self.search_feed(query, limit)
+
+
+def test_tokenize_keeps_tech_symbols():
+    assert tokenize("C++, C# and Node.js.") == ["c++", "c#", "and", "node.js"]
+
+
+def test_index_ranks_title_matches_above_description():
+    index = FeedIndex(FEED)
+    results = index.search("python", 10)
+    assert [j.external_id for j in results] == ["feed_0", "feed_2"]
+
+    # prefix matching keeps the old substring behaviour
+    assert [j.external_id for j in index.search("dev", 10)] == ["feed_0"]
+    assert [j.external_id for j in index.search("c++", 10)] == ["feed_3"]
+    assert index.search("cobol", 10) == []
+    assert len(index.search("", 2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_many_queries_share_one_download():
+    feed_registry.invalidate("feedtest")
+    scraper = CountingFeedScraper()
+
+    results = await asyncio.gather(*(scraper.search_jobs(q) for q in ["python", "react", "sql", "c++"] * 5))
+
+    assert scraper.downloads == 1
+    assert results[0][0].external_id == "feed_0"
+    feed_registry.invalidate("feedtest")
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_serves_stale_index():
+    registry = FeedRegistry()
+    await registry.get("k", lambda: asyncio.sleep(0, result=list(FEED)), max_age=60)
+
+    async def broken():
+        raise RuntimeError("feed down")
+
+    index = await registry.get("k", broken, max_age=0)
+    assert len(index) == len(FEED)
+
+    with pytest.raises(RuntimeError):
+        await registry.get("other", broken, max_age=60)
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from app.crud.job import job as crud_job
+from app.models.job import Job
+from app.services.hybrid_search import HybridSearch, reciprocal_rank_fusion
+from tests.factories import make_row
+
+
+class FakeEmbeddings:
+    api_key = "test"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def get_query_embedding(self, text):
+        await asyncio.sleep(self.delay)
+        return [1.0, 0.0]
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.ids = []
+        self.filters = []
+
+    def search_jobs(self, query_embedding, top_k=10, filter=None):
+        self.filters.append(filter)
+        return [{"id": job_id, "score": 1.0 - i / 100, "metadata": {}} for i, job_id in enumerate(self.ids[:top_k])]
+
+
+def test_reciprocal_rank_fusion():
+    # 2 is second in both lists and beats 1 and 3, each first in only one
+    assert reciprocal_rank_fusion([[1, 2, 4], [3, 2]], k=60) == [2, 3, 1, 4]
+    assert reciprocal_rank_fusion([[], [5]]) == [5]
+
+
+@pytest.mark.asyncio
+async def test_fuses_lexical_and_semantic_hits(db):
+    rows = await crud_job.bulk_upsert(db, [
+        make_row("a", title="Desenvolvedor Python", description="APIs com FastAPI", source_platform="gupy"),
+        make_row("b", title="Engenheiro de Dados", description="Pipelines em Python e Spark", source_platform="gupy"),
+        make_row("c", title="Backend Engineer", description="Django REST services", source_platform="gupy"),  # no lexical match
+        make_row("d", title="Analista Python", description="Automação", source_platform="gupy", is_remote=False),
+        make_row("e", title="Desenvolvedor Python Sênior", description="Inativa", source_platform="gupy"),
+    ])
+    a, b, c, d, e = (r.id for r in rows)
+    await db.execute(Job.__table__.update().where(Job.id == e).values(is_active=False))
+    await db.commit()
+
+    store = FakeVectorStore()
+    store.ids = [c, e, b, 999_999]  # an inactive job and an id missing from the DB
+    search = HybridSearch(vector_store=store, embedding_service=FakeEmbeddings(), candidates=50)
+
+    page = await search.search(db, "python", limit=10)
+    ids = [job.id for job in page.jobs]
+    # b ranks high on both sides; c is found only semantically; e and 999999 are not visible
+    assert ids[0] == b
+    assert set(ids) == {a, b, c, d}
+    assert page.total == 4 and page.lexical == 3 and page.semantic == 4
+
+    page = await search.search(db, "python", remote_only=True, platform="gupy", limit=2, offset=1)
+    assert len(page.jobs) == 2 and page.total == 3
+    assert d not in [job.id for job in page.jobs]
+    assert store.filters[-1] == {"is_remote": True, "source_platform": "gupy"}
+
+
+@pytest.mark.asyncio
+async def test_slow_semantic_side_falls_back_to_lexical(db):
+    rows = await crud_job.bulk_upsert(db, [
+        make_row("a", title="Desenvolvedor Python", description="APIs"),
+        make_row("b", title="Backend Engineer", description="Django"),
+    ])
+    store = FakeVectorStore()
+    store.ids = [rows[1].id]
+    search = HybridSearch(vector_store=store, embedding_service=FakeEmbeddings(delay=0.5), semantic_timeout=0.05)
+
+    page = await search.search(db, "python")
+    assert [job.id for job in page.jobs] == [rows[0].id]
+    assert page.semantic == 0 and not page.semantic_used
+    await asyncio.gather(*search._background)  # the late embedding still completes
+
+    # Later pages replay the first page's ranking: lexical only, or waiting for the semantic side
+    calls = len(store.filters)
+    assert [job.id for job in (await search.search(db, "python", semantic=False)).jobs] == [rows[0].id]
+    assert len(store.filters) == calls
+    page = await search.search(db, "python", semantic=True)
+    assert page.semantic_used and {job.id for job in page.jobs} == {rows[0].id, rows[1].id}
+
+
+@pytest.mark.asyncio
+async def test_deep_pages_widen_the_candidates(db):
+    rows = await crud_job.bulk_upsert(db, [make_row(str(i), title=f"Python {i}", description="APIs") for i in range(5)])
+    search = HybridSearch(vector_store=FakeVectorStore(), embedding_service=FakeEmbeddings(), candidates=2)
+
+    seen = []
+    for offset in (0, 2, 4):
+        page = await search.search(db, "python", limit=2, offset=offset)
+        seen += [job.id for job in page.jobs]
+        assert page.has_more == (offset < 4)
+    assert sorted(seen) == sorted(r.id for r in rows)
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from app.services.jobsearch import pipeline as pipeline_module
+from app.services.jobsearch.pipeline import JobIngestion, Pipeline, Stage, ingestion_stats
+from tests.factories import make_job
+
+
+@pytest.mark.asyncio
+async def test_slow_stage_applies_backpressure_without_blocking_earlier_stages():
+    done_fast = []
+    seen_by_slow = []
+
+    async def fast(item):
+        done_fast.append(item[0])
+        return item
+
+    async def slow(item):
+        seen_by_slow.append((item[0], len(done_fast)))
+        await asyncio.sleep(0.02)
+        return item
+
+    async def source():
+        for i in range(10):
+            yield [i]
+
+    pipeline = Pipeline("test", "fetch", [Stage("fast", fast), Stage("slow", slow)], queue_size=2)
+    results = await pipeline.run(source())
+
+    assert [r[0] for r in results] == list(range(10))
+    # fast runs ahead of slow, but only by what the bounded queue holds
+    assert seen_by_slow[0][1] >= 1
+    assert all(fast_done - i <= 4 for i, fast_done in seen_by_slow)
+    stats = ingestion_stats.snapshot()["test"]["stages"]
+    assert stats["fetch"]["items_out"] == stats["slow"]["items_out"] == 10
+    assert stats["slow"]["max_queue_depth"] <= 2
+
+
+# Distinct descriptions, so near-duplicate linking leaves them alone
+JOBS = [
+    make_job(f"pipe_{i}", title=f"Pipeline job {i}", description=f"Unrelated text number {i} " * 5)
+    for i in range(6)
+]
+
+
+@pytest.mark.asyncio
+async def test_job_ingestion_runs_all_stages(db):
+    ingestion = JobIngestion(db, name="test_ingest", admit=lambda batch: [j for j in batch if j.external_id != "pipe_3"])
+    ingestion._embedding_service = False  # no Gemini key in tests
+    jobs = await ingestion.run_jobs(JOBS + [JOBS[0]], batch_size=2)
+
+    assert [j.external_id for j in jobs] == ["pipe_0", "pipe_1", "pipe_2", "pipe_4", "pipe_5", "pipe_0"]
+    assert (ingestion.scraped, ingestion.inserted, ingestion.duplicates) == (7, 5, 1)
+    stages = ingestion.pipeline.snapshot()["stages"]
+    assert stages["persist"]["items_out"] == 6 and stages["score"]["errors"] == 0
+
+
+class SlowEmbeddings:
+    api_key = "test"
+
+    async def get_embeddings(self, texts):
+        await asyncio.sleep(0.05)  # the next batch's failed write rolls back meanwhile
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_counted_and_does_not_break_later_stages(db, monkeypatch):
+    indexed = []
+    monkeypatch.setattr(pipeline_module.vector_writer, "enqueue_job", lambda job_id, vector, metadata: indexed.append(metadata["title"]))
+
+    def prepare_row(sj, row):
+        if sj.external_id == "pipe_3":
+            row["title"] = None  # NOT NULL: the whole batch's write fails
+        return row
+
+    ingestion = JobIngestion(db, name="test_ingest_failure", prepare_row=prepare_row)
+    ingestion._embedding_service = SlowEmbeddings()
+    jobs = await ingestion.run_jobs(JOBS[:4], batch_size=2)
+
+    assert [j.title for j in jobs] == ["Pipeline job 0", "Pipeline job 1"]
+    assert (ingestion.inserted, ingestion.failed, ingestion.duplicates) == (2, 2, 0)
+    assert sorted(indexed) == ["Pipeline job 0", "Pipeline job 1"]
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import event
+
+from app.crud.job import job as crud_job
+from app.services.jobsearch.dedup import dedupe_rows
+from tests.factories import make_row
+
+
+@pytest.mark.asyncio
+async def test_batch_is_resolved_with_one_query_per_key(db):
+    await crud_job.bulk_upsert(db, [
+        make_row("dd_1", title="Stored by id"),
+        make_row("dd_2", title="Stored by url", url="https://www.jobs.example.com/42/"),
+        make_row("dd_3", title="Stored by name", company="Globex"),
+        # No URL hash: only the fingerprint (normalized title, company, URL) can match it
+        {**make_row("dd_4", title="Senior Dev", url="https://acme.example.com/s4"), "source_url_hash": None},
+    ])
+
+    rows = [make_row(f"new_{i}", title=f"Fresh job {i}") for i in range(295)]
+    rows += [
+        make_row("dd_1", title="Renamed"),                                                    # same external_id
+        make_row("other_2", title="Other", url="https://jobs.example.com/42?utm_source=x"),  # same URL
+        make_row("other_3", title="Stored by name", company="Globex"),                        # same title + company
+        {**make_row("other_4", title="senior  dev", company="ACME", url="https://www.acme.example.com/s4/"),
+         "source_url_hash": None},                                                            # same fingerprint
+        make_row("new_0", title="Fresh job 0"),                                               # repeats a batch row
+        make_row("other_5", title="Fresh job 7"),                                             # repeats a batch name
+    ]
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.bind.sync_engine, "before_cursor_execute", listener)
+    try:
+        result = await dedupe_rows(db, rows)
+    finally:
+        event.remove(db.bind.sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 4
+    assert len(result.new) == 295
+    assert {rows[i].get("external_id"): job.external_id for i, job in result.existing.items()} == {
+        "dd_1": "dd_1", "other_2": "dd_2", "other_3": "dd_3", "other_4": "dd_4",
+    }
+    assert [rows[i]["external_id"] for i in result.in_batch] == ["new_0", "other_5"]
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import update
+
+from app.crud.job import job as crud_job
+from app.crud.job_facet import job_facet as crud_job_facet
+from app.models.job import Job
+from app.models.job_facet_count import JobFacetCount
+from tests.factories import make_row
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_ingestion(db):
+    rows = await crud_job.bulk_upsert(db, [
+        make_row("a", source_platform="gupy", is_remote=True),
+        make_row("b", source_platform="gupy", is_remote=False),
+        make_row("c", source_platform="gupy", is_remote=True),
+        make_row("d", source_platform="catho", is_remote=True),
+        make_row("e", source_platform="catho", is_remote=False),
+    ])
+    a, b, c, d, e = (r.id for r in rows)
+
+    facets = await crud_job_facet.get(db)
+    assert facets.platforms == [{"name": "gupy", "count": 3}, {"name": "catho", "count": 2}]
+    assert (facets.remote_count, facets.total) == (3, 5)
+
+    # Seen again with a new remote flag, linked as a cross-post, deactivated, deleted
+    await crud_job.bulk_upsert(db, [make_row("b", source_platform="gupy", is_remote=True)])
+    await db.execute(update(Job).where(Job.id == c).values(canonical_job_id=a))
+    await db.execute(update(Job).where(Job.id == e).values(is_active=False))
+    await db.execute(Job.__table__.delete().where(Job.id == d))
+    await db.commit()
+
+    facets = await crud_job_facet.get(db, platform="gupy", remote_only=True)
+    assert facets.platforms == [{"name": "gupy", "count": 2}]
+    assert (facets.remote_count, facets.total) == (2, 2)
+    assert (await crud_job_facet.get(db, platform="catho")).total == 0
+    assert await crud_job_facet.reconcile(db) == {}
+
+    # Drift (e.g. triggers bypassed) is found and corrected
+    await db.execute(update(JobFacetCount).where(JobFacetCount.source_platform == "gupy").values(count=9))
+    await db.commit()
+    assert await crud_job_facet.reconcile(db) == {("gupy", True): (9, 2)}
+    assert (await crud_job_facet.get(db)).total == 2
+
+    await db.execute(Job.__table__.delete())
+    await db.commit()
+    assert (await crud_job_facet.get(db)).platforms == []
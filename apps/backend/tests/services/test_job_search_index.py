@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+
+from app.crud import job_search
+from app.crud.job import job as crud_job
+from app.models.job import Job
+from tests.factories import make_row
+
+
+async def _ids(db, terms):
+    stmt, relevance = job_search.match(select(Job.external_id), "sqlite", terms)
+    return list((await db.execute(stmt.order_by(relevance.desc(), Job.id))).scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_fts5_index_follows_the_jobs_table(db):
+    await crud_job.bulk_upsert(db, [
+        make_row("a", title="Desenvolvedor Python", description="APIs REST"),
+        make_row("b", title="Analista de Dados", description="Automação de relatórios em Python"),
+        make_row("c", title="Designer UX", description="Figma", location="Recife"),
+    ])
+
+    assert await _ids(db, "python") == ["a", "b"]  # title match ranks above description
+    assert await _ids(db, "desenv pyth") == ["a"]  # every word, by prefix
+    assert await _ids(db, "automacao") == ["b"]  # accents folded
+    assert sorted(await _ids(db, ["figma", "analista"])) == ["b", "c"]  # any of the terms
+    assert await _ids(db, "  ?! ") == []
+
+    # Updates and deletes reach the index through the triggers
+    await db.execute(update(Job).where(Job.external_id == "c").values(title="Designer Python"))
+    await db.execute(Job.__table__.delete().where(Job.external_id == "a"))
+    await db.commit()
+    assert await _ids(db, "python") == ["c", "b"]
+    assert await _ids(db, "desenvolvedor") == []
+
+
+def test_postgres_query_uses_the_search_vector():
+    stmt, relevance = job_search.match(select(Job.id), "postgresql", ["python", "node js"])
+    compiled = stmt.order_by(relevance.desc()).compile(dialect=postgresql.dialect())
+    assert "jobs.search_vector @@ websearch_to_tsquery(" in str(compiled)
+    assert "ts_rank_cd(jobs.search_vector" in str(compiled)
+    assert '"python" or "node js"' in compiled.params.values()
+
+
+def test_postgres_query_quotes_user_words():
+    stmt, _ = job_search.match(select(Job.id), "postgresql", "java or -python")
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert '"java" "or" "python"' in compiled.params.values()  # every word required, none an operator
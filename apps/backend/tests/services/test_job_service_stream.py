@@ -0,0 +1,39 @@
+import asyncio
+import pytest
+from sqlalchemy import select
+
+from app.models.job import Job
+from app.services.job_service import JobService
+from app.services.jobsearch.base import BaseScraper
+from tests.factories import make_job
+
+
+class FastScraper(BaseScraper):
+    async def search_jobs(self, query, limit=10):
+        return [make_job(f"fast_{i}", source_platform="fast") for i in range(3)]
+
+
+class SlowStreamingScraper(BaseScraper):
+    async def search_jobs(self, query, limit=10):
+        return await self._collect_stream(query, limit)
+
+    async def search_jobs_stream(self, query, limit=10):
+        yield make_job("slow_0", source_platform="slow")
+        await asyncio.sleep(10)  # never finishes within the test timeout
+        yield make_job("slow_1", source_platform="slow")
+
+
+@pytest.mark.asyncio
+async def test_stream_persists_partial_results_from_slow_scraper(db):
+    service = JobService(db)
+    service.scrapers = [FastScraper(), SlowStreamingScraper()]
+    service.SCRAPER_TIMEOUT = 0.5
+    service.STREAM_FLUSH_SECONDS = 0.05
+
+    saved = await service.search_and_save_jobs("python", limit=10)
+
+    external_ids = {j.external_id for j in saved}
+    assert external_ids == {"fast_0", "fast_1", "fast_2", "slow_0"}
+
+    rows = (await db.execute(select(Job.external_id))).scalars().all()
+    assert set(rows) == external_ids
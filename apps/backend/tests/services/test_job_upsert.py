@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.crud.job import job as crud_job
+from app.models.job import Job
+from tests.factories import make_job, make_row
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_then_refreshes(db):
+    first = await crud_job.bulk_upsert(db, [make_row("up_1"), make_row("up_2")])
+    assert [(u.external_id, u.inserted) for u in first] == [("up_1", True), ("up_2", True)]
+
+    second = await crud_job.bulk_upsert(db, [
+        make_row("up_2", title="Senior Backend Dev"),
+        make_row("up_3"),
+        make_row("up_3", title="Staff Backend Dev"),  # later duplicate wins
+    ])
+    assert [(u.external_id, u.inserted) for u in second] == [("up_2", False), ("up_3", True)]
+    assert second[0].id == first[1].id
+
+    rows = {j.external_id: j for j in await crud_job.get_many(db, [u.id for u in first + second])}
+    await db.refresh(rows["up_2"])
+    assert rows["up_2"].title == "Senior Backend Dev"
+    assert rows["up_3"].title == "Staff Backend Dev"
+    assert rows["up_3"].fingerprint == make_job("up_3", title="Staff Backend Dev").fingerprint
+    assert (await db.execute(select(func.count(Job.id)))).scalar() == 3
@@ -0,0 +1,65 @@
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from app.services.jobsearch import deadline as search_deadline
+from app.services.jobsearch.jobspy_scraper import JobSpyScraper
+from app.services.jobsearch.models import ScrapedJob
+
+
+class SleepyJobSpy(JobSpyScraper):
+    """Each platform takes `delays[platform]` seconds instead of hitting the network."""
+
+    def __init__(self, delays):
+        self.delays = delays
+
+    def _scrape_platform(self, platform, query, limit, location):
+        time.sleep(self.delays.get(platform, 0.2))
+        return [ScrapedJob(
+            title=f"{platform} job", company="Acme", location="Remote", is_remote=True,
+            description="", url=f"https://{platform}.example.com/1",
+            external_id=f"{platform}_1", source_platform=platform,
+        )]
+
+
+def test_frame_conversion_handles_missing_values():
+    df = pd.DataFrame({
+        "title": ["Python Dev", None, "Data Engineer"],
+        "company": ["Acme", "Nobody", float("nan")],
+        "location": ["Remote, Brazil", "São Paulo", "SP"],
+        "is_remote": [None, False, False],
+        "min_amount": [5000.7, float("nan"), None],
+        "max_amount": [8000, None, None],
+        "currency": [None, "USD", "USD"],
+        "description": [float("nan"), "desc", "desc"],
+        "job_url": ["https://indeed.example.com/1", "https://indeed.example.com/2", "https://indeed.example.com/3"],
+        "date_posted": [date(2026, 1, 2), None, None],
+        "job_type": ["fulltime", None, None],
+    })
+
+    jobs = JobSpyScraper._frame_to_jobs(df, "indeed")
+
+    assert len(jobs) == 1  # rows without a title or company are dropped
+    job = jobs[0]
+    assert (job.salary_min, job.salary_max, job.salary_currency) == (5000, 8000, "BRL")
+    assert job.is_remote and job.description == "Python Dev"
+    assert job.posted_at.year == 2026 and job.employment_type == "fulltime"
+
+
+@pytest.mark.asyncio
+async def test_platforms_are_scraped_concurrently():
+    scraper = SleepyJobSpy({})
+    started = time.monotonic()
+    jobs = await scraper.search_jobs("python", limit=5)
+    assert time.monotonic() - started < 0.2 * len(JobSpyScraper.PLATFORMS) / 2
+    assert {j.source_platform for j in jobs} == set(JobSpyScraper.PLATFORMS)
+
+
+@pytest.mark.asyncio
+async def test_deadline_keeps_finished_platforms():
+    scraper = SleepyJobSpy({"indeed": 0.05, "linkedin": 1.0, "glassdoor": 1.0, "google": 1.0, "zip_recruiter": 1.0})
+    with search_deadline.deadline_scope(0.5):
+        jobs = await scraper.search_jobs("python", limit=5)
+    assert [j.source_platform for j in jobs] == ["indeed"]
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.core import minhash
+from app.crud.job import job as crud_job
+from app.models.job import Job
+from app.models.job_lsh_bucket import JobLshBucket
+from app.services.jobsearch.near_dup import link_near_duplicates
+from tests.factories import make_row
+
+DESCRIPTION = (
+    "Buscamos pessoa desenvolvedora backend para atuar com Python, FastAPI, PostgreSQL e AWS. "
+    "Requisitos: 3 anos de experiencia com APIs REST e testes automatizados. "
+    "Beneficios: vale refeicao, plano de saude e trabalho remoto."
+)
+
+
+def test_signatures_estimate_similarity():
+    a = minhash.signature(minhash.job_text("Desenvolvedor Backend Python", "Acme", DESCRIPTION))
+    b = minhash.signature(minhash.job_text("Desenvolvedor(a) Back-end Python", "ACME Ltda.", DESCRIPTION + " Envie seu CV."))
+    c = minhash.signature(minhash.job_text("Designer UX", "Globex", "Prototipos no Figma e pesquisa com usuarios."))
+    assert minhash.similarity(a, b) >= 0.7 > minhash.similarity(a, c)
+    assert set(minhash.band_buckets(a)) & set(minhash.band_buckets(b))
+    assert not set(minhash.band_buckets(a)) & set(minhash.band_buckets(c))
+    assert (minhash.from_bytes(minhash.to_bytes(a)) == a).all()
+
+
+@pytest.mark.asyncio
+async def test_cross_posts_link_to_the_oldest_copy(db):
+    first = await crud_job.bulk_upsert(db, [
+        make_row("gupy", title="Desenvolvedor Backend Python", company="Acme", description=DESCRIPTION),
+    ])
+    assert await link_near_duplicates(db, [u.id for u in first]) == {}
+
+    batch = await crud_job.bulk_upsert(db, [
+        make_row("catho", title="Desenvolvedor(a) Back-end Python", company="ACME Ltda.",
+                 description=DESCRIPTION + " Envie seu CV."),
+        make_row("vagas", title="Desenvolvedor Backend Python Pleno", company="Acme Tecnologia", description=DESCRIPTION),
+        make_row("linkedin", title="Designer UX", company="Globex", description="Prototipos no Figma e pesquisa com usuarios."),
+    ])
+    links = await link_near_duplicates(db, [u.id for u in batch])
+    assert links == {batch[0].id: first[0].id, batch[1].id: first[0].id}
+
+    canonical = (await db.execute(select(Job.external_id).where(Job.canonical_job_id.is_(None)))).scalars().all()
+    assert sorted(canonical) == ["gupy", "linkedin"]
+    job_ids = [u.id for u in first + batch]
+    bucket_count = select(func.count(JobLshBucket.id)).where(JobLshBucket.job_id.in_(job_ids))
+    assert (await db.execute(bucket_count)).scalar() == 4 * minhash.BANDS
@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+
+from app.services.job_service import JobService, _STREAM_DONE
+from app.services.jobsearch.base import BaseScraper
+from app.services.jobsearch.coalescer import SearchCoalescer
+from app.services.jobsearch.health import BreakerState, ScraperHealth, scraper_health
+from tests.factories import make_job
+
+
+async def failing_call(health: ScraperHealth):
+    with pytest.raises(RuntimeError):
+        async with health.track():
+            raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_probes_and_closes():
+    health = ScraperHealth("Flaky", window=10, failure_rate=0.5, min_calls=4, open_seconds=0.05)
+    for _ in range(4):
+        assert health.allow()
+        await failing_call(health)
+
+    assert health.state == BreakerState.OPEN
+    assert not health.allow()
+
+    await asyncio.sleep(0.06)
+    assert health.allow()       # the probe
+    assert not health.allow()   # only one probe at a time
+    await failing_call(health)
+    assert health.state == BreakerState.OPEN
+    assert health.open_seconds == pytest.approx(0.1)  # backed off
+
+    await asyncio.sleep(0.11)
+    assert health.allow()
+    async with health.track() as call:
+        call.results = 3
+    assert health.state == BreakerState.CLOSED
+    assert health.snapshot()["p95_seconds"] is not None
+
+
+@pytest.mark.asyncio
+async def test_empty_result_after_fetch_errors_counts_as_failure():
+    health = ScraperHealth("Quiet", min_calls=1, failure_rate=1.0)
+    async with health.track():
+        health.record_fetch_error()  # what BaseScraper.fetch does when it gives up
+    assert health.failures == 1
+    assert health.state == BreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_are_charged_to_their_own_call():
+    health = ScraperHealth("Shared", min_calls=10)
+    failed = asyncio.Event()
+
+    async def erroring():
+        async with health.track():
+            health.record_fetch_error()
+            failed.set()
+
+    async def empty_but_fine():
+        async with health.track():
+            await failed.wait()  # a concurrent search's error must not fail this one
+
+    await asyncio.gather(erroring(), empty_but_fine())
+    assert (health.calls, health.failures, health.fetch_errors) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_results_are_not_recorded():
+    coalescer = SearchCoalescer()
+    health = ScraperHealth("Coalesced")
+    release = asyncio.Event()
+
+    async def slow_search():
+        await release.wait()
+        yield make_job("c_1")
+
+    async def search():
+        async with health.track() as call:
+            call.results = len(await coalescer.collect("k", call.source(slow_search), 10))
+
+    leader = asyncio.create_task(search())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(search())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(leader, follower)
+    await search()  # memo hit
+
+    assert coalescer.coalesced == 1
+    assert health.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_recorded():
+    health = ScraperHealth("Slow")
+    with pytest.raises(TimeoutError):
+        async with health.track():
+            async with asyncio.timeout(0.01):
+                await asyncio.sleep(1)
+    assert health.timeouts == 1
+
+
+class NeverCalledScraper(BaseScraper):
+    async def search_jobs(self, query, limit=10):
+        raise AssertionError("open circuit must be skipped")
+
+
+@pytest.mark.asyncio
+async def test_job_service_skips_open_circuit():
+    health = scraper_health.get("NeverCalledScraper")
+    health.state = BreakerState.OPEN
+    health.opened_at = 10 ** 12  # far future: stays open
+
+    queue: asyncio.Queue = asyncio.Queue()
+    await JobService(db=None)._stream_scraper_safe(NeverCalledScraper(), "python", 10, queue)
+
+    assert queue.get_nowait() is _STREAM_DONE
+    assert health.skipped == 1
+    scraper_health.reset()
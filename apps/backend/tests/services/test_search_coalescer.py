@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+
+from app.services.jobsearch.coalescer import MemoryCoalesceStore, SearchCoalescer
+from tests.factories import make_job
+
+
+class CountingSource:
+    def __init__(self, count: int = 3, delay: float = 0.05):
+        self.runs = 0
+        self.count = count
+        self.delay = delay
+
+    async def __call__(self):
+        self.runs += 1
+        for i in range(self.count):
+            await asyncio.sleep(self.delay)
+            yield make_job(f"acme_{i}")
+
+
+def test_key_normalizes_query():
+    assert SearchCoalescer.make_key("Gupy", "  Python   DEV ", 30) == SearchCoalescer.make_key("Gupy", "python dev", 30)
+    assert SearchCoalescer.make_key("Gupy", "python", 30) != SearchCoalescer.make_key("Gupy", "python", 40)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_run():
+    coalescer = SearchCoalescer(memo_ttl=60)
+    source = CountingSource()
+    key = coalescer.make_key("Acme", "python", 10)
+
+    results = await asyncio.gather(*(coalescer.collect(key, source, 10) for _ in range(5)))
+
+    assert source.runs == 1
+    assert all([j.external_id for j in r] == ["acme_0", "acme_1", "acme_2"] for r in results)
+    # followers get copies, not the leader's objects
+    assert results[1][0] is not results[0][0]
+
+    # memoized for later callers
+    await coalescer.collect(key, source, 10)
+    assert source.runs == 1
+
+
+
+@pytest.mark.asyncio
+async def test_leader_scoring_does_not_leak_into_the_memo():
+    coalescer = SearchCoalescer(memo_ttl=60)
+    key = coalescer.make_key("Acme", "python", 10)
+
+    for job in await coalescer.collect(key, CountingSource(delay=0), 10):
+        job.compatibility_score = 99.0  # as JobService does for the leader's user
+
+    assert all(j.compatibility_score is None for j in await coalescer.collect(key, CountingSource(), 10))
+
+@pytest.mark.asyncio
+async def test_memo_expires():
+    coalescer = SearchCoalescer(memo_ttl=0.01)
+    source = CountingSource(delay=0)
+    key = coalescer.make_key("Acme", "python", 10)
+
+    await coalescer.collect(key, source, 10)
+    await asyncio.sleep(0.02)
+    await coalescer.collect(key, source, 10)
+    assert source.runs == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_store_coalesces_across_workers():
+    store = MemoryCoalesceStore()
+    worker_a = SearchCoalescer(memo_ttl=60, store=store)
+    worker_b = SearchCoalescer(memo_ttl=60, store=store)
+    worker_b.POLL_INTERVAL = 0.01
+    source_a, source_b = CountingSource(), CountingSource()
+    key = worker_a.make_key("Acme", "python", 10)
+
+    a, b = await asyncio.gather(
+        worker_a.collect(key, source_a, 10),
+        worker_b.collect(key, source_b, 10),
+    )
+
+    assert (source_a.runs, source_b.runs) == (1, 0)
+    assert [j.external_id for j in b] == [j.external_id for j in a]
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.job_service import JobService
+from app.services.jobsearch import deadline as search_deadline
+from app.services.jobsearch.base import BaseScraper
+from app.services.jobsearch.health import scraper_health
+from tests.factories import make_job
+
+PAGE_URL = "https://portal.api.gupy.io/deadline-test"
+
+
+class SlowClient:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def request(self, method, url, params=None, json=None, headers=None, timeout=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return httpx.Response(200, json={}, request=httpx.Request("GET", url))
+
+
+class PagingScraper(BaseScraper):
+    """Non-streaming scraper: keeps what it has when a page fetch fails."""
+    CACHE_TTL = None
+
+    async def search_jobs(self, query, limit=10):
+        jobs = []
+        for page in range(limit):
+            try:
+                await self.fetch(PAGE_URL, params={"page": page})
+            except Exception:
+                break
+            jobs.append(make_job(f"paging_{page}", source_platform="paging"))
+        return jobs
+
+
+def test_scopes_only_tighten():
+    assert search_deadline.remaining() is None
+    with search_deadline.deadline_scope(10):
+        with search_deadline.deadline_scope(60):
+            assert search_deadline.remaining() <= 10
+    assert search_deadline.remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_refuses_after_deadline(monkeypatch):
+    client = SlowClient(0)
+    monkeypatch.setattr("app.services.jobsearch.base.http_client_pool.get_client", lambda url, proxy=None: client)
+
+    with search_deadline.deadline_scope(0):
+        with pytest.raises(search_deadline.DeadlineExceeded):
+            await PagingScraper().fetch(PAGE_URL)
+    assert client.calls == 0
+    assert scraper_health.get("PagingScraper").fetch_errors == 0
+
+
+@pytest.mark.asyncio
+async def test_search_returns_partial_results_at_deadline(db, monkeypatch):
+    client = SlowClient(0.3)
+    monkeypatch.setattr("app.services.jobsearch.base.http_client_pool.get_client", lambda url, proxy=None: client)
+
+    service = JobService(db)
+    service.scrapers = [PagingScraper()]
+    service.STREAM_FLUSH_SECONDS = 0.05
+    service.DEADLINE_PERSIST_RESERVE = 0.5
+
+    started = time.monotonic()
+    saved = await service.search_and_save_jobs("deadline", limit=10, deadline_seconds=1.5)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2.0
+    assert 1 <= len(saved) < 10  # stopped early, but kept what was parsed
+    assert all(j.external_id.startswith("paging_") for j in saved)
+    assert scraper_health.get("PagingScraper").failures == 0
+    scraper_health.reset()
@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import select
+
+from app.crud.job import job as crud_job
+from app.crud.user_job import user_job as crud_user_job
+from app.models.user import User
+from app.models.user_job import UserJob
+from tests.factories import make_row
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_scores_inserts_and_updates(db):
+    user = User(email="scores@example.com", username="scores", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    user_id = user.id
+    upserted = await crud_job.bulk_upsert(db, [make_row(f"score_{i}") for i in range(3)])
+    job_ids = [u.id for u in upserted]
+
+    assert await crud_user_job.bulk_upsert_scores(db, user_id, {job_ids[0]: 40.0, job_ids[1]: 55.0}) == 2
+    await crud_user_job.update_status(db, user_id=user_id, job_id=job_ids[0], status="applied")
+    await crud_user_job.bulk_upsert_scores(db, user_id, {job_ids[0]: 90.0, job_ids[2]: 10.0})
+
+    rows = (await db.execute(select(UserJob).where(UserJob.user_id == user_id).execution_options(populate_existing=True))).scalars().all()
+    assert {r.job_id: (r.compatibility_score, r.status) for r in rows} == {
+        job_ids[0]: (90.0, "applied"), job_ids[1]: (55.0, "new"), job_ids[2]: (10.0, "new"),
+    }
+    top = await crud_user_job.get_top_by_user(db, user_id, limit=2)
+    assert [r.job_id for r in top] == [job_ids[0], job_ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_scraped_score_stays_out_of_the_shared_jobs_row(db):
+    row = make_row("score_private", compatibility_score=87.0)
+    assert "compatibility_score" not in row
+    [upserted] = await crud_job.bulk_upsert(db, [row])
+    assert (await crud_job.get(db, upserted.id)).compatibility_score is None
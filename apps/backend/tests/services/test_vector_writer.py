@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.vector_writer import VectorWriter
+
+
+class FakeStore:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+
+    def upsert_vectors(self, namespace, items):
+        time.sleep(0.02)  # blocking network round-trip, as in the real client
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("503 from the vector store")
+        self.calls.append((namespace, [item_id for item_id, _, _ in items]))
+
+
+@pytest.mark.asyncio
+async def test_full_batches_flush_in_the_background():
+    store = FakeStore()
+    writer = VectorWriter(store, max_batch=100, flush_seconds=10)
+
+    started = time.perf_counter()
+    for i in range(250):
+        writer.enqueue_job(i, [0.1, 0.2], {"title": f"job {i}"})
+    writer.enqueue_resume(1, [0.3, 0.4])
+    assert time.perf_counter() - started < 0.02  # producers never wait on the store
+
+    await asyncio.sleep(0.2)
+    # A full batch woke the writer long before the 10 s timer; it then sent everything queued
+    assert [(ns, len(ids)) for ns, ids in store.calls] == [("jobs", 100), ("jobs", 100), ("jobs", 50), ("resumes", 1)]
+    assert writer.stats()["queue_depth"] == 0
+
+    await writer.stop()
+    stats = writer.stats()
+    assert stats["written"] == 251 and stats["batches"] == 4
+    assert stats["queue_depth"] == 0 and not stats["running"]
+    assert stats["flush_p50_ms"] >= 20
+
+
+@pytest.mark.asyncio
+async def test_timer_flushes_a_partial_batch():
+    store = FakeStore()
+    writer = VectorWriter(store, max_batch=100, flush_seconds=0.05)
+    writer.enqueue_job(7, [1.0])
+    writer.enqueue_job(7, [2.0])  # replaces the queued vector
+    await asyncio.sleep(0.2)
+    assert store.calls == [("jobs", [7])]
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_retried_then_dropped():
+    store = FakeStore(failures=2)
+    writer = VectorWriter(store, max_batch=10, flush_seconds=0.02, retry_base_seconds=0.05)
+    for i in range(5):
+        writer.enqueue_job(i, [1.0])
+    await asyncio.sleep(0.4)
+    assert store.calls == [("jobs", [0, 1, 2, 3, 4])]
+    assert writer.stats()["failed_batches"] == 2
+    assert writer.stats()["dropped"] == 0
+
+    store.failures = 10
+    writer.max_retries = 2
+    writer.enqueue_job(9, [1.0])
+    await asyncio.sleep(0.4)
+    await writer.stop()
+    assert writer.stats()["dropped"] == 1
+    assert writer.stats()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unconfigured_store_drops_instead_of_writing():
+    store = FakeStore()
+    store.is_configured = False  # e.g. Pinecone without an index
+    writer = VectorWriter(store, max_batch=10, flush_seconds=10)
+    for i in range(3):
+        writer.enqueue_job(i, [1.0])
+    await writer.stop()
+    assert store.calls == []
+    stats = writer.stats()
+    assert stats["written"] == 0 and stats["dropped"] == 3 and stats["queue_depth"] == 0
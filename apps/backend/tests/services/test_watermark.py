@@ -0,0 +1,91 @@
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.crud.job import job as crud_job
+from app.models.scraper_watermark import ScraperWatermark
+from app.services.job_service import JobService
+from app.services.jobsearch.coalescer import search_coalescer
+from app.services.jobsearch.gupy import GupyScraper
+from app.services.jobsearch.watermark import Watermark, watermark_scope
+from tests.factories import make_job
+
+
+class PagedGupy(GupyScraper):
+    """Gupy with a canned, newest-first listing instead of the network."""
+    PAGE_SIZE = 2
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.fetches = 0
+
+    async def fetch(self, url, *, params=None, **kwargs):
+        self.fetches += 1
+        offset, size = params["offset"], params["limit"]
+        data = [{"id": i, "name": f"Job {i}", "careerPageName": "Acme"} for i in self.ids[offset:offset + size]]
+        return httpx.Response(200, json={"data": data}, request=httpx.Request("GET", url))
+
+
+def test_watermark_tracks_newest_ids():
+    mark = Watermark("GupyScraper", "  Python ", recent_ids=["gupy_1"], max_ids=3)
+    assert mark.query == "python"
+    assert mark.is_known(make_job("gupy_1"))
+
+    for i in (5, 4, 3, 2):
+        mark.observe(make_job(f"gupy_{i}"))
+    assert not mark.changed  # observed, but nothing stored yet
+    mark.confirm({"gupy_4", "gupy_3", "gupy_2"})  # gupy_5 was not stored
+    assert mark.changed
+    assert mark.to_values()["recent_ids"] == '["gupy_4", "gupy_3", "gupy_2"]'
+
+
+@pytest.mark.asyncio
+async def test_paging_stops_at_known_items():
+    scraper = PagedGupy(ids=[9, 8, 7, 6, 5, 4, 3, 2])
+    mark = Watermark("PagedGupy", "python", recent_ids=[f"gupy_{i}" for i in (6, 5, 4, 3, 2)])
+
+    with watermark_scope(mark):
+        jobs = await scraper.search_jobs("python", limit=8)
+
+    # pages: [9, 8] new, [7, 6] partially new, [5, 4] all known -> stop
+    assert [j.external_id for j in jobs] == ["gupy_9", "gupy_8", "gupy_7"]
+    assert scraper.fetches == 3
+
+
+@pytest.mark.asyncio
+async def test_incremental_search_passes_only_new_jobs(db):
+    service = JobService(db)
+    service.STREAM_FLUSH_SECONDS = 0.05
+
+    service.scrapers = [PagedGupy(ids=[3, 2, 1])]
+    first = await service.search_and_save_jobs("watermark test", limit=3, incremental=True)
+    assert {j.external_id for j in first} == {"gupy_3", "gupy_2", "gupy_1"}
+
+    search_coalescer.clear()
+    service.scrapers = [PagedGupy(ids=[5, 4, 3, 2, 1])]
+    second = await service.search_and_save_jobs("watermark test", limit=5, incremental=True)
+    assert {j.external_id for j in second} == {"gupy_5", "gupy_4"}
+
+    row = (await db.execute(select(ScraperWatermark))).scalars().one()
+    assert (row.source, row.query) == ("PagedGupy", "watermark test")
+    search_coalescer.clear()
+
+
+@pytest.mark.asyncio
+async def test_jobs_whose_write_failed_come_back(db, monkeypatch):
+    service = JobService(db)
+    service.STREAM_FLUSH_SECONDS = 0.05
+
+    async def failing_upsert(db, rows):
+        raise RuntimeError("database unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(crud_job, "bulk_upsert", failing_upsert)
+        service.scrapers = [PagedGupy(ids=[2, 1])]
+        assert await service.search_and_save_jobs("watermark failure", limit=2, incremental=True) == []
+
+    search_coalescer.clear()
+    service.scrapers = [PagedGupy(ids=[2, 1])]
+    again = await service.search_and_save_jobs("watermark failure", limit=2, incremental=True)
+    assert {j.external_id for j in again} == {"gupy_2", "gupy_1"}
+    search_coalescer.clear()
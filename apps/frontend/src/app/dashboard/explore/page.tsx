@@ -61,6 +61,7 @@ interface ExploreResponse {
     offset: number;
     limit: number;
     has_more: boolean;
+    next_cursor: string | null;
     platforms: PlatformInfo[];
     remote_count: number;
 }
@@ -72,7 +73,7 @@ export default function ExplorePage() {
     const [selectedPlatform, setSelectedPlatform] = useState<string | null>(null);
     const [remoteOnly, setRemoteOnly] = useState(false);
     const [allJobs, setAllJobs] = useState<ExploreJob[]>([]);
-    const [offset, setOffset] = useState(0);
+    const [cursor, setCursor] = useState<string | null>(null);
     const [resetFlag, setResetFlag] = useState(0);
     const LIMIT = 30;
 
@@ -83,7 +84,7 @@ export default function ExplorePage() {
         const timer = setTimeout(() => {
             setDebouncedSearch(prev => {
                 if (prev !== searchText) {
-                    setOffset(0);
+                    setCursor(null);
                     setResetFlag(f => f + 1);
                 }
                 return searchText;
@@ -94,19 +95,19 @@ export default function ExplorePage() {
 
     // Reset when filters change
     useEffect(() => {
-        setOffset(0);
+        setCursor(null);
         setResetFlag(f => f + 1);
     }, [selectedPlatform, remoteOnly]);
 
     const { data, isLoading, isFetching } = useQuery<ExploreResponse>({
-        queryKey: ['explore-jobs', debouncedSearch, selectedPlatform, remoteOnly, offset],
+        queryKey: ['explore-jobs', debouncedSearch, selectedPlatform, remoteOnly, cursor],
         queryFn: async () => {
             const params = new URLSearchParams();
             if (debouncedSearch) params.set('q', debouncedSearch);
             if (selectedPlatform) params.set('platform', selectedPlatform);
             if (remoteOnly) params.set('remote_only', 'true');
             params.set('limit', LIMIT.toString());
-            params.set('offset', offset.toString());
+            if (cursor) params.set('cursor', cursor);
             const res = await api.get(`/jobs/explore?${params.toString()}`);
             return res.data;
         },
@@ -117,22 +118,22 @@ export default function ExplorePage() {
     useEffect(() => {
         if (data?.jobs && data.jobs.length > 0) {
             setAllJobs(prev => {
-                if (offset === 0) return data.jobs;
+                if (cursor === null) return data.jobs;
                 const existingIds = new Set(prev.map(j => j.id));
                 const newJobs = data.jobs.filter(j => !existingIds.has(j.id));
                 return [...prev, ...newJobs];
             });
-        } else if (data?.jobs && data.jobs.length === 0 && offset === 0) {
+        } else if (data?.jobs && data.jobs.length === 0 && cursor === null) {
             setAllJobs([]);
         }
-    }, [data, offset, resetFlag]);
+    }, [data, cursor, resetFlag]);
 
     // Load more on scroll
     useEffect(() => {
-        if (inView && data?.has_more && !isFetching) {
-            setOffset(prev => prev + LIMIT);
+        if (inView && data?.next_cursor && !isFetching) {
+            setCursor(data.next_cursor);
         }
-    }, [inView, data?.has_more, isFetching]);
+    }, [inView, data?.next_cursor, isFetching]);
 
     const formatSalary = (job: ExploreJob) => {
         if (!job.salary_min && !job.salary_max) return null;
@@ -260,7 +261,7 @@ export default function ExplorePage() {
                 </div>
 
                 {/* Results */}
-                {isLoading && offset === 0 ? (
+                {isLoading && cursor === null ? (
                     <div className="flex justify-center py-20">
                         <Loader2 className="h-10 w-10 animate-spin text-blue-500" />
                     </div>
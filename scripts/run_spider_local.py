@@ -49,6 +49,7 @@ QUERIES = [
 
 LIMIT_PER_SCRAPER = 50
 CONCURRENCY = 5
+BATCH_SIZE = 50  # jobs per ingestion micro-batch
 PAUSE_BETWEEN_CYCLES_SECONDS = 300  # 5 minutes between cycles
 
 
@@ -87,14 +88,34 @@ def _build_scrapers():
     return scrapers
 
 
-async def run_single_scraper(scraper, query, limit):
-    """Run a single scraper with timeout."""
+async def run_single_scraper(scraper, query, limit, watermark=None):
+    """Run a single scraper with timeout; with a watermark, return only jobs not seen before."""
+    from app.services.jobsearch.health import scraper_health
+    from app.services.jobsearch.watermark import watermark_scope
+
     name = type(scraper).__name__
+    health = scraper_health.get(name)
+    if not health.allow():
+        logger.info(f"⏸️  {name}: circuit open, skipping '{query}'")
+        return []
     try:
-        results = await asyncio.wait_for(
-            scraper.search_jobs(query, limit=limit),
-            timeout=120.0,
-        )
+        async with health.track() as call:
+            # Paginated scrapers read the watermark to stop at known items
+            with watermark_scope(watermark):
+                results = await asyncio.wait_for(
+                    scraper.search_jobs(query, limit=limit),
+                    timeout=120.0,
+                )
+            call.results = len(results)
+        if watermark is not None:
+            fresh = []
+            for job in results:
+                if watermark.is_known(job):
+                    watermark.skipped += 1
+                    continue
+                watermark.observe(job)
+                fresh.append(job)
+            results = fresh
         return results
     except asyncio.TimeoutError:
         logger.error(f"⏰ {name}: TIMEOUT for '{query}'")
@@ -104,77 +125,25 @@ async def run_single_scraper(scraper, query, limit):
         return []
 
 
-async def save_jobs_to_db(db_session, scraped_jobs):
-    """Save scraped jobs directly to the local database with robust deduplication."""
-    from app.models.job import Job
-    from sqlalchemy import select
-    from sqlalchemy.exc import IntegrityError
+def _prepare_row(scraped_job, row):
+    """Local DB rows: capped description, posted_date defaults to now."""
+    row["description"] = scraped_job.description[:5000] if scraped_job.description else ""
+    row["posted_date"] = scraped_job.posted_at or datetime.now(timezone.utc)
+    return row
 
-    inserted = 0
-    duplicates = 0
-    
-    # Pre-filter duplicates within the same batch using a set
-    seen_ids = set()
-    unique_jobs = []
-    for sj in scraped_jobs:
-        key = f"{sj.external_id}|{sj.url}"
-        if key not in seen_ids:
-            seen_ids.add(key)
-            unique_jobs.append(sj)
-        else:
-            duplicates += 1
-
-    for sj in unique_jobs:
-        try:
-            # Check for existing by external_id
-            stmt = select(Job.id).where(Job.external_id == sj.external_id)
-            result = await db_session.execute(stmt)
-            if result.scalar():
-                duplicates += 1
-                continue
 
-            # Also check by URL
-            stmt_url = select(Job.id).where(Job.source_url == sj.url)
-            result_url = await db_session.execute(stmt_url)
-            if result_url.scalar():
-                duplicates += 1
-                continue
+async def ingest_jobs(db_session, batches, name="spider_local"):
+    """
+    Run scraped batches through the staged ingestion pipeline (normalize, dedup,
+    persist, embed, index). Returns (scraped, inserted, duplicates, external_ids
+    of the stored jobs).
+    """
+    from app.services.jobsearch.pipeline import JobIngestion
 
-            new_job = Job(
-                external_id=sj.external_id,
-                title=sj.title,
-                company=sj.company,
-                description=sj.description[:5000] if sj.description else "",
-                location=sj.location,
-                is_remote=sj.is_remote,
-                salary_min=sj.salary_min,
-                salary_max=sj.salary_max,
-                salary_currency=sj.salary_currency,
-                source_platform=sj.source_platform,
-                source_url=sj.url,
-                posted_date=sj.posted_at or datetime.now(timezone.utc),
-            )
-            
-            # Use savepoint so IntegrityError only rolls back this one insert
-            try:
-                async with db_session.begin_nested():
-                    db_session.add(new_job)
-                inserted += 1
-            except IntegrityError:
-                duplicates += 1
-                continue
-
-        except Exception as e:
-            logger.warning(f"⚠️  Error saving job '{sj.title}': {e}")
-
-    # Final commit for all successful inserts
-    try:
-        await db_session.commit()
-    except Exception as e:
-        logger.error(f"❌ Final commit error: {e}")
-        await db_session.rollback()
-
-    return inserted, duplicates
+    ingestion = JobIngestion(db_session, name=name, prepare_row=_prepare_row)
+    jobs = await ingestion.run(batches)
+    ingestion.log_summary()
+    return ingestion.scraped, ingestion.inserted, ingestion.duplicates, {job.external_id for job in jobs}
 
 
 async def run_spider_cycle(scrapers, db_session, queries, cycle_num):
@@ -188,30 +157,46 @@ async def run_spider_cycle(scrapers, db_session, queries, cycle_num):
     logger.info(f"🕷️  CYCLE {cycle_num} STARTING - {len(queries)} queries × {len(scrapers)} scrapers")
     logger.info(f"{'═' * 70}")
 
+    from app.services.jobsearch.watermark import load_watermarks, save_watermarks
+
     for query in queries:
         logger.info(f"\n📌 Query: '{query}'")
+        watermarks = await load_watermarks(db_session, query, scrapers)
 
         async def scrape_with_sem(s, q):
             async with semaphore:
-                return await run_single_scraper(s, q, LIMIT_PER_SCRAPER)
+                return await run_single_scraper(s, q, LIMIT_PER_SCRAPER, watermarks[type(s).__name__])
 
-        tasks = [scrape_with_sem(s, query) for s in scrapers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_jobs = []
-        for i, result in enumerate(results):
-            if isinstance(result, list):
-                all_jobs.extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"❌ {type(scrapers[i]).__name__}: {result}")
-
-        total_scraped += len(all_jobs)
-
-        if all_jobs:
-            inserted, dups = await save_jobs_to_db(db_session, all_jobs)
-            total_inserted += inserted
-            total_duplicates += dups
-            logger.info(f"   ✅ '{query}': {len(all_jobs)} scraped, {inserted} new, {dups} duplicates")
+        async def scraped_batches():
+            # Each scraper's results enter the pipeline as soon as it finishes
+            tasks = [asyncio.create_task(scrape_with_sem(s, query)) for s in scrapers]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        jobs = await next_done
+                    except Exception as e:
+                        logger.error(f"❌ Scraper failed for '{query}': {e}")
+                        continue
+                    for start in range(0, len(jobs), BATCH_SIZE):
+                        yield jobs[start:start + BATCH_SIZE]
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        scraped, inserted, dups, stored_ids = await ingest_jobs(db_session, scraped_batches())
+        total_scraped += scraped
+        total_inserted += inserted
+        total_duplicates += dups
+        known = sum(w.skipped for w in watermarks.values())
+
+        if scraped:
+            logger.info(f"   ✅ '{query}': {scraped} scraped, {inserted} new, {dups} duplicates, {known} known (watermark)")
+        elif known:
+            logger.info(f"   💤 '{query}': nothing new ({known} known via watermark)")
+        # Only jobs that were stored become known; the rest come back next cycle
+        for watermark in watermarks.values():
+            watermark.confirm(stored_ids)
+        await save_watermarks(db_session, watermarks.values())
 
     return total_scraped, total_inserted, total_duplicates
 
@@ -302,6 +287,13 @@ async def main():
         logger.info(f"💤 Sleeping {PAUSE_BETWEEN_CYCLES_SECONDS}s before next cycle...")
         await asyncio.sleep(PAUSE_BETWEEN_CYCLES_SECONDS)
 
+    # Release pooled scraper connections
+    from app.infrastructure.http.client_pool import http_client_pool
+    await http_client_pool.aclose()
+    # Send the job vectors still queued for the vector store
+    from app.services.vector_writer import vector_writer
+    await vector_writer.stop()
+
     # Final report
     async with AsyncSessionLocal() as session:
         final_count = await count_total_jobs(session)